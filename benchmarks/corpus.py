@@ -0,0 +1,130 @@
+"""Generator corpus sintetis media sosial berbahasa Indonesia yang *reproducible* (seeded).
+
+Setiap kata pada teks dipilih secara acak berdasarkan densitas masing - masing jenis token:
+*slang words* (`SLANG_DATA`), stopwords (`STOPWORDS`), emoji (`EMOJI_DATA`), URL, fragmen HTML,
+dan *word elongation*. Sisanya diisi dengan kata - kata umum.
+
+Usage:
+    python benchmarks/corpus.py [--texts 10] [--seed 42] [--slang 0.2] ...
+"""
+
+import argparse
+import random
+import re
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List
+
+from indoNLP.preprocessing import EMOJI_DATA, SLANG_DATA, STOPWORDS
+
+FILLER = [
+    "makan", "rumah", "pergi", "kemana", "besok", "banget", "kerja", "kuliah", "jalan", "macet",
+    "hujan", "kopi", "nonton", "film", "lagu", "pulang", "kantor", "teman", "senang", "sedih",
+    "murah", "mahal", "bagus", "jelek", "2022", "jakarta", "bandung", "presiden", "harga", "pasar",
+]  # fmt: skip
+DOMAINS = ["google.com", "detik.com", "kompas.id", "twitter.com", "t.co", "youtu.be", "ui.ac.id"]
+TAGS = ["b", "i", "p", "a href='#'", "span class='x'"]
+ENTITIES = ["&amp;", "&quot;", "&#39;", "&nbsp;"]
+PUNCT = [" ", " ", " ", " ", ", ", "! ", "? ", ". ", "!!! ", "... "]
+
+
+@dataclass
+class CorpusConfig:
+    """Konfigurasi corpus, densitas adalah peluang sebuah kata berupa jenis token tersebut."""
+
+    texts: int = 2000
+    seed: int = 42
+    min_words: int = 5
+    max_words: int = 40
+    slang: float = 0.2
+    stopwords: float = 0.2
+    emoji: float = 0.05
+    url: float = 0.02
+    html: float = 0.05
+    elongation: float = 0.05
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+def _url(rng: random.Random) -> str:
+    path = "/".join(rng.choice(FILLER) for _ in range(rng.randint(0, 3)))
+    scheme = rng.choice(["https://", "http://", "https://www.", ""])
+    return f"{scheme}{rng.choice(DOMAINS)}/{path}".rstrip("/")
+
+
+def _html(rng: random.Random) -> str:
+    if rng.random() < 0.2:
+        return rng.choice(ENTITIES)
+    tag = rng.choice(TAGS)
+    return f"<{tag}>{rng.choice(FILLER)}</{tag.split()[0]}>"
+
+
+def _elongation(rng: random.Random) -> str:
+    word = rng.choice(FILLER + ["kenapa", "iya", "wkwk", "mantap", "asik"])
+    return word + word[-1] * rng.randint(2, 6)
+
+
+def generate_corpus(config: CorpusConfig) -> List[str]:
+    """Membuat corpus sesuai dengan konfigurasi, seed yang sama menghasilkan corpus yang sama."""
+    rng = random.Random(config.seed)
+    slang = sorted(k for k in SLANG_DATA if re.fullmatch(r"\w+", k))
+    stopwords = sorted(x for x in STOPWORDS if re.fullmatch(r"\w+", x))
+    emojis = sorted(EMOJI_DATA)
+    generators: List[Callable[[], str]] = [
+        lambda: rng.choice(slang),
+        lambda: rng.choice(stopwords),
+        lambda: rng.choice(emojis),
+        lambda: _url(rng),
+        lambda: _html(rng),
+        lambda: _elongation(rng),
+    ]
+    densities = [
+        config.slang,
+        config.stopwords,
+        config.emoji,
+        config.url,
+        config.html,
+        config.elongation,
+    ]
+    assert sum(densities) <= 1, "Total densitas tidak boleh lebih dari 1"
+
+    corpus = []
+    for _ in range(config.texts):
+        words = []
+        for _ in range(rng.randint(config.min_words, config.max_words)):
+            value = rng.random()
+            for density, generate in zip(densities, generators):
+                if value < density:
+                    word = generate()
+                    break
+                value -= density
+            else:
+                word = rng.choice(FILLER)
+            if rng.random() < 0.1:
+                word = word.capitalize()
+            words.append(word + rng.choice(PUNCT))
+        corpus.append("".join(words).strip())
+    return corpus
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Menambahkan argument konfigurasi corpus pada argument parser."""
+    for name, value in CorpusConfig().as_dict().items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+
+
+def config_from_args(args: argparse.Namespace) -> CorpusConfig:
+    """Membuat konfigurasi corpus dari hasil parsing argument."""
+    return CorpusConfig(**{k: getattr(args, k) for k in CorpusConfig().as_dict()})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.set_defaults(texts=10)
+    for text in generate_corpus(config_from_args(parser.parse_args())):
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark pencocokan *fuzzy* *slang words* : `difflib.get_close_matches` vs `FuzzyIndex`.
+
+Kata uji dibuat dari key `SLANG_DATA` dengan satu hingga `--distance` edit acak (sisip, hapus,
+ganti, atau tukar huruf). Benchmark melaporkan akurasi (kata uji yang kembali ke key asalnya atau
+key lain dengan jarak yang sama), latency per kata, waktu pembuatan index, dan waktu loading index
+dari disk.
+
+Usage:
+    python benchmarks/fuzzy.py [--words 2000] [--distance 1] [--repeat 3]
+"""
+
+import argparse
+import difflib
+import os
+import random
+import re
+import string
+import tempfile
+import time
+import timeit
+from typing import Callable, List, Optional, Tuple
+
+from indoNLP.preprocessing import SLANG_DATA, _unescape
+from indoNLP.preprocessing.fuzzy import FuzzyIndex, distance
+
+
+def mutate(word: str, edits: int, rng: random.Random) -> str:
+    for _ in range(edits):
+        i = rng.randrange(len(word))
+        op = rng.choice(["insert", "delete", "replace", "swap"] if len(word) > 1 else ["insert"])
+        if op == "insert":
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+        elif op == "delete":
+            word = word[:i] + word[i + 1 :]
+        elif op == "replace":
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1 :]
+        elif i < len(word) - 1:
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+    return word
+
+
+def generate_words(
+    keys: List[str], n_words: int, max_distance: int, seed: int = 42
+) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    keys = [x for x in keys if len(x) >= 4]
+    words = []
+    while len(words) < n_words:
+        key = rng.choice(keys)
+        word = mutate(key, rng.randint(1, max_distance), rng)
+        if word not in SLANG_DATA and len(word) >= 4:
+            words.append((word, key))
+    return words
+
+
+def evaluate(
+    func: Callable[[str], Optional[str]], words: List[Tuple[str, str]], max_distance: int
+) -> float:
+    correct = 0
+    for word, key in words:
+        match = func(word)
+        # any key as close as the source key is an acceptable answer
+        if match is not None and distance(word, match) <= min(distance(word, key), max_distance):
+            correct += 1
+    return correct / len(words)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument("--distance", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    keys = [_unescape(k) for k in SLANG_DATA if re.fullmatch(r"\w+", _unescape(k))]
+    words = generate_words(keys, args.words, args.distance)
+
+    start = time.perf_counter()
+    index = FuzzyIndex.slang(args.distance, cache_dir=None)
+    build = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "slang.fuzzy")
+        index.save(path)
+        start = time.perf_counter()
+        assert FuzzyIndex.load(path) is not None
+        load = time.perf_counter() - start
+    print(f"index  build {build * 1000:.1f} ms, load {load * 1000:.1f} ms, {len(index)} keys")
+
+    def symspell(word: str) -> Optional[str]:
+        match = index.lookup(word)
+        return None if match is None else match[0]
+
+    def close_matches(word: str) -> Optional[str]:
+        matches = difflib.get_close_matches(word, keys, n=1, cutoff=0.8)
+        return matches[0] if matches else None
+
+    results = {}
+    # difflib compares every word with every key, a smaller sample keeps the run short
+    for name, func, sample in [
+        ("difflib", close_matches, words[:200]),
+        ("symspell", symspell, words),
+    ]:
+        best = min(
+            timeit.repeat(lambda: [func(x) for x, _ in sample], number=1, repeat=args.repeat)
+        )
+        results[name] = best / len(sample)
+        accuracy = evaluate(func, sample, args.distance)
+        print(f"{name:<9} {results[name] * 1e6:10.1f} us/word  accuracy {accuracy:6.1%}")
+    print(f"speedup: {results['difflib'] / results['symspell']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
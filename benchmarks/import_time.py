@@ -0,0 +1,112 @@
+"""Benchmark *cold start* `indoNLP` pada interpreter baru: waktu import, RSS, dan puncak alokasi
+memori (`tracemalloc`) setiap modul, serta biaya pemanggilan pertama setiap fungsi publik
+(loading data dan compile pattern yang ditunda hingga pemanggilan pertama).
+
+Setiap pengukuran dijalankan pada interpreter baru sebanyak `--runs` kali dan median-nya
+dilaporkan. Waktu diukur tanpa `tracemalloc` karena `tracemalloc` memperlambat eksekusi, puncak
+alokasi diukur pada run terpisah.
+
+Usage:
+    python benchmarks/import_time.py [--runs 7] [--output cold_start.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULES = ["indoNLP", "indoNLP.preprocessing", "indoNLP.preprocessing.emoji", "indoNLP.dataset"]
+SETUP = "import indoNLP.preprocessing as p"
+# name -> statement, run after `SETUP`
+FIRST_CALLS = {
+    "remove_html": "p.remove_html('<b>halo</b>')",
+    "remove_url": "p.remove_url('https://google.com')",
+    "remove_stopwords": "p.remove_stopwords('siapa yang suruh')",
+    "replace_slang": "p.replace_slang('gw')",
+    "replace_word_elongation": "p.replace_word_elongation('kenapaaa')",
+    "emoji_to_words": "p.emoji_to_words('😀')",
+    "words_to_emoji": "p.words_to_emoji('!wajah_gembira!')",
+    "pipeline (fuse)": (
+        "p.pipeline([p.remove_html, p.replace_word_elongation, p.replace_slang, "
+        "p.remove_stopwords], fuse=True)('<b>gw</b> kenapaaa')"
+    ),
+}
+
+TEMPLATE = """
+import json, os, sys, time, tracemalloc
+
+
+def rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource  # peak instead of current RSS outside linux
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+{setup}
+if {trace}:
+    tracemalloc.start()
+before = rss()
+start = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - start
+after = rss()
+start = time.perf_counter()
+{stmt}
+warm = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1] if {trace} else 0
+print(json.dumps([elapsed, warm, after - before, peak]))
+"""
+
+
+def run(setup: str, stmt: str, trace: bool) -> List[float]:
+    """Menjalankan `stmt` pada interpreter baru, mengembalikan [waktu, waktu kedua, RSS, peak]."""
+    code = TEMPLATE.format(setup=setup, stmt=stmt, trace=trace)
+    return list(json.loads(subprocess.check_output([sys.executable, "-c", code])))
+
+
+def measure(setup: str, stmt: str, runs: int) -> Dict[str, float]:
+    """Median hasil pengukuran dari `runs` interpreter baru."""
+    timings = [run(setup, stmt, False) for _ in range(runs)]
+    peaks = [run(setup, stmt, True)[3] for _ in range(max(1, runs // 2))]
+    return {
+        "time_ms": statistics.median(x[0] for x in timings) * 1000,
+        "warm_ms": statistics.median(x[1] for x in timings) * 1000,
+        "rss_mb": statistics.median(x[2] for x in timings) / 1e6,
+        "tracemalloc_peak_mb": statistics.median(peaks) / 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--output", help="menyimpan hasil dalam file JSON")
+    args = parser.parse_args()
+
+    cases: List[Tuple[str, str, str, str]] = [("import", x, "", f"import {x}") for x in MODULES] + [
+        ("first call", name, SETUP, stmt) for name, stmt in FIRST_CALLS.items()
+    ]
+
+    print(
+        f"{'':<12} {'':<28} {'time (ms)':>10} {'2nd (ms)':>10} {'RSS (MB)':>10} {'peak (MB)':>10}"
+    )
+    results: Dict[str, Dict[str, Dict[str, float]]] = {"import": {}, "first call": {}}
+    for kind, name, setup, stmt in cases:
+        result = results[kind][name] = measure(setup, stmt, args.runs)
+        print(
+            f"{kind:<12} {name:<28} {result['time_ms']:>10.1f} {result['warm_ms']:>10.3f}"
+            f" {result['rss_mb']:>10.1f} {result['tracemalloc_peak_mb']:>10.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as writer:
+            json.dump(results, writer, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark `replace_slang` : regex alternation (`SLANG_PATTERN`) vs `WordTrie`.
+
+Usage:
+    python benchmarks/replace_slang.py [--texts 2000] [--words 30] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import timeit
+
+from indoNLP.preprocessing import SLANG_DATA, SLANG_PATTERN, replace_slang
+from indoNLP.preprocessing.trie import fold
+
+FILLER = ["makan", "siapa", "aku", "rumah", "pergi", "kemana", "besok", "banget", "ok", "2022"]
+PUNCT = [" ", " ", " ", ", ", "! ", "? ", ". "]
+
+
+def generate_corpus(n_texts: int, n_words: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    slang = [k for k in SLANG_DATA if re.fullmatch(r"\w+", k)]
+    corpus = []
+    for _ in range(n_texts):
+        words = [rng.choice(slang if rng.random() < 0.3 else FILLER) for _ in range(n_words)]
+        corpus.append("".join(w + rng.choice(PUNCT) for w in words).strip())
+    return corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--words", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.texts, args.words)
+    pattern = re.compile(SLANG_PATTERN)
+
+    def regex(text: str) -> str:
+        return pattern.sub(lambda mo: SLANG_DATA[fold(mo.group(0))], text)
+
+    assert all(regex(x) == replace_slang(x) for x in corpus), "output mismatch"
+
+    results = {}
+    for name, func in [("regex", regex), ("trie", replace_slang)]:
+        best = min(timeit.repeat(lambda: [func(x) for x in corpus], number=1, repeat=args.repeat))
+        results[name] = best
+        print(f"{name:<6} {best * 1000:10.2f} ms  {len(corpus) / best:12.0f} texts/s")
+    print(f"speedup: {results['regex'] / results['trie']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark suite fungsi - fungsi dan pipeline `indoNLP.preprocessing` menggunakan corpus sintetis
+(lihat `benchmarks/corpus.py`).
+
+Setiap benchmark melaporkan throughput (teks / detik dan MB / detik, diambil dari putaran
+tercepat) serta persentil latency per teks (dari seluruh putaran). Hasil dapat disimpan sebagai
+JSON dan dibandingkan dengan baseline, exit code 1 jika terdapat regresi melebihi `--threshold`.
+
+Usage:
+    python benchmarks/suite.py [--repeat 5] [--output results.json]
+    python benchmarks/suite.py --baseline benchmarks/baseline.json [--threshold 0.1]
+    python benchmarks/suite.py --only replace_slang pipeline --save-baseline
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from corpus import add_arguments, config_from_args, generate_corpus
+
+import indoNLP
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing.lexicon import Vocabulary
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+PERCENTILES = [50, 90, 99]
+PIPELINE_STEPS = [
+    remove_html,
+    remove_url,
+    replace_word_elongation,
+    replace_slang,
+    remove_stopwords,
+    emoji_to_words,
+]
+
+
+def get_benchmarks() -> Dict[str, Tuple[Callable[[str], str], bool]]:
+    """Nama benchmark ke (fungsi, apakah input berupa hasil `emoji_to_words`)."""
+    return {
+        "remove_html": (remove_html, False),
+        "remove_url": (remove_url, False),
+        "remove_stopwords": (remove_stopwords, False),
+        "replace_slang": (replace_slang, False),
+        "replace_word_elongation": (replace_word_elongation, False),
+        "elongation (vocabulary)": (
+            functools.partial(replace_word_elongation, vocabulary=Vocabulary.default()),
+            False,
+        ),
+        "emoji_to_words": (emoji_to_words, False),
+        "words_to_emoji": (words_to_emoji, True),
+        "pipeline": (pipeline(PIPELINE_STEPS), False),
+        "pipeline (fuse)": (pipeline(PIPELINE_STEPS, fuse=True), False),
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Persentil dengan interpolasi linear, `values` harus telah diurutkan."""
+    index = (len(values) - 1) * q / 100
+    low = int(index)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (index - low)
+
+
+def measure(func: Callable[[str], str], corpus: List[str], repeat: int) -> Dict[str, float]:
+    """Menjalankan `func` pada setiap teks sebanyak `repeat` putaran."""
+    func(corpus[0])  # warm up lazily loaded tables and compiled patterns
+    clock = time.perf_counter
+    latencies: List[float] = []
+    best = float("inf")
+    for _ in range(repeat):
+        round_start = clock()
+        for text in corpus:
+            start = clock()
+            func(text)
+            latencies.append(clock() - start)
+        best = min(best, clock() - round_start)
+    latencies.sort()
+    megabytes = sum(len(x.encode("utf-8")) for x in corpus) / 1e6
+    result = {
+        "texts_per_sec": len(corpus) / best,
+        "mb_per_sec": megabytes / best,
+        "best_round_sec": best,
+    }
+    for q in PERCENTILES:
+        result[f"p{q}_us"] = percentile(latencies, q) * 1e6
+    result["max_us"] = latencies[-1] * 1e6
+    return result
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float
+) -> List[str]:
+    """Membandingkan throughput dengan baseline, mengembalikan nama benchmark yang mengalami
+    regresi."""
+    print(f"\n{'benchmark':<26} {'baseline':>12} {'current':>12} {'change':>9}")
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]["texts_per_sec"], result["texts_per_sec"]
+        change = new / old - 1
+        flag = ""
+        if change < -threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<26} {old:>12.0f} {new:>12.0f} {change:>+9.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="hanya menjalankan benchmark tertentu")
+    parser.add_argument("--output", help="menyimpan hasil dalam file JSON")
+    parser.add_argument("--baseline", help="file JSON baseline sebagai pembanding")
+    parser.add_argument("--threshold", type=float, default=0.1, help="batas regresi (default 10%%)")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help=f"menyimpan hasil sebagai {BASELINE}"
+    )
+    args = parser.parse_args()
+
+    config = config_from_args(args)
+    corpus = generate_corpus(config)
+    emoji_corpus = [emoji_to_words(x) for x in corpus]
+    benchmarks = get_benchmarks()
+    if args.only:
+        benchmarks = {k: v for k, v in benchmarks.items() if k in args.only}
+
+    header = f"{'benchmark':<26} {'texts/s':>10} {'MB/s':>8}"
+    print(header + "".join(f" {f'p{q} (us)':>10}" for q in PERCENTILES) + f" {'max (us)':>10}")
+    results: Dict[str, Dict[str, float]] = {}
+    for name, (func, use_emoji_corpus) in benchmarks.items():
+        result = measure(func, emoji_corpus if use_emoji_corpus else corpus, args.repeat)
+        results[name] = result
+        print(
+            f"{name:<26} {result['texts_per_sec']:>10.0f} {result['mb_per_sec']:>8.2f}"
+            + "".join(f" {result[f'p{q}_us']:>10.1f}" for q in PERCENTILES)
+            + f" {result['max_us']:>10.1f}"
+        )
+
+    report: Dict[str, Any] = {
+        "metadata": {
+            "indoNLP": indoNLP.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "corpus": config.as_dict(),
+        },
+        "results": results,
+    }
+    for path in [args.output, BASELINE if args.save_baseline else None]:
+        if path:
+            with open(path, "w", encoding="utf-8") as writer:
+                json.dump(report, writer, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as reader:
+            baseline = json.load(reader)
+        if baseline["metadata"]["corpus"] != config.as_dict():
+            print("warning: konfigurasi corpus berbeda dengan baseline", file=sys.stderr)
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"regresi lebih dari {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
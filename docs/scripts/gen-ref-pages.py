@@ -13,6 +13,17 @@ generate = {
     ],
     "preprocessing": [
         os.path.join(project_dir, "preprocessing", "__init__.py"),
+        os.path.join(project_dir, "preprocessing", "batch.py"),
+        os.path.join(project_dir, "preprocessing", "cache.py"),
+        os.path.join(project_dir, "preprocessing", "stats.py"),
+        os.path.join(project_dir, "preprocessing", "trie.py"),
+        os.path.join(project_dir, "preprocessing", "snapshot.py"),
+        os.path.join(project_dir, "preprocessing", "spans.py"),
+        os.path.join(project_dir, "preprocessing", "lexicon.py"),
+        os.path.join(project_dir, "preprocessing", "fuzzy.py"),
+        os.path.join(project_dir, "preprocessing", "html.py"),
+        os.path.join(project_dir, "preprocessing", "frame.py"),
+        os.path.join(project_dir, "preprocessing", "aio.py"),
     ],
 }
 
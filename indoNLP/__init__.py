@@ -1,9 +1,20 @@
-""" Indonesian NLP library written in python """
+"""Indonesian NLP library written in python"""
 
-import indoNLP.dataset
-import indoNLP.preprocessing
+import importlib
+from typing import Any, List
 
 __all__ = ["dataset", "preprocessing"]
 __version__ = "0.3.4"
 __author__ = "Wahyu Setianto"
 __source__ = "https://github.com/Hyuto/indo-nlp/"
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodule secara lazy ketika pertama kali diakses (PEP 562)"""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,281 @@
+"""Command line interface `indonlp`.
+
+Examples:
+    Preprocessing corpus baris per baris, input dan output dapat berupa file gzip.
+
+    ```bash
+    $ indonlp preprocess remove_html replace_slang "emoji_to_words:lang=en" \\
+        -i corpus.txt.gz -o clean.txt.gz --workers 4
+    ```
+
+    Menghapus tag HTML dari dokumen berukuran besar per potongan (*chunk*).
+
+    ```bash
+    $ indonlp strip-html -i page.html.gz --multiline | indonlp preprocess replace_slang
+    ```
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import re
+import sys
+import time
+from typing import IO, Any, Dict, Iterator, Optional, Sequence, cast
+
+__all__ = ["main"]
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _parse_step(step: str) -> Any:
+    """Parsing step dengan format `nama` atau `nama:key=value,key=value`"""
+    name, _, raw = step.partition(":")
+    if not raw:
+        return name
+    params: Dict[str, Any] = {}
+    for item in re.split(r",(?=\w+=)", raw):  # values may contain commas, e.g. JSON lists
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"parameter step tidak valid: {item!r}")
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value  # plain string, e.g. lang=en
+    return (name, params)
+
+
+def _open_input(path: str, stack: contextlib.ExitStack) -> IO[bytes]:
+    """Membuka input (file atau stdin) yang ditutup oleh `stack`, file gzip dideteksi otomatis"""
+    if path == "-":
+        reader = sys.stdin.buffer
+    else:
+        reader = stack.enter_context(open(path, "rb"))
+    if not isinstance(reader, io.BufferedReader):
+        reader = io.BufferedReader(cast(io.RawIOBase, reader))
+    if reader.peek(2)[:2] == _GZIP_MAGIC:
+        # closing a gzip file never closes the file object it reads from
+        return cast(IO[bytes], stack.enter_context(gzip.open(reader, "rb")))
+    return reader
+
+
+def _open_output(path: str, stack: contextlib.ExitStack) -> IO[bytes]:
+    """Membuka output (file atau stdout) yang ditutup oleh `stack`, dikompresi dengan gzip jika
+    berakhiran `.gz`"""
+    if path == "-":
+        stack.callback(sys.stdout.buffer.flush)
+        return sys.stdout.buffer
+    if path.endswith(".gz"):
+        return cast(IO[bytes], stack.enter_context(gzip.open(path, "wb")))
+    return stack.enter_context(open(path, "wb"))
+
+
+class _LineReader:
+    """Membaca input baris per baris sekaligus menghitung jumlah byte yang dibaca"""
+
+    def __init__(self, reader: IO[bytes]) -> None:
+        self.reader = reader
+        self.lines = 0
+        self.bytes = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for raw in self.reader:
+            self.lines += 1
+            self.bytes += len(raw)
+            if raw.endswith(b"\n"):
+                raw = raw[:-2] if raw.endswith(b"\r\n") else raw[:-1]
+            yield raw.decode("utf-8", "surrogateescape")
+
+
+def _format_report(lines: int, size: int, elapsed: float) -> str:
+    """Membuat laporan throughput"""
+    elapsed = max(elapsed, 1e-9)
+    megabytes = size / 1e6
+    return (
+        f"{lines} lines, {megabytes:.2f} MB in {elapsed:.2f}s "
+        f"({lines / elapsed:.0f} lines/s, {megabytes / elapsed:.2f} MB/s)"
+    )
+
+
+def _preprocess(args: argparse.Namespace) -> int:
+    """Command `indonlp preprocess`"""
+    from indoNLP.preprocessing import Pipeline
+    from indoNLP.preprocessing.batch import ChunkScheduler
+    from indoNLP.preprocessing.cache import DiskCache
+
+    try:
+        pipe = Pipeline(args.steps, fuse=not args.no_fuse)
+    except (ValueError, TypeError) as e:
+        print(f"indonlp preprocess: error: {e}", file=sys.stderr)
+        return 2
+
+    scheduler = ChunkScheduler() if args.adaptive else None
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        reader = _open_input(args.input, stack)
+        writer = _open_output(args.output, stack)
+        lines = _LineReader(reader)
+        disk_cache = DiskCache(args.cache) if args.cache else None
+        results = pipe.map(
+            lines,
+            args.workers,
+            args.chunksize,
+            disk_cache=disk_cache,
+            shared_memory=args.shared_memory,
+            scheduler=scheduler,
+        )
+        for text in results:
+            writer.write(text.encode("utf-8", "surrogateescape") + b"\n")
+
+    if not args.quiet:
+        report = _format_report(lines.lines, lines.bytes, time.perf_counter() - start)
+        print(report, file=sys.stderr)
+        if scheduler is not None and scheduler.tasks:
+            print(scheduler.summary(), file=sys.stderr)
+    return 0
+
+
+def _strip_html(args: argparse.Namespace) -> int:
+    """Command `indonlp strip-html`"""
+    import codecs
+
+    from indoNLP.preprocessing.html import HTMLStripper
+
+    try:
+        stripper = HTMLStripper(args.max_tag_length, args.multiline)
+    except ValueError as e:
+        print(f"indonlp strip-html: error: {e}", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    # a multi-byte character may be split across chunks as well
+    decoder = codecs.getincrementaldecoder("utf-8")("surrogateescape")
+    lines = size = 0
+    with contextlib.ExitStack() as stack:
+        reader = _open_input(args.input, stack)
+        writer = _open_output(args.output, stack)
+        for raw in iter(lambda: reader.read(args.chunk_size), b""):
+            lines += raw.count(b"\n")
+            size += len(raw)
+            text = stripper.feed(decoder.decode(raw))
+            writer.write(text.encode("utf-8", "surrogateescape"))
+        text = stripper.feed(decoder.decode(b"", final=True)) + stripper.close()
+        writer.write(text.encode("utf-8", "surrogateescape"))
+
+    if not args.quiet:
+        print(_format_report(lines, size, time.perf_counter() - start), file=sys.stderr)
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Membuat argument parser"""
+    from indoNLP.preprocessing import _get_builtin_steps
+    from indoNLP.preprocessing.cache import DEFAULT_CACHE_PATH
+    from indoNLP.preprocessing.html import DEFAULT_MAX_TAG_LENGTH
+
+    builtin_steps = sorted(_get_builtin_steps())
+    parser = argparse.ArgumentParser(prog="indonlp", description="indoNLP command line interface")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+
+    preprocess = commands.add_parser(
+        "preprocess",
+        help="preprocessing teks baris per baris",
+        description=(
+            "Preprocessing teks baris per baris dengan penggunaan memori yang konstan. "
+            f"Step yang tersedia: {', '.join(builtin_steps)}. Parameter step dapat diberikan "
+            'dengan format "nama:key=value,key=value" (contoh: "emoji_to_words:lang=en").'
+        ),
+    )
+    preprocess.add_argument("steps", nargs="+", type=_parse_step, help="step - step preprocessing")
+    preprocess.add_argument(
+        "-i", "--input", default="-", help="file input, gzip dideteksi otomatis (default: stdin)"
+    )
+    preprocess.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file output, gzip jika berakhiran .gz (default: stdout)",
+    )
+    preprocess.add_argument(
+        "-w", "--workers", type=int, default=1, help="jumlah worker (default: 1)"
+    )
+    preprocess.add_argument(
+        "--chunksize", type=int, default=256, help="jumlah baris per task worker (default: 256)"
+    )
+    preprocess.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="ukuran chunk berdasarkan jumlah karakter dan throughput worker, menggantikan "
+        "--chunksize, utilisasi setiap worker ditampilkan pada laporan",
+    )
+    preprocess.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help="mengirim baris ke worker melalui shared memory sebagai pengganti pickle",
+    )
+    preprocess.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_PATH,
+        metavar="PATH",
+        help="menyimpan hasil di disk sehingga baris yang sama tidak diproses ulang "
+        f"(default: {DEFAULT_CACHE_PATH})",
+    )
+    preprocess.add_argument(
+        "--no-fuse", action="store_true", help="tidak menggabungkan step - step bawaan"
+    )
+    preprocess.add_argument("-q", "--quiet", action="store_true", help="tanpa laporan throughput")
+    preprocess.set_defaults(run=_preprocess)
+
+    strip_html = commands.add_parser(
+        "strip-html",
+        help="menghapus tag HTML dari dokumen berukuran besar",
+        description=(
+            "Menghapus tag dan entity HTML dengan membaca input per potongan (chunk) sehingga "
+            "penggunaan memori konstan berapapun ukuran dokumennya."
+        ),
+    )
+    strip_html.add_argument(
+        "-i", "--input", default="-", help="file input, gzip dideteksi otomatis (default: stdin)"
+    )
+    strip_html.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file output, gzip jika berakhiran .gz (default: stdout)",
+    )
+    strip_html.add_argument(
+        "--max-tag-length",
+        type=int,
+        default=DEFAULT_MAX_TAG_LENGTH,
+        help=f"panjang maksimum tag / entity (default: {DEFAULT_MAX_TAG_LENGTH})",
+    )
+    strip_html.add_argument(
+        "--multiline", action="store_true", help="menghapus tag yang mengandung baris baru"
+    )
+    strip_html.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1 << 16,
+        help="jumlah byte yang dibaca per potongan (default: 65536)",
+    )
+    strip_html.add_argument("-q", "--quiet", action="store_true", help="tanpa laporan throughput")
+    strip_html.set_defaults(run=_strip_html)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point command line interface `indonlp`.
+
+    Args:
+        argv (Sequence[str], optional): Argument command line, default `sys.argv[1:]`.
+
+    Returns:
+        Exit code.
+    """
+    args = _build_parser().parse_args(argv)
+    code: int = args.run(args)
+    return code
@@ -1,4 +1,4 @@
-"""`indoNLP.dataset` adalah modul yang bertujuan untuk memudahkan mengakses 
+"""`indoNLP.dataset` adalah modul yang bertujuan untuk memudahkan mengakses
 open dataset dalam bidang NLP untuk Bahasa Indonesia."""
 
 import os
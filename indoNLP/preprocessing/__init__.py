@@ -1,18 +1,54 @@
 """`indoNLP.preprocessing` adalah modul yang bertujuan untuk memudahkan proses preprocessing data
 teks dengan menggunakan beberapa fungsi yang siap digunakan."""
 
+import functools
+import hashlib
+import inspect
+import json
 import re
-from typing import Callable, Match, Sequence, Tuple
+import time
+from types import CodeType, FunctionType, MethodType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import indoNLP.preprocessing.emoji as _emoji
+from indoNLP.preprocessing.cache import DiskCache, LRUCache
+from indoNLP.preprocessing.fuzzy import FuzzyIndex
+from indoNLP.preprocessing.html import DEFAULT_MAX_TAG_LENGTH, HTMLStripper
+from indoNLP.preprocessing.lexicon import Lexicon, Vocabulary
+from indoNLP.preprocessing.stats import PipelineStats, StepStats
+from indoNLP.preprocessing.trie import CharTrie, WordTrie, split_segments
 
-from indoNLP.preprocessing.emoji import *
-from indoNLP.preprocessing.slang_data import SLANG_DATA
-from indoNLP.preprocessing.stopwords_data import STOPWORDS
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+    from indoNLP.preprocessing.batch import ChunkScheduler
+    from indoNLP.preprocessing.spans import Annotation
 
 # fmt: off
 __all__ = [
     # main functions
     "remove_html", "remove_url", "remove_stopwords", "replace_slang", 
     "replace_word_elongation", "pipeline", "emoji_to_words", "words_to_emoji",
+    "strip_html", "Pipeline",
 
     # data
     "EMOJI_DATA", "WORDS_EMOJI_DATA", "SLANG_DATA", "STOPWORDS",
@@ -24,6 +60,11 @@ __all__ = [
 ]
 
 # fmt: on
+TrieT = TypeVar("TrieT", WordTrie, CharTrie)
+PipelineStep = Union[str, Tuple[str, Dict[str, Any]], Callable[[str], str]]
+_Stage = Callable[[str], Tuple[str, int]]
+_Prefilter = Callable[[str], Optional[str]]
+
 HTML_PATTERN = r"(?i)<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});"
 URL_PATTERN = (
     # WEB URL matching pattern retrieved from https://gist.github.com/gruber/8891611
@@ -51,9 +92,154 @@ URL_PATTERN = (
     + r"tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|wf|ws|ye|yt|yu|za|zm|zw)"
     + r"\b/?(?!@)))"
 )
-SLANG_PATTERN = rf"(?i)\b({'|'.join(SLANG_DATA.keys())})\b"
-STOPWORDS_PATTERN = rf"(?i)\b({'|'.join(STOPWORDS)})\b"
 WE_PATTERN = r"(?i)\b\w*([a-zA-Z])(\1{1,})\b"
+# every match of `WE_PATTERN` ends with a match of this pattern, used to replace in a single pass
+_WE_INNER_PATTERN = re.compile(r"(?i)([a-zA-Z])(\1{1,})\b")
+
+
+def _unescape(pattern: str) -> str:
+    """Mengubah key yang di-*escape* untuk regex menjadi literal"""
+    return re.sub(r"\\(.)", r"\1", pattern)
+
+
+def _is_literal(word: str) -> bool:
+    """Mengecek apakah sebuah kata tidak mengandung regex metacharacter"""
+    return re.search(r"[\\()\[\]{}?*+|^$.]", word) is None
+
+
+def _load_slang_data() -> Dict[str, str]:
+    """Loading slang words data"""
+    from indoNLP.preprocessing.slang_data import SLANG_DATA
+
+    return SLANG_DATA
+
+
+def _load_stopwords() -> Set[str]:
+    """Loading stopwords data"""
+    from indoNLP.preprocessing.stopwords_data import STOPWORDS
+
+    return STOPWORDS
+
+
+def _load_data(name: str, fallback: Callable[[], Any]) -> Any:
+    """Loading data dari snapshot biner, lihat `indoNLP.preprocessing.snapshot`"""
+    from indoNLP.preprocessing.snapshot import _load_data
+
+    return _load_data(name, fallback)
+
+
+def _build_slang_trie(slang_data: Dict[str, str]) -> WordTrie:
+    """Membuat matcher untuk slang words"""
+    return WordTrie({_unescape(k): v for k, v in slang_data.items()})
+
+
+def _build_stopwords_trie(stopwords: Set[str]) -> WordTrie:
+    """Membuat matcher untuk stopwords"""
+    return WordTrie(
+        {x: "" for x in stopwords if _is_literal(x)},
+        longest=True,
+        patterns={x: "" for x in stopwords if not _is_literal(x)},
+    )
+
+
+def _load_trie(name: str, cls: Type[TrieT], build: Callable[[], TrieT]) -> TrieT:
+    """Loading matcher dari snapshot biner, membuat matcher baru jika tidak tersedia"""
+    state = _load_data(name, lambda: None)
+    if state is None:
+        return build()
+    trie = cls.__new__(cls)
+    trie.__setstate__(state)
+    return trie
+
+
+# data, patterns and matchers are loaded on first access, see `__getattr__`
+_LAZY_LOADERS: Dict[str, Callable[[], Any]] = {
+    # data
+    "EMOJI_DATA": lambda: _emoji._get("EMOJI_DATA"),
+    "WORDS_EMOJI_DATA": lambda: _emoji._get("WORDS_EMOJI_DATA"),
+    "SLANG_DATA": lambda: _load_data("SLANG_DATA", _load_slang_data),
+    "STOPWORDS": lambda: _load_data("STOPWORDS", _load_stopwords),
+    # regex patterns
+    "SLANG_PATTERN": lambda: rf"(?i)\b({'|'.join(_get('SLANG_DATA').keys())})\b",
+    "STOPWORDS_PATTERN": lambda: rf"(?i)\b({'|'.join(_get('STOPWORDS'))})\b",
+    "EMOJI_PATTERN": lambda: _emoji._get("EMOJI_PATTERN"),
+    "EN_WORDS_EMOJI_PATTERN": lambda: _emoji._get("EN_WORDS_EMOJI_PATTERN"),
+    "ID_WORDS_EMOJI_PATTERN": lambda: _emoji._get("ID_WORDS_EMOJI_PATTERN"),
+    "ALIAS_WORDS_EMOJI_PATTERN": lambda: _emoji._get("ALIAS_WORDS_EMOJI_PATTERN"),
+    # matchers
+    "_SLANG_TRIE": lambda: _load_trie(
+        "_SLANG_TRIE", WordTrie, lambda: _build_slang_trie(_get("SLANG_DATA"))
+    ),
+    "_STOPWORDS_TRIE": lambda: _load_trie(
+        "_STOPWORDS_TRIE", WordTrie, lambda: _build_stopwords_trie(_get("STOPWORDS"))
+    ),
+    "_EMOJI_TRIE": lambda: _load_trie(
+        "_EMOJI_TRIE", CharTrie, lambda: CharTrie(_get("EMOJI_DATA"))
+    ),
+}
+
+
+def _get(name: str) -> Any:
+    """Mendapatkan data / pattern / matcher, loading terlebih dahulu jika belum pernah diakses"""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+def __getattr__(name: str) -> Any:
+    """Loading data, pattern, dan matcher secara lazy ketika pertama kali diakses (PEP 562)"""
+    loader = _LAZY_LOADERS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = loader()
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_LOADERS))
+
+
+# words_to_emoji cache, keyed by (lang, use_alias, delimiter)
+_WORDS_EMOJI_CACHE: Dict[
+    Tuple[str, bool, Tuple[str, ...]], Tuple[Pattern[str], Dict[str, Tuple[int, str]], int]
+] = {}
+_WORDS_EMOJI_CACHE_SIZE = 64
+_WORDS_EMOJI_NAMES: Dict[str, Dict[str, Tuple[int, str]]] = {}
+
+
+def _get_words_emoji_names(table: str) -> Dict[str, Tuple[int, str]]:
+    """Mapper kata - kata kode emoji ke (prioritas, emoji)"""
+    names = _WORDS_EMOJI_NAMES.get(table)
+    if names is None:
+        names = {k: (i, v) for i, (k, v) in enumerate(_get("WORDS_EMOJI_DATA")[table].items())}
+        _WORDS_EMOJI_NAMES[table] = names
+    return names
+
+
+def _get_words_emoji_matcher(
+    lang: str, use_alias: bool, delimiter: Tuple[str, str]
+) -> Tuple[Pattern[str], Dict[str, Tuple[int, str]], int]:
+    """Mendapatkan compiled pattern pembatas awal beserta mapper kata - kata kode emoji"""
+    key = (lang, use_alias, tuple(delimiter))
+    matcher = _WORDS_EMOJI_CACHE.get(key)
+    if matcher is None:
+        names = _get_words_emoji_names("alias" if use_alias else lang)
+        max_length = max(len(x) for x in names)
+        # opening delimiter followed by a closing delimiter within the longest name
+        opener = re.compile(
+            rf"{re.escape(delimiter[0])}(?=.{{1,{max_length}}}?{re.escape(delimiter[1])})", re.S
+        )
+        if len(_WORDS_EMOJI_CACHE) >= _WORDS_EMOJI_CACHE_SIZE:
+            _WORDS_EMOJI_CACHE.clear()
+        matcher = _WORDS_EMOJI_CACHE[key] = (opener, names, max_length)
+    return matcher
+
+
+def _remove_html(text: str) -> Tuple[str, int]:
+    """`remove_html` beserta jumlah penggantian"""
+    text, count = re.subn(HTML_PATTERN, "", text)
+    return text.strip(), count
 
 
 def remove_html(text: str) -> str:
@@ -71,7 +257,49 @@ def remove_html(text: str) -> str:
         >>> indoNLP.preprocessing.remove_html("website <a href='https://google.com'>google</a>")
         "website google"
     """
-    return re.sub(HTML_PATTERN, "", text).strip()
+    return _remove_html(text)[0]
+
+
+def _strip_html(
+    text: str, max_tag_length: int = DEFAULT_MAX_TAG_LENGTH, multiline: bool = False
+) -> Tuple[str, int]:
+    """`strip_html` beserta jumlah penggantian"""
+    text, count = HTMLStripper(max_tag_length, multiline).strip(text)
+    return text.strip(), count
+
+
+def strip_html(
+    text: str, max_tag_length: int = DEFAULT_MAX_TAG_LENGTH, multiline: bool = False
+) -> str:
+    """Menghapus tag - tag dan entity HTML seperti `remove_html` dengan batas panjang tag sehingga
+    teks dengan banyak tag yang tidak pernah ditutup tidak membutuhkan waktu proses kuadratik.
+
+    Args:
+        text (str): Teks yang memiliki html tag di dalamnya.
+        max_tag_length (int, optional): Panjang maksimum tag / entity, tag yang lebih panjang
+            dianggap sebagai teks biasa.
+        multiline (bool, optional): Menghapus tag yang mengandung baris baru.
+
+    !!! tip
+        Gunakan `indoNLP.preprocessing.html.HTMLStripper` untuk memproses dokumen berukuran
+        sangat besar per potongan (*chunk*) tanpa membaca seluruh dokumen ke memori.
+
+    Returns:
+        Teks yang telah dibersihkan (tanpa tag - tag HTML di dalamnya).
+
+    Examples:
+        >>> indoNLP.preprocessing.strip_html("<p>berita <b>hari ini</b> &amp; <br")
+        "berita hari ini  <br"
+        >>> indoNLP.preprocessing.strip_html('<a\nhref="#">link</a>', multiline=True)
+        "link"
+    """
+    return _strip_html(text, max_tag_length, multiline)[0]
+
+
+def _remove_url(text: str) -> Tuple[str, int]:
+    """`remove_url` beserta jumlah penggantian"""
+    text, count = re.subn(URL_PATTERN, "", text)
+    return text.strip(), count
 
 
 def remove_url(text: str) -> str:
@@ -89,10 +317,17 @@ def remove_url(text: str) -> str:
         >>> indoNLP.preprocessing.remove_url("retrieved from https://gist.github.com/gruber/8891611")
         "retrieved from"
     """
-    return re.sub(URL_PATTERN, "", text).strip()
+    return _remove_url(text)[0]
+
 
+def _remove_stopwords(text: str, lexicon: Optional[Lexicon] = None) -> Tuple[str, int]:
+    """`remove_stopwords` beserta jumlah penggantian"""
+    matcher: Union[WordTrie, Lexicon] = _get("_STOPWORDS_TRIE") if lexicon is None else lexicon
+    text, count = matcher.subn(text)
+    return text.strip(), count
 
-def remove_stopwords(text: str) -> str:
+
+def remove_stopwords(text: str, lexicon: Optional[Lexicon] = None) -> str:
     """Menghapus stopwords yang terdapat dalam sebuah teks.
 
     !!! abstract "Definisi"
@@ -103,8 +338,15 @@ def remove_stopwords(text: str) -> str:
         List stopwords Bahasa Indonesia yang digunakan diperoleh dari
         [stopwords.net](https://stopwords.net/indonesian-id/)
 
+    !!! note
+        Stopwords dicari per kata menggunakan `indoNLP.preprocessing.trie.WordTrie` sehingga
+        waktu proses sebanding dengan jumlah kata dalam teks. Jika beberapa stopwords cocok pada
+        posisi yang sama maka stopwords terpanjang yang dihapus (contoh: "sama-sama").
+
     Args:
         text (str): Teks yang terdapat stopwords di dalamnya.
+        lexicon (Lexicon, optional): Leksikon stopwords
+            (`indoNLP.preprocessing.lexicon.Lexicon`) sebagai pengganti `STOPWORDS`.
 
     Returns:
         Teks yang telah dibersihkan (tanpa stopwords di dalamnya).
@@ -114,11 +356,43 @@ def remove_stopwords(text: str) -> str:
 
         >>> indoNLP.preprocessing.remove_stopwords("siapa yang suruh makan?!!")
         "suruh makan?!!"
+
+        Menggunakan stopwords tambahan.
+
+        >>> from indoNLP.preprocessing.lexicon import Lexicon
+        >>> lexicon = Lexicon.stopwords(add=["makan"])
+        >>> indoNLP.preprocessing.remove_stopwords("siapa yang suruh makan?!!", lexicon=lexicon)
+        "suruh ?!!"
     """
-    return re.sub(STOPWORDS_PATTERN, "", text).strip()
+    return _remove_stopwords(text, lexicon)[0]
+
+
+_FUZZY_INDEXES: Dict[int, FuzzyIndex] = {}
+
+
+def _fuzzy_index(fuzzy: Union[int, FuzzyIndex]) -> Optional[FuzzyIndex]:
+    """Mendapatkan index fuzzy, index bawaan dibuat sekali untuk setiap jarak edit"""
+    if isinstance(fuzzy, FuzzyIndex):
+        return fuzzy
+    if not fuzzy:
+        return None
+    index = _FUZZY_INDEXES.get(fuzzy)
+    if index is None:
+        index = _FUZZY_INDEXES[fuzzy] = FuzzyIndex.slang(fuzzy)
+    return index
+
+
+def _replace_slang(
+    text: str, lexicon: Optional[Lexicon] = None, fuzzy: Union[int, FuzzyIndex] = 0
+) -> Tuple[str, int]:
+    """`replace_slang` beserta jumlah penggantian"""
+    matcher: Union[WordTrie, Lexicon] = _get("_SLANG_TRIE") if lexicon is None else lexicon
+    return matcher.subn(text, _fuzzy_index(fuzzy))
 
 
-def replace_slang(text: str) -> str:
+def replace_slang(
+    text: str, lexicon: Optional[Lexicon] = None, fuzzy: Union[int, FuzzyIndex] = 0
+) -> str:
     """Menghapus *slang words* (kata gaul) yang terdapat dalam sebuah teks. Kata gaul dapat juga
     berupa singkatan yang sering digunakan dalam kehidupan sehari - hari seperti:
 
@@ -132,6 +406,11 @@ def replace_slang(text: str) -> str:
 
     Args:
         text (str): Teks yang terdapat *slang words* di dalamnya.
+        lexicon (Lexicon, optional): Leksikon *slang words*
+            (`indoNLP.preprocessing.lexicon.Lexicon`) sebagai pengganti `SLANG_DATA`.
+        fuzzy (Union[int, FuzzyIndex], optional): Jarak edit maksimum untuk mencocokkan kata yang
+            tidak terdapat di dalam kamus dengan *slang words* terdekat (contoh: "bgtt" -> "bgt"),
+            atau index `indoNLP.preprocessing.fuzzy.FuzzyIndex`. Nonaktif jika 0.
 
     Returns:
         Teks yang telah dimodifikasi (tanpa *slang words* di dalamnya).
@@ -141,20 +420,45 @@ def replace_slang(text: str) -> str:
 
         >>> indoNLP.preprocessing.replace_slang("emg siapa yg nanya?")
         "memang siapa yang bertanya?"
+
+        Menggunakan *slang words* tambahan.
+
+        >>> from indoNLP.preprocessing.lexicon import Lexicon
+        >>> lexicon = Lexicon.slang(add={"cuan": "untung"})
+        >>> indoNLP.preprocessing.replace_slang("emg cuan", lexicon=lexicon)
+        "memang untung"
+
+        Mengganti *slang words* yang salah ketik.
+
+        >>> indoNLP.preprocessing.replace_slang("emgg siapa yg nanyaa?", fuzzy=1)
+        "memang siapa yang bertanya?"
     """
-    # https://stackoverflow.com/a/15175239
-    return re.sub(SLANG_PATTERN, lambda mo: SLANG_DATA[mo.group(0).lower()], text)
+    return _replace_slang(text, lexicon, fuzzy)[0]
+
+
+def _replace_word_elongation(text: str, vocabulary: Optional[Vocabulary] = None) -> Tuple[str, int]:
+    """`replace_word_elongation` beserta jumlah penggantian"""
+    if vocabulary is not None:
+        return vocabulary.subn(text)
+    return _WE_INNER_PATTERN.subn(_first_group, text)
 
 
-def replace_word_elongation(text: str) -> str:
+def replace_word_elongation(text: str, vocabulary: Optional[Vocabulary] = None) -> str:
     """Mengganti *word elongation* yang terdapat pada sebuah teks.
 
     !!! abstract "Definisi"
         *Word elongation* adalah tindakan menambahkan huruf tambahan ke kata, biasanya terdapat
         di akhir kata, hal ini biasanya dilakukan agar terdengar lebih ceria, ramah, dan imut.
 
+    Tanpa `vocabulary`, huruf berulang di akhir kata diringkas menjadi satu huruf. Dengan
+    `vocabulary`, kata hasil peringkasan divalidasi menggunakan daftar kata sehingga huruf
+    berulang di tengah kata juga dapat diringkas dan huruf ganda yang merupakan bagian dari kata
+    tetap dipertahankan (lihat `indoNLP.preprocessing.lexicon.Vocabulary`).
+
     Args:
         text (str): Teks yang terdapat *word elongation* di dalamnya.
+        vocabulary (Vocabulary, optional): Daftar kata untuk memvalidasi hasil peringkasan
+            (`indoNLP.preprocessing.lexicon.Vocabulary`).
 
     Returns:
         Teks yang telah ditransformasi (tanpa *word elongation*).
@@ -164,22 +468,226 @@ def replace_word_elongation(text: str) -> str:
 
         >>> indoNLP.preprocessing.replace_word_elongation("kenapaaa?")
         "kenapa?"
+
+        Memvalidasi hasil peringkasan menggunakan daftar kata.
+
+        >>> from indoNLP.preprocessing.lexicon import Vocabulary
+        >>> vocabulary = Vocabulary.default(add=["full"])
+        >>> indoNLP.preprocessing.replace_word_elongation("maaaaf fulll", vocabulary=vocabulary)
+        "maaf full"
     """
-    # TODO: implement validation with wordlist using get_close_matches
-    return re.sub(
-        WE_PATTERN, lambda mo: re.sub(r"(?i)([a-zA-Z])(\1{1,})\b", r"\1", mo.group(0)), text
-    )
+    return _replace_word_elongation(text, vocabulary)[0]
+
+
+def _first_group(match: Match[str]) -> str:
+    """Mengganti match dengan group pertama (`r"\\1"` tanpa parsing template)"""
+    return match.group(1)
+
+
+def _strip_segments(parts: List[str]) -> List[str]:
+    """`str.strip` untuk teks yang telah dipecah menggunakan `split_segments`"""
+    # whitespace is never a word character so only the outer non-word segments are stripped
+    if len(parts) > 1 and parts[0] == "":
+        head = parts[1].lstrip()
+        if head:
+            parts[1] = head
+        else:
+            del parts[:2]
+    if len(parts) > 1 and parts[-1] == "":
+        tail = parts[-2].rstrip()
+        if tail:
+            parts[-2] = tail
+        else:
+            del parts[-2:]
+    return parts
+
+
+def _elongation_segments(
+    parts: List[str], vocabulary: Optional[Vocabulary] = None
+) -> Tuple[List[str], int]:
+    """`replace_word_elongation` untuk teks yang telah dipecah menggunakan `split_segments`"""
+    if vocabulary is not None:
+        return vocabulary.subn_segments(parts)
+    if _WE_INNER_PATTERN.search("".join(parts)) is None:
+        return parts, 0
+    # every word segment is a whole `\b\w+\b` run, the inner pattern only matches its tail
+    subn = _WE_INNER_PATTERN.subn
+    total = 0
+    for i in range(0, len(parts), 2):
+        parts[i], count = subn(_first_group, parts[i])
+        total += count
+    return parts, total
+
+
+def _slang_segments(
+    parts: List[str], lexicon: Optional[Lexicon] = None, fuzzy: Union[int, FuzzyIndex] = 0
+) -> Tuple[List[str], int]:
+    """`replace_slang` untuk teks yang telah dipecah menggunakan `split_segments`"""
+    matcher: Union[WordTrie, Lexicon] = _get("_SLANG_TRIE") if lexicon is None else lexicon
+    return matcher.subn_segments(parts, _fuzzy_index(fuzzy))
+
+
+def _stopwords_segments(
+    parts: List[str], lexicon: Optional[Lexicon] = None
+) -> Tuple[List[str], int]:
+    """`remove_stopwords` untuk teks yang telah dipecah menggunakan `split_segments`"""
+    matcher: Union[WordTrie, Lexicon] = _get("_STOPWORDS_TRIE") if lexicon is None else lexicon
+    parts, count = matcher.subn_segments(parts)
+    return _strip_segments(parts), count
+
+
+def _segment_stage(steps: List[Tuple[str, Dict[str, Any]]]) -> Callable[[str], Tuple[str, int]]:
+    """Menggabungkan step - step berbasis kata menjadi satu kali pemecahan dan penggabungan teks"""
+    head: Optional[Callable[[str], Tuple[str, int]]] = None
+    if steps[0][0] == "replace_word_elongation":  # a single regex pass is faster
+        head = functools.partial(_replace_word_elongation, **steps[0][1])
+        steps = steps[1:]
+    segment_steps: Dict[str, Callable[..., Tuple[List[str], int]]] = {
+        "replace_word_elongation": _elongation_segments,
+        "replace_slang": _slang_segments,
+        "remove_stopwords": _stopwords_segments,
+    }
+    transforms = [
+        functools.partial(segment_steps[x], **params) if params else segment_steps[x]
+        for x, params in steps
+    ]
+    if not transforms:
+        assert head is not None  # ensure type
+        return head
+
+    def _run(value: str) -> Tuple[str, int]:
+        total = 0
+        if head is not None:
+            value, total = head(value)
+        parts = split_segments(value)
+        for transform in transforms:
+            parts, count = transform(parts)
+            total += count
+        return "".join(parts), total
+
+    return _run
+
+
+def _remove_patterns_stage(patterns: List[Pattern[str]]) -> Callable[[str], Tuple[str, int]]:
+    """Menggabungkan step - step penghapusan pattern dengan satu kali `str.strip`"""
+
+    def _run(value: str) -> Tuple[str, int]:
+        total = 0
+        for pattern in patterns:
+            value, count = pattern.subn("", value)
+            total += count
+        return value.strip(), total
+
+    return _run
+
+
+def _custom_stage(step: Callable[[str], str]) -> Callable[[str], Tuple[str, int]]:
+    """Membungkus custom step, jumlah penggantiannya selalu 0"""
+
+    def _run(value: str) -> Tuple[str, int]:
+        return step(value), 0
+
+    return _run
 
 
-def pipeline(pipe: Sequence[Callable[[str], str]]) -> Callable[[str], str]:
+def _compile_pipeline(
+    steps: Sequence[Tuple[Union[str, Callable[[str], str]], Dict[str, Any]]], fuse: bool
+) -> List[Tuple[str, _Stage, Optional[_Prefilter]]]:
+    """Membuat (nama, callable, prefilter) untuk setiap stage pipeline. Callable setiap stage
+    mengembalikan teks beserta jumlah penggantian, prefilter (`None` untuk custom step)
+    mengembalikan hasil stage jika stage dapat dilewati. Jika `fuse=True` maka step - step
+    bawaan yang berurutan digabungkan menjadi lebih sedikit pass."""
+    counted = _get_counted_steps()
+    word_steps = ("replace_word_elongation", "replace_slang", "remove_stopwords")
+    removal_steps = {"remove_html": HTML_PATTERN, "remove_url": URL_PATTERN}
+    stages: List[Tuple[str, _Stage, Optional[_Prefilter]]] = []
+    i = 0
+    while i < len(steps):
+        step, params = steps[i]
+        j = i + 1
+        if not isinstance(step, str):
+            name = getattr(step, "__name__", type(step).__name__)
+            stages.append((name, _custom_stage(step), None))
+            i = j
+            continue
+
+        if fuse and step in word_steps:
+            while j < len(steps) and steps[j][0] in word_steps:
+                j += 1
+            group = [(str(x), y) for x, y in steps[i:j]]
+            stage: _Stage = _segment_stage(group)
+        elif fuse and step in removal_steps:
+            while j < len(steps) and steps[j][0] in removal_steps:
+                j += 1
+            group = [(str(x), y) for x, y in steps[i:j]]
+            stage = _remove_patterns_stage([re.compile(removal_steps[x]) for x, _ in group])
+        else:
+            group = [(step, params)]
+            stage = functools.partial(counted[step], **params) if params else counted[step]
+        stages.append(("+".join(x for x, _ in group), stage, _stage_prefilter(group)))
+        i = j
+    return stages
+
+
+def pipeline(
+    pipe: Sequence[PipelineStep],
+    fuse: bool = False,
+    instrument: bool = False,
+    callback: Optional[Callable[[StepStats], None]] = None,
+    cache: Optional[LRUCache] = None,
+    prefilter: bool = True,
+) -> "Pipeline":
     """Pipelining fungsi preprocessing.
 
     Args:
-        pipe (Sequence[Callable[[str], str]]): Sequence dari fungsi - fungsi preprocessing
-            `indoNLP`.
+        pipe (Sequence[PipelineStep]): Sequence dari fungsi - fungsi preprocessing `indoNLP`,
+            lihat `Pipeline` untuk format step lainnya.
+        fuse (bool, optional): Menggabungkan step - step bawaan yang berurutan sehingga teks
+            diproses dengan lebih sedikit pass. Hasil pipeline tetap sama dengan menjalankan
+            setiap step secara berurutan.
+        instrument (bool, optional): Mencatat statistik setiap step (waktu eksekusi, jumlah
+            pemanggilan, jumlah karakter input / output, dan jumlah penggantian) pada
+            `Pipeline.stats`. Ketika `False` (default) tidak ada statistik yang dicatat.
+        callback (Callable[[StepStats], None], optional): Fungsi yang dipanggil setiap kali
+            sebuah step selesai dijalankan dengan statistik pemanggilan tersebut. Memberikan
+            `callback` sekaligus mengaktifkan `instrument`.
+        cache (LRUCache, optional): Cache hasil pipeline (`indoNLP.preprocessing.cache.LRUCache`)
+            sehingga teks duplikat hanya diproses satu kali. Satu cache dapat digunakan bersama
+            oleh beberapa pipeline. Statistik instrumentasi hanya dicatat untuk teks yang tidak
+            ditemukan dalam cache.
+        prefilter (bool, optional): Melewati step bawaan ketika pemeriksaan cepat menunjukkan
+            step tersebut pasti tidak mengubah teks, lihat catatan di bawah.
+
+    !!! note "Prefilter"
+        Setiap step bawaan memiliki *quick-reject predicate* yang jauh lebih murah dibandingkan
+        step itu sendiri. Step dilewati (hasilnya tetap sama) jika:
+
+        - `remove_html` dan `strip_html`: teks tidak mengandung `<` maupun `&`.
+        - `remove_url`: teks tidak mengandung `.` maupun `:`.
+        - `replace_slang` dan `remove_stopwords`: teks tidak mengandung karakter kata.
+        - `emoji_to_words`: teks hanya berisi karakter ASCII.
+        - `words_to_emoji`: teks tidak mengandung delimiter pembuka.
+
+        `replace_word_elongation` dan *custom step* selalu dijalankan. Step yang digabungkan
+        (`fuse=True`) dilewati jika semua step di dalamnya dapat dilewati.
+        Jumlah step yang dilewati dicatat pada `StepStats.skipped` ketika instrumentasi aktif.
+
+    !!! note "Step yang dapat digabungkan"
+        Ketika `fuse=True`, step - step bawaan yang **berurutan** digabungkan sebagai berikut:
+
+        - `replace_word_elongation`, `replace_slang`, dan `remove_stopwords` dalam urutan dan
+          jumlah apapun. Teks hanya dipecah per kata satu kali (`split_segments`), setiap step
+          bekerja langsung pada segmen kata, dan teks digabungkan kembali satu kali di akhir.
+        - `remove_html` dan `remove_url` dalam urutan dan jumlah apapun. Setiap pattern hanya
+          di-*compile* satu kali dan `str.strip` hanya dilakukan satu kali di akhir. Kedua
+          pattern tetap dijalankan secara terpisah karena penghapusan tag HTML dapat membentuk
+          URL baru (contoh: `goo<b>gle.com</b>`).
+
+        `emoji_to_words`, `words_to_emoji`, dan fungsi lain (*custom callable*) tetap dijalankan
+        sebagai pass tersendiri dan menjadi pemisah antar kelompok step yang digabungkan.
 
     Returns:
-        Callable pipeline.
+        Callable pipeline (`Pipeline`).
 
     Examples:
         Pipelining beberapa fungsi preprocessing.
@@ -188,14 +696,49 @@ def pipeline(pipe: Sequence[Callable[[str], str]]) -> Callable[[str], str]:
         >>> pipe = pipeline([replace_word_elongation, replace_slang])
         >>> pipe("Knp emg gk mw makan kenapaaa???")
         "kenapa memang enggak mau makan kenapa???"
+
+        Menggabungkan step - step pipeline.
+
+        >>> pipe = pipeline([remove_html, replace_word_elongation, replace_slang], fuse=True)
+        >>> pipe("<b>Knp</b> emg gk mw makan kenapaaa???")
+        "kenapa memang enggak mau makan kenapa???"
+
+        Mencatat statistik setiap step.
+
+        >>> pipe = pipeline([replace_slang, remove_stopwords], instrument=True)
+        >>> pipe("gw gk mw makan")
+        "gue   makan"
+        >>> pipe.stats["remove_stopwords"]
+        StepStats(name='remove_stopwords', calls=1, time=0.0003, chars_in=20, chars_out=11, matches=2, skipped=0)
     """
-    # https://stackoverflow.com/a/57763458
-    def _run(value: str) -> str:
-        for step in pipe:
-            value = step(value)
-        return value
+    return Pipeline(
+        pipe,
+        fuse=fuse,
+        instrument=instrument,
+        callback=callback,
+        cache=cache,
+        prefilter=prefilter,
+    )
 
-    return _run
+
+def _emoji_to_words(
+    text: str,
+    lang: str = "id",
+    use_alias: bool = False,
+    delimiter: Tuple[str, str] = ("!", "!"),
+) -> Tuple[str, int]:
+    """`emoji_to_words` beserta jumlah penggantian"""
+
+    def _get_emoji_translation(_emoji: Dict[str, str]) -> str:
+        """Mendapatkan terjemahan emoji."""
+        if use_alias:
+            assert lang == "id", "use_alias hanya bekerja untuk Bahasa Indonesia `lang='id'`"
+            return delimiter[0] + _emoji.get("alias", _emoji["id"]) + delimiter[1]
+        return delimiter[0] + _emoji[lang] + delimiter[1]
+
+    assert lang in ["en", "id"], "Bahasa yang disupport hanya English (en) dan Indonesia (id)"
+    trie: CharTrie = _get("_EMOJI_TRIE")
+    return trie.subn(text, _get_emoji_translation)
 
 
 def emoji_to_words(
@@ -212,8 +755,9 @@ def emoji_to_words(
         lang (str, optional): Kode bahasa, bahasa yang tersedia yaitu "en" (English) dan "id"
             (Bahasa Indonesia).
         use_alias (bool, optional): Menggunakan alias translation, alias adalah terjemahan yang
-            lebih spesifik terhadap emoji tersebut. Tidak setiap emoji memiliki alias dan `use_alias`
-            hanya didukung untuk Bahasa Indonesia `lang="id"`.
+            lebih spesifik terhadap emoji tersebut. Tidak setiap emoji memiliki alias (terjemahan
+            "id" digunakan sebagai gantinya) dan `use_alias` hanya didukung untuk Bahasa Indonesia
+            `lang="id"`.
         delimiter (Tuple[str, str], optional): Delimiter (pembatas) pada terjemahan emoji, berupa
             tupple dengan dua element string sebagai pembatas awal dan akhir.
 
@@ -245,17 +789,59 @@ def emoji_to_words(
         >>> indoNLP.preprocessing.emoji_to_words("emoji 😁", delimiter=("^","$"))
         "emoji ^wajah_gembira_dengan_mata_bahagia$"
     """
+    return _emoji_to_words(text, lang, use_alias, delimiter)[0]
 
-    def _get_emoji_translation(mo: Match[str]) -> str:
-        """Mendapatkan terjemahan emoji."""
-        _emoji = EMOJI_DATA[mo.group(0)]
-        if use_alias:
-            assert lang == "id", "use_alias hanya bekerja untuk Bahasa Indonesia `lang='id'`"
-            return delimiter[0] + _emoji["alias"] + delimiter[1]
-        return delimiter[0] + _emoji[lang] + delimiter[1]
 
+def _find_words_emoji(
+    text: str, lang: str, use_alias: bool, delimiter: Tuple[str, str]
+) -> Iterator[Tuple[int, int, str]]:
+    """Mencari kata - kata kode emoji, menghasilkan posisi awal, posisi akhir, dan emoji"""
     assert lang in ["en", "id"], "Bahasa yang disupport hanya English (en) dan Indonesia (id)"
-    return re.sub(EMOJI_PATTERN, _get_emoji_translation, text, flags=re.UNICODE)
+    if use_alias:
+        assert lang == "id", "use_alias hanya bekerja untuk Bahasa Indonesia `lang='id'`"
+    opener, names, max_length = _get_words_emoji_matcher(lang, use_alias, delimiter)
+    start_length, end = len(delimiter[0]), delimiter[1]
+
+    match = opener.search(text)
+    while match is not None:
+        start = match.start()
+        begin = start + start_length
+        # every closing delimiter within reach is a candidate, pick the one with the highest
+        # priority just like the order of the old regex alternation
+        best: Optional[Tuple[int, str]] = None
+        best_end = begin
+        close = text.find(end, begin + 1)
+        while close != -1 and close - begin <= max_length:
+            entry = names.get(text[begin:close])
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best, best_end = entry, close
+            close = text.find(end, close + 1)
+
+        if best is None:
+            match = opener.search(text, start + 1)
+            continue
+        yield start, best_end + len(end), best[1]
+        match = opener.search(text, best_end + len(end))
+
+
+def _words_to_emoji(
+    text: str,
+    lang: str = "id",
+    use_alias: bool = False,
+    delimiter: Tuple[str, str] = ("!", "!"),
+) -> Tuple[str, int]:
+    """`words_to_emoji` beserta jumlah penggantian"""
+    result: List[str] = []
+    cursor = 0
+    for start, end, value in _find_words_emoji(text, lang, use_alias, delimiter):
+        result.append(text[cursor:start])
+        result.append(value)
+        cursor = end
+
+    if not result:
+        return text, 0
+    result.append(text[cursor:])
+    return "".join(result), len(result) // 2
 
 
 def words_to_emoji(
@@ -274,7 +860,14 @@ def words_to_emoji(
             lebih spesifik terhadap emoji tersebut. Tidak setiap emoji memiliki alias dan `use_alias`
             hanya didukung untuk Bahasa Indonesia `lang="id"`.
         delimiter (Tuple[str, str], optional): Delimiter (pembatas) pada kata - kata kode emoji,
-            berupa tupple dengan dua element string sebagai pembatas awal dan akhir.
+            berupa tupple dengan dua element string sebagai pembatas awal dan akhir. Delimiter
+            diperlakukan sebagai literal sehingga karakter seperti `^`, `$`, atau `|` dapat
+            digunakan.
+
+    !!! note
+        Kandidat kata - kata kode emoji dicari berdasarkan posisi delimiter dan dicocokkan
+        menggunakan *lookup* dictionary. Compiled pattern untuk setiap kombinasi `lang`,
+        `use_alias`, dan `delimiter` disimpan dalam cache.
 
     Returns:
         Teks yang telah di transformasi atau kata - kata yang mengandung kode emoji di dalam teks
@@ -301,16 +894,544 @@ def words_to_emoji(
         >>> indoNLP.preprocessing.emoji_to_words("emoji ^wajah_gembira_dengan_mata_bahagia$", delimiter=("^","$"))
         "emoji 😁"
     """
+    return _words_to_emoji(text, lang, use_alias, delimiter)[0]
+
+
+def _get_builtin_steps() -> Dict[str, Callable[..., str]]:
+    """Fungsi - fungsi preprocessing bawaan yang dapat digunakan sebagai step pipeline"""
+    return {
+        x.__name__: x
+        for x in (
+            remove_html,
+            strip_html,
+            remove_url,
+            remove_stopwords,
+            replace_slang,
+            replace_word_elongation,
+            emoji_to_words,
+            words_to_emoji,
+        )
+    }
+
+
+def _get_counted_steps() -> Dict[str, Callable[..., Tuple[str, int]]]:
+    """Versi fungsi - fungsi preprocessing bawaan yang juga mengembalikan jumlah penggantian"""
+    return {
+        "remove_html": _remove_html,
+        "strip_html": _strip_html,
+        "remove_url": _remove_url,
+        "remove_stopwords": _remove_stopwords,
+        "replace_slang": _replace_slang,
+        "replace_word_elongation": _replace_word_elongation,
+        "emoji_to_words": _emoji_to_words,
+        "words_to_emoji": _words_to_emoji,
+    }
+
+
+_WORD_CHAR_PATTERN = re.compile(r"\w")
+# every domain in `URL_PATTERN` has a dot directly followed by its (letters only) TLD
+_TLD_DOT_PATTERN = re.compile(r"(?i)[.][a-z]")
+
+
+def _may_contain_html(text: str, **params: Any) -> bool:
+    """Tag HTML selalu mengandung `<` dan entity HTML selalu mengandung `&`"""
+    return "<" in text or "&" in text
+
+
+def _may_contain_url(text: str) -> bool:
+    """Setiap match `URL_PATTERN` mengandung `:` (skema, contoh: `http:`) atau domain"""
+    return ":" in text or _TLD_DOT_PATTERN.search(text) is not None
+
+
+def _may_contain_words(text: str, **params: Any) -> bool:
+    """Setiap key maupun pattern `WordTrie` membutuhkan minimal satu karakter kata"""
+    return _WORD_CHAR_PATTERN.search(text) is not None
+
+
+def _valid_emoji_params(lang: str, use_alias: bool) -> bool:
+    """Parameter yang tidak valid tidak pernah dilewati sehingga step tetap menghasilkan error"""
+    return lang in ("en", "id") and (not use_alias or lang == "id")
+
+
+def _may_contain_emoji(
+    text: str, lang: str = "id", use_alias: bool = False, delimiter: Tuple[str, str] = ("!", "!")
+) -> bool:
+    """Setiap emoji pada `EMOJI_DATA` mengandung karakter non-ASCII"""
+    return not text.isascii() or not _valid_emoji_params(lang, use_alias)
+
+
+def _may_contain_words_emoji(
+    text: str, lang: str = "id", use_alias: bool = False, delimiter: Tuple[str, str] = ("!", "!")
+) -> bool:
+    """Kata - kata kode emoji selalu diawali delimiter pembuka"""
+    return delimiter[0] in text or not _valid_emoji_params(lang, use_alias)
+
+
+def _get_prefilters() -> Dict[str, Tuple[Optional[Callable[..., bool]], bool]]:
+    """*Quick-reject predicate* setiap step bawaan beserta apakah step melakukan `str.strip`.
+    Predicate menerima teks dan parameter step, `False` berarti step pasti tidak mengubah teks
+    selain `str.strip`. Step tanpa predicate selalu dijalankan."""
+    return {
+        "remove_html": (_may_contain_html, True),
+        "strip_html": (_may_contain_html, True),
+        "remove_url": (_may_contain_url, True),
+        "remove_stopwords": (_may_contain_words, True),
+        "replace_slang": (_may_contain_words, False),
+        # the single regex pass is as cheap as any check for doubled letters
+        "replace_word_elongation": (None, False),
+        "emoji_to_words": (_may_contain_emoji, False),
+        "words_to_emoji": (_may_contain_words_emoji, False),
+    }
+
+
+def _stage_prefilter(steps: Sequence[Tuple[str, Dict[str, Any]]]) -> Optional[_Prefilter]:
+    """Prefilter sebuah stage, mengembalikan hasil stage tanpa menjalankannya jika tidak ada step
+    yang dapat cocok dengan teks atau `None` jika stage harus dijalankan. `None` jika terdapat
+    step tanpa predicate."""
+    prefilters = _get_prefilters()
+    predicates: List[Callable[[str], bool]] = []
+    for name, params in steps:
+        predicate = prefilters[name][0]
+        if predicate is None:
+            return None
+        predicates.append(functools.partial(predicate, **params) if params else predicate)
+    strip = any(prefilters[x][1] for x, _ in steps)
+
+    def _run(value: str) -> Optional[str]:
+        for predicate in predicates:
+            if predicate(value):
+                return None
+        # stripping never adds characters, so every later step of the stage rejects as well
+        return value.strip() if strip else value
 
-    def _get_emoji(mo: Match[str]) -> str:
-        """Mendapatkan emoji berdasarkan kata - kata kode emoji."""
-        keyword = re.search(rf"{delimiter[0]}(.*?){delimiter[1]}", mo.group(0))
-        assert keyword is not None  # ensure type
-        return WORDS_EMOJI_DATA["alias" if use_alias else lang][keyword.group(1)]
+    return _run
 
-    assert lang in ["en", "id"], "Bahasa yang disupport hanya English (en) dan Indonesia (id)"
-    pattern = EN_WORDS_EMOJI_PATTERN if lang == "en" else ID_WORDS_EMOJI_PATTERN
-    if use_alias:
-        assert lang == "id", "use_alias hanya bekerja untuk Bahasa Indonesia `lang='id'`"
-        pattern = ALIAS_WORDS_EMOJI_PATTERN
-    return re.sub(rf"{delimiter[0]}{pattern}{delimiter[1]}", _get_emoji, text)
+
+def _parse_step(step: PipelineStep) -> Tuple[Union[str, Callable[[str], str]], Dict[str, Any]]:
+    """Mengubah step pipeline menjadi pasangan (nama step / custom callable, parameter)"""
+    builtins = _get_builtin_steps()
+    if isinstance(step, str):
+        name, params = step, {}
+    elif isinstance(step, (tuple, list)):
+        name, params = step[0], dict(step[1])
+    elif isinstance(step, functools.partial) and any(step.func is x for x in builtins.values()):
+        if step.args:
+            raise ValueError("Parameter step bawaan harus berupa keyword argument!")
+        name, params = step.func.__name__, dict(step.keywords)
+    elif any(step is x for x in builtins.values()):
+        return step.__name__, {}
+    elif callable(step):
+        return step, {}
+    else:
+        raise TypeError(f"Step pipeline tidak valid: {step!r}")
+
+    if name not in builtins:
+        raise ValueError(f"Step '{name}' bukan fungsi preprocessing indoNLP!")
+    # lists come from JSON descriptions, e.g. `delimiter`
+    params = {k: tuple(v) if isinstance(v, list) else v for k, v in params.items()}
+    inspect.signature(builtins[name]).bind("", **params)  # raises TypeError on unknown params
+    return name, params
+
+
+def _code_fingerprint(code: CodeType) -> List[Any]:
+    """Representasi *bytecode* custom step beserta konstanta dan nama yang digunakannya"""
+    consts = [_code_fingerprint(x) if isinstance(x, CodeType) else x for x in code.co_consts]
+    return [code.co_code.hex(), consts, list(code.co_names)]
+
+
+def _callable_fingerprint(step: Callable[..., Any]) -> List[Any]:
+    """Representasi custom step berdasarkan nama, kode, dan nilai yang digunakannya"""
+    if isinstance(step, functools.partial):
+        return [_callable_fingerprint(step.func), list(step.args), step.keywords]
+    module = getattr(step, "__module__", None)
+    name = f"{module}:{getattr(step, '__qualname__', type(step).__qualname__)}"
+    if isinstance(step, MethodType):
+        return [
+            name,
+            _callable_fingerprint(step.__func__),
+            getattr(step.__self__, "__dict__", None),
+        ]
+    if isinstance(step, FunctionType):
+        # a nested function may refer to itself through its closure
+        cells = [x.cell_contents for x in step.__closure__ or ()]
+        cells = [None if x is step else x for x in cells]
+        code = _code_fingerprint(step.__code__)
+        return [name, code, step.__defaults__, step.__kwdefaults__, cells]
+    call = getattr(type(step), "__call__", None)
+    if isinstance(call, FunctionType):  # callable object
+        return [name, _callable_fingerprint(call), getattr(step, "__dict__", None)]
+    return [name]  # builtin callables
+
+
+def _fingerprint_default(value: Any) -> Any:
+    """Representasi parameter step yang tidak dapat di-*serialize* sebagai JSON"""
+    if isinstance(value, (Lexicon, Vocabulary, FuzzyIndex)):
+        return value.fingerprint()
+    if isinstance(value, (FunctionType, MethodType, functools.partial)):
+        return _callable_fingerprint(value)
+    return repr(value)
+
+
+class Pipeline:
+    """Pipeline fungsi - fungsi preprocessing yang dapat di-*pickle* sehingga dapat digunakan
+    bersama `multiprocessing`, `concurrent.futures.ProcessPoolExecutor`, Spark, atau Dask.
+
+    Pipeline disimpan sebagai deskripsi yang ringkas (nama step beserta parameternya). Ketika
+    di-*unpickle* pada worker, pipeline dibuat ulang dari deskripsi tersebut dan data (kamus slang,
+    stopwords, emoji) hanya diload satu kali per proses ketika pertama kali digunakan.
+
+    Args:
+        steps (Sequence[PipelineStep]): Step - step pipeline, setiap step dapat berupa:
+
+            - Fungsi preprocessing `indoNLP` (contoh: `replace_slang`).
+            - Nama fungsi preprocessing `indoNLP` (contoh: `"replace_slang"`).
+            - Tuple nama fungsi dan parameternya (contoh: `("emoji_to_words", {"lang": "en"})`)
+                atau `functools.partial` dari fungsi preprocessing `indoNLP`.
+            - Callable lain (*custom step*), harus dapat di-*pickle* agar pipeline dapat
+                di-*pickle*.
+        fuse (bool, optional): Menggabungkan step - step bawaan yang berurutan, lihat `pipeline`.
+        instrument (bool, optional): Mencatat statistik setiap step, lihat `pipeline`.
+        callback (Callable[[StepStats], None], optional): Fungsi yang dipanggil dengan statistik
+            setiap pemanggilan step, lihat `pipeline`.
+        cache (LRUCache, optional): Cache hasil pipeline, lihat `pipeline`.
+        prefilter (bool, optional): Melewati step yang pasti tidak mengubah teks, lihat
+            `pipeline`.
+
+    Attributes:
+        stats (PipelineStats, optional): Statistik kumulatif setiap stage pipeline, `None` jika
+            instrumentasi tidak aktif. Step yang digabungkan (`fuse=True`) dicatat sebagai satu
+            stage dengan nama step - step tersebut dipisahkan `+`, nama yang muncul lebih dari
+            satu kali diberi akhiran `#2`, `#3`, dan seterusnya. Ketika pipeline dijalankan
+            menggunakan *process pool* (`Pipeline.map`), statistik dicatat pada salinan pipeline
+            di setiap worker sehingga gunakan `callback` untuk mengumpulkannya.
+
+    Raises:
+        ValueError: Nama step bukan fungsi preprocessing `indoNLP`.
+        TypeError: Step atau parameter step tidak valid.
+
+    Examples:
+        Membuat pipeline dan mendapatkan deskripsinya.
+
+        >>> pipe = indoNLP.preprocessing.Pipeline(
+        ...     ["replace_slang", ("emoji_to_words", {"lang": "en"})]
+        ... )
+        >>> pipe("gw 😀")
+        "gue !grinning_face!"
+        >>> pipe.describe()
+        ['replace_slang', ('emoji_to_words', {'lang': 'en'})]
+
+        Menggunakan pipeline dengan `multiprocessing`.
+
+        >>> with multiprocessing.Pool(4) as pool:
+        ...     pool.map(pipe, ["gw 😀", "yg 😁"])
+        ['gue !grinning_face!', 'yang !beaming_face_with_smiling_eyes!']
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[PipelineStep],
+        fuse: bool = False,
+        instrument: bool = False,
+        callback: Optional[Callable[[StepStats], None]] = None,
+        cache: Optional[LRUCache] = None,
+        prefilter: bool = True,
+    ) -> None:
+        self.fuse = fuse
+        self.cache = cache
+        self.prefilter = prefilter
+        self.callback = callback
+        self.instrument = instrument or callback is not None
+        self._steps = [_parse_step(x) for x in steps]
+        self._names, self._stages, self._prefilters = self._compile()
+        params = [x for _, y in self._steps for x in y.values()]
+        self._lexicons = [x for x in params if isinstance(x, (Lexicon, Vocabulary))]
+        self._owner = object()  # cache key prefix, a cache may be shared by several pipelines
+        self._fingerprint: Optional[Tuple[Tuple[int, ...], str]] = None
+        self.stats: Optional[PipelineStats] = None
+        if self.instrument:
+            self.stats = PipelineStats(self._names)
+
+    def _compile(self) -> Tuple[List[str], List[_Stage], List[Optional[_Prefilter]]]:
+        """Membuat nama, callable, dan prefilter untuk setiap stage"""
+        names: List[str] = []
+        stages: List[_Stage] = []
+        prefilters: List[Optional[_Prefilter]] = []
+        for name, stage, prefilter in _compile_pipeline(self._steps, self.fuse):
+            count = sum(x == name or x.startswith(name + "#") for x in names)
+            names.append(f"{name}#{count + 1}" if count else name)
+            stages.append(stage)
+            prefilters.append(prefilter if self.prefilter else None)
+        return names, stages, prefilters
+
+    def _lexicon_versions(self) -> Tuple[int, ...]:
+        """Versi leksikon - leksikon yang digunakan oleh step pipeline"""
+        return tuple(x.version for x in self._lexicons)
+
+    def _load_tables(self) -> None:
+        """Loading data yang dibutuhkan oleh step - step bawaan"""
+        builtins = _get_builtin_steps()
+        for step, params in self._steps:
+            if isinstance(step, str):
+                builtins[step]("", **params)
+
+    def map(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+        use_threads: bool = False,
+        buffer_size: Optional[int] = None,
+        disk_cache: Optional[DiskCache] = None,
+        shared_memory: bool = False,
+        scheduler: Optional["ChunkScheduler"] = None,
+    ) -> Iterator[str]:
+        """Menjalankan pipeline pada banyak teks sekaligus secara paralel menggunakan *process
+        pool* (default) atau *thread pool*. Data hanya diload satu kali per worker. Statistik
+        instrumentasi dan `callback` step yang dijalankan worker *process pool* dicatat pada
+        pipeline ini setiap kali sebuah chunk selesai.
+
+        Args:
+            texts (Iterable[str]): Iterable teks, dapat berupa iterable tanpa akhir (*generator*).
+            workers (int, optional): Jumlah worker, default `os.cpu_count()`. Jika `workers <= 1`
+                maka teks diproses secara berurutan pada proses utama.
+            chunksize (int, optional): Jumlah teks yang dikirim ke worker dalam satu task.
+            use_threads (bool, optional): Menggunakan *thread pool* sebagai pengganti *process
+                pool*.
+            buffer_size (int, optional): Jumlah maksimum chunk yang sedang diproses atau menunggu
+                giliran untuk dikembalikan, default `2 * workers`.
+            disk_cache (DiskCache, optional): Cache persisten
+                (`indoNLP.preprocessing.cache.DiskCache`), setiap chunk dicari dan disimpan ke
+                dalam cache sekaligus sehingga hanya teks yang belum pernah diproses yang
+                dijalankan pada pipeline.
+            shared_memory (bool, optional): Mengirim teks ke *process pool* melalui
+                `multiprocessing.shared_memory` (python 3.8+). Teks dikemas dalam satu buffer
+                UTF-8 beserta offsetnya, worker membaca bagian chunknya secara langsung dan
+                menulis hasilnya ke buffer output sehingga teks tidak di-*pickle*. Mengurangi
+                beban proses utama ketika jumlah worker banyak. Diabaikan pada *thread pool* dan
+                python 3.7.
+            scheduler (ChunkScheduler, optional): Membuat chunk berdasarkan jumlah karakter yang
+                disesuaikan dengan throughput worker sebagai pengganti `chunksize`
+                (`indoNLP.preprocessing.batch.ChunkScheduler`), utilisasi setiap worker dicatat
+                pada scheduler.
+
+        Returns:
+            Iterator teks hasil preprocessing sesuai dengan urutan input.
+
+        Examples:
+            >>> pipe = indoNLP.preprocessing.pipeline([replace_word_elongation, replace_slang])
+            >>> list(pipe.map(["gw gk mw", "emg yg nanyaaa?"], workers=2))
+            ['gue enggak mau', 'memang yang bertanya?']
+        """
+        from indoNLP.preprocessing.batch import imap
+
+        return imap(
+            self,
+            texts,
+            workers,
+            chunksize,
+            use_threads,
+            buffer_size,
+            disk_cache,
+            shared_memory,
+            scheduler,
+        )
+
+    async def arun(
+        self,
+        text: str,
+        executor: Optional["Executor"] = None,
+        inline_threshold: int = 128,
+    ) -> str:
+        """Menjalankan pipeline pada sebuah teks dari `asyncio` tanpa memblokir event loop, lihat
+        `indoNLP.preprocessing.aio.arun`.
+
+        Args:
+            text (str): Teks input.
+            executor (Executor, optional): Executor yang menjalankan pipeline, default executor
+                bawaan event loop (*thread pool*). Gunakan
+                `indoNLP.preprocessing.batch.PipelineExecutor` untuk *process pool*.
+            inline_threshold (int, optional): Teks dengan panjang tidak lebih dari
+                `inline_threshold` karakter dijalankan langsung pada event loop.
+
+        Returns:
+            Teks hasil preprocessing.
+
+        Examples:
+            >>> pipe = indoNLP.preprocessing.pipeline([replace_slang, remove_stopwords])
+            >>> await pipe.arun("gw gk mw makan")
+            'gue   makan'
+        """
+        from indoNLP.preprocessing.aio import arun
+
+        return await arun(self, text, executor, inline_threshold)
+
+    def amap(
+        self,
+        texts: Union[Iterable[str], AsyncIterable[str]],
+        executor: Optional["Executor"] = None,
+        chunksize: int = 64,
+        buffer_size: Optional[int] = None,
+        inline_threshold: int = 128,
+    ) -> AsyncIterator[str]:
+        """Menjalankan pipeline pada setiap teks dari (*async*) iterable tanpa memblokir event
+        loop, input dibaca sesuai dengan kecepatan pemrosesan (*backpressure*). Lihat
+        `indoNLP.preprocessing.aio.amap` untuk argumen lainnya.
+
+        Args:
+            texts (Union[Iterable[str], AsyncIterable[str]]): Teks input.
+            executor (Executor, optional): Executor yang menjalankan pipeline, lihat `arun`.
+
+        Returns:
+            Async iterator teks hasil preprocessing sesuai dengan urutan input.
+
+        Examples:
+            >>> async for text in pipe.amap(stream):
+            ...     print(text)
+        """
+        from indoNLP.preprocessing.aio import amap
+
+        return amap(self, texts, executor, chunksize, buffer_size, inline_threshold)
+
+    def annotate(self, text: str) -> "Annotation":
+        """Menjalankan pipeline dalam mode anotasi. Setiap step menghasilkan perubahan
+        (`indoNLP.preprocessing.spans.Span`) yang digabungkan relatif terhadap teks asli sehingga
+        posisi setiap slang, stopwords, URL, HTML, dan emoji pada teks asli dapat diketahui.
+
+        Args:
+            text (str): Teks input.
+
+        Returns:
+            Anotasi perubahan relatif terhadap teks asli (`indoNLP.preprocessing.spans.Annotation`).
+
+        Examples:
+            >>> pipe = indoNLP.preprocessing.pipeline([replace_slang, remove_stopwords])
+            >>> annotation = pipe.annotate("gw mw nasi goreng")
+            >>> annotation.spans
+            [Span(start=0, end=2, kind='replace_slang', replacement='gue'),
+             Span(start=3, end=5, kind='replace_slang+remove_stopwords', replacement='')]
+            >>> annotation.apply()
+            'gue  nasi goreng'
+        """
+        from indoNLP.preprocessing.spans import annotate
+
+        return annotate(self, text)
+
+    def fingerprint(self) -> str:
+        """Mendapatkan fingerprint pipeline yang stabil antar proses berdasarkan step - step
+        beserta parameternya, versi `indoNLP`, dan data leksikon (termasuk isi
+        `indoNLP.preprocessing.lexicon.Lexicon` yang digunakan sebagai parameter step). Custom step
+        diidentifikasi berdasarkan nama, *bytecode*, konstanta, nilai default parameter, dan isi
+        *closure*-nya, nilai variabel global yang digunakan custom step tidak termasuk. `fuse`,
+        instrumentasi, dan cache tidak mengubah hasil pipeline sehingga tidak mempengaruhi
+        fingerprint.
+
+        Returns:
+            Fingerprint (sha256) pipeline.
+        """
+        versions = self._lexicon_versions()
+        if self._fingerprint is None or self._fingerprint[0] != versions:
+            from indoNLP import __version__
+            from indoNLP.preprocessing.snapshot import source_fingerprint
+
+            steps: List[Any] = []
+            for step, params in self._steps:
+                steps.append(
+                    [step if isinstance(step, str) else _callable_fingerprint(step), params]
+                )
+            description = {"steps": steps, "version": __version__, "data": source_fingerprint()}
+            payload = json.dumps(description, sort_keys=True, default=_fingerprint_default)
+            self._fingerprint = (versions, hashlib.sha256(payload.encode("utf-8")).hexdigest())
+        return self._fingerprint[1]
+
+    def describe(self) -> List[PipelineStep]:
+        """Mendapatkan deskripsi pipeline.
+
+        Returns:
+            List step pipeline berupa nama step, tuple nama step dan parameternya, atau custom
+                callable. Deskripsi dapat digunakan kembali untuk membuat `Pipeline`.
+        """
+        description: List[PipelineStep] = []
+        for step, params in self._steps:
+            description.append((step, dict(params)) if isinstance(step, str) and params else step)
+        return description
+
+    def _run_instrumented(self, text: str) -> str:
+        """Menjalankan pipeline sekaligus mencatat statistik setiap stage"""
+        assert self.stats is not None  # ensure type
+        callback = self.callback
+        # recorded at once under the stats lock, the pipeline may run in several threads
+        results: List[Tuple[float, int, int, int, int]] = []
+        try:
+            for stage, prefilter, name in zip(self._stages, self._prefilters, self._names):
+                chars_in = len(text)
+                start = time.perf_counter()
+                result = None if prefilter is None else prefilter(text)
+                if result is None:
+                    text, matches = stage(text)
+                else:
+                    text, matches = result, 0
+                elapsed = time.perf_counter() - start
+                skipped = int(result is not None)
+                results.append((elapsed, chars_in, len(text), matches, skipped))
+                if callback is not None:
+                    callback(StepStats(name, 1, elapsed, chars_in, len(text), matches, skipped))
+        finally:
+            self.stats.update(results)
+        return text
+
+    def _run_cached(self, text: str, cache: LRUCache) -> str:
+        """Menjalankan pipeline hanya untuk teks yang tidak ditemukan dalam cache"""
+        if not cache.accepts(text):
+            return self._run(text)
+        # a modified lexicon gets a new key, stale results are evicted eventually
+        key = (self._owner, self._lexicon_versions(), text)
+        result = cache.get(key)
+        if result is None:
+            result = self._run(text)
+            cache.put(key, text, result)
+        return result
+
+    def __call__(self, text: str) -> str:
+        if self.cache is not None:
+            return self._run_cached(text, self.cache)
+        return self._run(text)
+
+    def _run(self, text: str) -> str:
+        """Menjalankan setiap stage pipeline"""
+        # https://stackoverflow.com/a/57763458
+        if self.instrument:
+            return self._run_instrumented(text)
+        for stage, prefilter in zip(self._stages, self._prefilters):
+            if prefilter is not None:
+                result = prefilter(text)
+                if result is not None:
+                    text = result
+                    continue
+            text = stage(text)[0]
+        return text
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        args = (
+            self.describe(),
+            self.fuse,
+            self.instrument,
+            self.callback,
+            self.cache,
+            self.prefilter,
+        )
+        return (Pipeline, args)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Pipeline):
+            return NotImplemented
+        return self._steps == other._steps and self.fuse == other.fuse
+
+    def __hash__(self) -> int:
+        steps = tuple((step, tuple(sorted(params.items()))) for step, params in self._steps)
+        try:
+            return hash((steps, self.fuse))
+        except TypeError:  # unhashable step parameters
+            return hash((self.fingerprint(), self.fuse))
+
+    def __repr__(self) -> str:
+        return f"Pipeline({self.describe()!r}, fuse={self.fuse}, instrument={self.instrument})"
@@ -0,0 +1,208 @@
+"""Antarmuka `asyncio` untuk pipeline preprocessing.
+
+Fungsi preprocessing bersifat *CPU-bound* sehingga teks yang panjang (contoh: halaman HTML) akan
+memblokir *event loop* jika dijalankan secara langsung. `arun` dan `amap` menjalankan pipeline
+pada executor (default: *thread pool* bawaan event loop) lalu menunggu hasilnya tanpa memblokir
+event loop. Teks pendek dijalankan langsung pada event loop karena lebih cepat daripada biaya
+mengirimnya ke executor (lihat `inline_threshold`).
+
+Regex dan *trie* tidak melepaskan GIL sehingga *thread pool* tetap dapat memperlambat event loop
+ketika teksnya sangat panjang. Gunakan `indoNLP.preprocessing.batch.PipelineExecutor` sebagai
+executor *process pool* untuk teks seperti ini, setiap workernya menyimpan pipeline beserta datanya
+sejak worker dimulai. Executor *process pool* lain akan menerima salinan pipeline pada setiap task
+sehingga statistik instrumentasi salinan tersebut tidak dicatat pada pipeline.
+
+Examples:
+    >>> pipe = indoNLP.preprocessing.pipeline([replace_slang, remove_stopwords])
+    >>> await pipe.arun("gw gk mw makan")
+    'gue   makan'
+
+    Memproses *stream* teks menggunakan *process pool*.
+
+    >>> with PipelineExecutor(pipe, workers=4) as executor:
+    ...     async for text in pipe.amap(stream, executor=executor):
+    ...         await sink.write(text)
+"""
+
+import asyncio
+import collections
+import functools
+import os
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Deque, Iterable, List, Optional, Tuple, Union
+
+from indoNLP.preprocessing import Pipeline
+from indoNLP.preprocessing.batch import (
+    PipelineExecutor,
+    _merge_steps,
+    _run_chunk,
+    _run_worker_chunk,
+)
+
+__all__ = ["arun", "amap", "DEFAULT_INLINE_THRESHOLD"]
+
+# a short text is processed faster than the round trip to a worker thread
+DEFAULT_INLINE_THRESHOLD = 128
+DEFAULT_ASYNC_CHUNKSIZE = 64
+
+
+class _End:
+    """Penanda akhir input `amap` beserta error dari iterable input"""
+
+    def __init__(self, error: Optional[BaseException] = None) -> None:
+        self.error = error
+
+
+async def _run_worker(pipe: Pipeline, executor: PipelineExecutor, chunk: List[str]) -> List[str]:
+    """Menjalankan chunk pada worker `PipelineExecutor` yang sudah menyimpan pipeline"""
+    loop = asyncio.get_running_loop()
+    results, steps = await loop.run_in_executor(executor, _run_worker_chunk, chunk)
+    _merge_steps(pipe, steps)
+    return results
+
+
+def _dispatch(
+    pipe: Pipeline, chunk: List[str], executor: Optional[Executor], inline_threshold: int
+) -> "asyncio.Future[List[str]]":
+    """Menjalankan chunk pada executor, atau langsung jika teksnya pendek"""
+    loop = asyncio.get_running_loop()
+    if sum(len(x) for x in chunk) > inline_threshold:
+        if isinstance(executor, PipelineExecutor) and executor.pipeline is pipe:
+            return loop.create_task(_run_worker(pipe, executor, chunk))
+        return loop.run_in_executor(executor, functools.partial(_run_chunk, pipe), chunk)
+    future: "asyncio.Future[List[str]]" = loop.create_future()
+    try:
+        future.set_result([pipe(x) for x in chunk])
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+async def arun(
+    pipe: Pipeline,
+    text: str,
+    executor: Optional[Executor] = None,
+    inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+) -> str:
+    """Menjalankan pipeline pada sebuah teks tanpa memblokir event loop.
+
+    Args:
+        pipe (Pipeline): Pipeline yang dijalankan.
+        text (str): Teks input.
+        executor (Executor, optional): Executor yang menjalankan pipeline, default executor
+            bawaan event loop (*thread pool*).
+        inline_threshold (int, optional): Teks dengan panjang tidak lebih dari `inline_threshold`
+            karakter dijalankan langsung pada event loop.
+
+    Returns:
+        Teks hasil preprocessing.
+    """
+    if len(text) <= inline_threshold:
+        return pipe(text)
+    return (await _dispatch(pipe, [text], executor, inline_threshold))[0]
+
+
+async def _read(
+    texts: Union[Iterable[str], AsyncIterable[str]], queue: "asyncio.Queue[Any]"
+) -> None:
+    """Membaca input `amap` ke dalam queue berukuran terbatas"""
+    try:
+        if isinstance(texts, AsyncIterable):
+            async for text in texts:
+                await queue.put(text)
+        else:
+            for text in texts:
+                await queue.put(text)
+    except asyncio.CancelledError:  # still an `Exception` subclass on python 3.7
+        raise
+    except Exception as e:
+        await queue.put(_End(e))
+    else:
+        await queue.put(_End())
+
+
+def _drain(queue: "asyncio.Queue[Any]", first: Any, chunksize: int) -> Tuple[List[str], Any]:
+    """Mengambil teks yang sudah tersedia di queue hingga `chunksize` teks tanpa menunggu"""
+    chunk: List[str] = []
+    item = first
+    while not isinstance(item, _End):
+        chunk.append(item)
+        if len(chunk) >= chunksize:
+            return chunk, None
+        try:
+            item = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return chunk, None
+    return chunk, item
+
+
+async def amap(
+    pipe: Pipeline,
+    texts: Union[Iterable[str], AsyncIterable[str]],
+    executor: Optional[Executor] = None,
+    chunksize: int = DEFAULT_ASYNC_CHUNKSIZE,
+    buffer_size: Optional[int] = None,
+    inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+) -> AsyncIterator[str]:
+    """Menjalankan pipeline pada setiap teks dari (*async*) iterable tanpa memblokir event loop.
+
+    Teks yang sudah tersedia digabungkan menjadi chunk berisi hingga `chunksize` teks, chunk tidak
+    menunggu teks berikutnya sehingga input yang datang perlahan tetap diproses segera. Input
+    hanya dibaca ketika jumlah chunk yang sedang diproses kurang dari `buffer_size`
+    (*backpressure*) sehingga penggunaan memori tetap konstan.
+
+    Args:
+        pipe (Pipeline): Pipeline yang dijalankan.
+        texts (Union[Iterable[str], AsyncIterable[str]]): Teks input, iterable biasa dibaca pada
+            event loop sehingga tidak boleh memblokir.
+        executor (Executor, optional): Executor yang menjalankan pipeline, default executor
+            bawaan event loop (*thread pool*).
+        chunksize (int, optional): Jumlah maksimum teks yang dikirim ke executor dalam satu task.
+        buffer_size (int, optional): Jumlah maksimum chunk yang sedang diproses atau menunggu
+            giliran untuk dikembalikan, default `2 * os.cpu_count()`.
+        inline_threshold (int, optional): Chunk dengan total panjang teks tidak lebih dari
+            `inline_threshold` karakter dijalankan langsung pada event loop.
+
+    Yields:
+        Teks hasil preprocessing sesuai dengan urutan input.
+
+    Raises:
+        ValueError: `chunksize` lebih kecil dari 1.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize harus lebih besar dari 0!")
+    buffer_size = buffer_size or 2 * (os.cpu_count() or 1)
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(chunksize)
+    reader = loop.create_task(_read(texts, queue))
+    getter: Optional["asyncio.Future[Any]"] = None
+    # dispatched chunks in input order, the oldest one is always yielded first
+    pending: Deque["asyncio.Future[List[str]]"] = collections.deque()
+    end: Optional[_End] = None
+    try:
+        while end is None or pending:
+            if pending and pending[0].done():
+                for text in pending.popleft().result():
+                    yield text
+                continue
+            if end is not None or len(pending) >= buffer_size:
+                await asyncio.wait([pending[0]])
+                continue
+            if getter is None:
+                getter = loop.create_task(queue.get())
+            # wake up on new input or on the oldest result, whichever comes first
+            waiting = [getter, pending[0]] if pending else [getter]
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                chunk, end = _drain(queue, getter.result(), chunksize)
+                getter = None
+                if chunk:
+                    pending.append(_dispatch(pipe, chunk, executor, inline_threshold))
+        if end is not None and end.error is not None:
+            raise end.error
+    finally:
+        reader.cancel()
+        if getter is not None:
+            getter.cancel()
+        for future in pending:  # generator closed early or a chunk failed
+            future.cancel()
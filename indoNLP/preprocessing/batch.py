@@ -0,0 +1,799 @@
+"""Preprocessing banyak teks sekaligus (*batch*) secara paralel menggunakan *process pool* atau
+*thread pool*. Teks dikirim ke worker dalam bentuk *chunk* dan hasilnya dikembalikan sesuai urutan
+input melalui *reorder buffer* yang berukuran terbatas sehingga penggunaan memori tetap konstan
+walaupun input berupa iterable tanpa akhir.
+
+Examples:
+    >>> from indoNLP.preprocessing import batch
+    >>> list(batch.replace_slang(["gw gk mw", "emg yg nanya?"], workers=2))
+    ['gue enggak mau', 'memang yang bertanya?']
+"""
+
+import collections
+import functools
+import importlib.util
+import itertools
+import os
+import threading
+import time
+from array import array
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from indoNLP.preprocessing import Pipeline, PipelineStep
+from indoNLP.preprocessing.cache import DiskCache
+from indoNLP.preprocessing.html import DEFAULT_MAX_TAG_LENGTH
+from indoNLP.preprocessing.stats import StepStats, WorkerStats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from multiprocessing.shared_memory import SharedMemory
+
+__all__ = [
+    "imap",
+    "PipelineExecutor",
+    "ChunkScheduler",
+    "remove_html",
+    "strip_html",
+    "remove_url",
+    "remove_stopwords",
+    "replace_slang",
+    "replace_word_elongation",
+    "emoji_to_words",
+    "words_to_emoji",
+]
+
+DEFAULT_CHUNKSIZE = 256
+
+T = TypeVar("T")
+
+# output arena bytes reserved per input byte of a chunk, a chunk with a larger output (e.g.
+# `emoji_to_words`) is sent back through pickle instead
+_OUTPUT_RATIO = 2
+_OFFSET_SIZE = array("q").itemsize
+
+# shared memory name, number of texts, chunk start, chunk end, output shared memory name, output
+# region position and size, see `_SharedWindow`
+_SharedTask = Tuple[str, int, int, int, str, int, int]
+
+# time, chars in, chars out, matches, and skipped of every step called by a worker, in call order
+_Steps = List[Tuple[float, int, int, int, int]]
+
+# pipeline and disk cache of the current worker process, see `_init_worker`
+_worker_pipeline: Optional[Pipeline] = None
+_worker_cache: Optional[DiskCache] = None
+# steps called by the worker pipeline during the current chunk, see `_record_step`
+_worker_steps: _Steps = []
+
+
+def _init_worker(pipe: Pipeline, disk_cache: Optional[DiskCache] = None) -> None:
+    """Menyimpan pipeline dan loading data yang dibutuhkan satu kali per worker"""
+    global _worker_pipeline, _worker_cache
+    pipe._load_tables()
+    if pipe.instrument:  # the worker holds a copy, its steps are sent back to the parent
+        pipe.callback = _record_step
+    _worker_pipeline, _worker_cache = pipe, disk_cache
+
+
+def _record_step(step: StepStats) -> None:
+    """Mencatat statistik sebuah step yang dijalankan oleh pipeline worker"""
+    _worker_steps.append((step.time, step.chars_in, step.chars_out, step.matches, step.skipped))
+
+
+def _run_worker_chunk(chunk: List[str]) -> Tuple[List[str], _Steps]:
+    """Menjalankan pipeline worker pada sebuah chunk beserta statistik step - step yang
+    dijalankan"""
+    assert _worker_pipeline is not None, "Worker belum diinisiasi!"
+    try:
+        return _run_chunk(_worker_pipeline, chunk, _worker_cache), list(_worker_steps)
+    finally:
+        _worker_steps.clear()
+
+
+def _merge_steps(pipe: Pipeline, steps: _Steps) -> None:
+    """Mencatat statistik step - step yang dijalankan oleh worker *process pool* pada statistik
+    dan callback pipeline proses utama"""
+    if pipe.stats is None or not steps:
+        return
+    size = len(pipe.stats)
+    for start in range(0, len(steps), size):  # every call records each step in order
+        pipe.stats.update(steps[start : start + size])
+    if pipe.callback is not None:
+        for name, step in zip(itertools.cycle([x.name for x in pipe.stats]), steps):
+            pipe.callback(StepStats(name, 1, *step))
+
+
+def _run_chunk(
+    pipe: Pipeline, chunk: List[str], disk_cache: Optional[DiskCache] = None
+) -> List[str]:
+    """Menjalankan pipeline pada sebuah chunk, hanya teks yang tidak ada di dalam cache yang
+    diproses"""
+    if disk_cache is None:
+        return [pipe(x) for x in chunk]
+    fingerprint = pipe.fingerprint()
+    cached = disk_cache.get_many(fingerprint, chunk)
+    results = [pipe(x) if y is None else y for x, y in zip(chunk, cached)]
+    disk_cache.put_many(
+        fingerprint, [(x, y) for x, y, z in zip(chunk, results, cached) if z is None]
+    )
+    return results
+
+
+def _chunks(texts: Iterable[T], chunksize: int) -> Iterator[List[T]]:
+    """Memecah iterable menjadi list - list berukuran `chunksize`"""
+    iterator = iter(texts)
+    chunk = list(itertools.islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, chunksize))
+
+
+def _encode(texts: Sequence[str]) -> Tuple[bytes, "array[int]"]:
+    """Encode teks - teks menjadi satu buffer UTF-8 beserta offset byte setiap teks"""
+    joined = "".join(texts)
+    data = joined.encode("utf-8", "surrogatepass")
+    if len(data) == len(joined):  # ascii only, byte offsets are character offsets
+        lengths: Iterable[int] = map(len, texts)
+    else:
+        encoded = [x.encode("utf-8", "surrogatepass") for x in texts]
+        lengths = map(len, encoded)
+    offsets = array("q", [0])
+    offsets.extend(itertools.accumulate(lengths))
+    return data, offsets
+
+
+def _decode(data: bytes, offsets: "array[int]") -> List[str]:
+    """Decode teks - teks dari buffer UTF-8, `offsets[0]` merupakan posisi awal `data`"""
+    first = offsets[0]
+    text = data.decode("utf-8", "surrogatepass")
+    bounds = zip(offsets, itertools.islice(offsets, 1, None))
+    if len(text) == len(data):  # ascii only, slice the decoded text instead of the bytes
+        return [text[a - first : b - first] for a, b in bounds]
+    return [data[a - first : b - first].decode("utf-8", "surrogatepass") for a, b in bounds]
+
+
+def _read(memory: "SharedMemory", position: int, count: int, base: int) -> List[str]:
+    """Membaca `count` teks dengan offset pada posisi `position` relatif terhadap `base`"""
+    buffer = memory.buf
+    assert buffer is not None  # ensure type
+    offsets = array("q")
+    offsets.frombytes(buffer[position : position + _OFFSET_SIZE * (count + 1)])
+    return _decode(bytes(buffer[base + offsets[0] : base + offsets[-1]]), offsets)
+
+
+def _write(memory: "SharedMemory", position: int, data: bytes, offsets: "array[int]") -> None:
+    """Menulis offset lalu data teks - teks pada posisi `position`, kebalikan dari `_read`"""
+    buffer = memory.buf
+    assert buffer is not None  # ensure type
+    header = offsets.tobytes()
+    buffer[position : position + len(header)] = header
+    buffer[position + len(header) : position + len(header) + len(data)] = data
+
+
+class _SharedWindow:
+    """Sekumpulan chunk yang dikirim ke worker melalui satu shared memory input (offset dan data
+    UTF-8 semua teks) dan satu shared memory output (satu region untuk setiap chunk)"""
+
+    def __init__(self, chunks: List[List[str]]) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        texts = list(itertools.chain.from_iterable(chunks))
+        self._chars = [sum(map(len, x)) for x in chunks]
+        data, offsets = _encode(texts)
+        regions: List[Tuple[int, int, int, int]] = []
+        start = position = 0
+        for chunk in chunks:
+            end = start + len(chunk)
+            size = _OFFSET_SIZE * (end - start + 1)
+            size += _OUTPUT_RATIO * (offsets[end] - offsets[start])
+            regions.append((start, end, position, size))
+            start, position = end, position + size
+
+        self.input = SharedMemory(create=True, size=max(1, _OFFSET_SIZE * len(offsets) + len(data)))
+        try:
+            self.output = SharedMemory(create=True, size=max(1, position))
+        except BaseException:
+            self.input.close()
+            self.input.unlink()
+            raise
+        _write(self.input, 0, data, offsets)
+        self.tasks: List[_SharedTask] = [
+            (self.input.name, len(texts), start, end, self.output.name, position, size)
+            for start, end, position, size in regions
+        ]
+
+    def result(self, index: int, value: Optional[List[str]]) -> List[str]:
+        """Hasil sebuah chunk, dibaca dari shared memory output jika tidak dikirim langsung"""
+        if value is not None:
+            return value
+        _, _, start, end, _, position, _ = self.tasks[index]
+        count = end - start
+        return _read(self.output, position, count, position + _OFFSET_SIZE * (count + 1))
+
+    def chars(self, index: int) -> int:
+        """Jumlah karakter input sebuah chunk"""
+        return self._chars[index]
+
+    def close(self) -> None:
+        """Menghapus shared memory"""
+        for memory in (self.input, self.output):
+            memory.close()
+            memory.unlink()
+
+
+def _run_shared_chunk(task: _SharedTask) -> Tuple[Optional[List[str]], _Steps]:
+    """Menjalankan pipeline worker pada sebuah chunk shared memory, hasil ditulis ke region output
+    chunk tersebut atau dikembalikan langsung jika tidak muat"""
+    from multiprocessing.shared_memory import SharedMemory
+
+    name, count, start, end, output_name, position, size = task
+    memory = SharedMemory(name)
+    try:
+        # the offsets of every text are stored before the data
+        chunk = _read(memory, _OFFSET_SIZE * start, end - start, _OFFSET_SIZE * (count + 1))
+    finally:
+        memory.close()
+
+    results, steps = _run_worker_chunk(chunk)
+    data, offsets = _encode(results)
+    if _OFFSET_SIZE * len(offsets) + len(data) > size:
+        return results, steps
+    memory = SharedMemory(output_name)
+    try:
+        _write(memory, position, data, offsets)
+    finally:
+        memory.close()
+    return None, steps
+
+
+def _has_shared_memory() -> bool:
+    """`multiprocessing.shared_memory` tersedia (python 3.8+)"""
+    return importlib.util.find_spec("multiprocessing.shared_memory") is not None
+
+
+def _timed(function: Callable[[Any], Any], task: Any) -> Tuple[Any, str, float, float]:
+    """Menjalankan task sekaligus mencatat worker, waktu eksekusi, dan waktu CPU-nya"""
+    start, cpu = time.perf_counter(), time.thread_time()
+    result = function(task)
+    worker = f"{os.getpid()}/{threading.current_thread().name}"
+    return result, worker, time.perf_counter() - start, time.thread_time() - cpu
+
+
+class ChunkScheduler:
+    """Penjadwal chunk `imap` berdasarkan jumlah karakter sebagai pengganti jumlah teks.
+
+    Teks dikumpulkan ke dalam chunk hingga total biayanya (jumlah karakter ditambah
+    `text_overhead` untuk setiap teks) mencapai `chunk_chars` sehingga setiap task memiliki beban
+    yang seimbang walaupun panjang teks sangat bervariasi. Teks yang lebih panjang dari
+    `chunk_chars` dikirim sebagai task tersendiri. Jika `target_time` diberikan, `chunk_chars`
+    disesuaikan dari throughput (karakter per detik) yang terukur sehingga setiap task berjalan
+    sekitar `target_time` detik.
+
+    Scheduler mencatat statistik setiap worker (`WorkerStats`) sehingga utilisasi worker dapat
+    digunakan untuk mengatur parameter scheduler. Scheduler hanya digunakan jika `workers > 1`.
+
+    Args:
+        chunk_chars (int, optional): Ukuran awal chunk dalam karakter.
+        target_time (float, optional): Target waktu eksekusi setiap task dalam detik, `None` untuk
+            ukuran chunk yang tetap.
+        min_chars (int, optional): Ukuran minimum chunk dalam karakter.
+        max_chars (int, optional): Ukuran maksimum chunk dalam karakter.
+        text_overhead (int, optional): Biaya tetap pemrosesan setiap teks dalam karakter, teks
+            pendek tetap memiliki biaya pemanggilan pipeline.
+
+    Attributes:
+        chunk_chars (int): Ukuran chunk saat ini dalam karakter.
+        workers (Dict[str, WorkerStats]): Statistik setiap worker.
+        tasks (int): Jumlah task yang telah selesai.
+        oversized (int): Jumlah teks yang dikirim sebagai task tersendiri.
+        elapsed (float): Waktu total (*wall time*) `imap` yang menggunakan scheduler dalam detik.
+
+    Raises:
+        ValueError: `min_chars` lebih kecil dari 1 atau lebih besar dari `max_chars`.
+
+    Examples:
+        >>> scheduler = ChunkScheduler(target_time=0.1)
+        >>> results = list(pipe.map(texts, workers=4, scheduler=scheduler))
+        >>> scheduler.chunk_chars
+        183296
+        >>> print(scheduler.summary())
+        worker            tasks      texts        chars   time (s)    cpu (s)  max (s)   util
+        ---------------------------------------------------------------------------------------
+        4334/MainThread      47      13842      5939505     2.2791     2.2102   0.0888  93.9%
+        ...
+    """
+
+    def __init__(
+        self,
+        chunk_chars: int = 65536,
+        target_time: Optional[float] = 0.05,
+        min_chars: int = 1024,
+        max_chars: int = 1 << 22,
+        text_overhead: int = 64,
+    ) -> None:
+        if min_chars < 1 or min_chars > max_chars:
+            raise ValueError("min_chars harus lebih besar dari 0 dan tidak lebih dari max_chars!")
+        self.chunk_chars = min(max(chunk_chars, min_chars), max_chars)
+        self.target_time = target_time
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.text_overhead = text_overhead
+        self.workers: Dict[str, WorkerStats] = {}
+        self.tasks = 0
+        self.oversized = 0
+        self.elapsed = 0.0
+        self._rate: Optional[float] = None
+        self._started: Optional[float] = None
+
+    def _chunks(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        """Memecah iterable menjadi chunk - chunk berukuran `chunk_chars` karakter"""
+        chunk: List[str] = []
+        cost = 0
+        for text in texts:
+            size = len(text) + self.text_overhead
+            if size >= self.chunk_chars:  # an oversized document gets a task of its own
+                if chunk:
+                    yield chunk
+                    chunk, cost = [], 0
+                self.oversized += 1
+                yield [text]
+                continue
+            chunk.append(text)
+            cost += size
+            if cost >= self.chunk_chars:  # read again for every chunk, it follows `_record`
+                yield chunk
+                chunk, cost = [], 0
+        if chunk:
+            yield chunk
+
+    def _start(self) -> None:
+        """Menandai awal `imap`"""
+        self._started = time.perf_counter()
+
+    def _stop(self) -> None:
+        """Menandai akhir `imap`"""
+        if self._started is not None:
+            self.elapsed += time.perf_counter() - self._started
+            self._started = None
+
+    def _record(self, worker: str, texts: int, chars: int, elapsed: float, cpu: float) -> None:
+        """Mencatat task yang telah selesai lalu menyesuaikan ukuran chunk"""
+        self.workers.setdefault(worker, WorkerStats(worker)).update(texts, chars, elapsed, cpu)
+        self.tasks += 1
+        if self.target_time is None or elapsed <= 0:
+            return
+        rate = (chars + texts * self.text_overhead) / elapsed
+        # exponential moving average, a single slow task does not shrink the chunks at once
+        self._rate = rate if self._rate is None else 0.8 * self._rate + 0.2 * rate
+        budget = int(self._rate * self.target_time)
+        self.chunk_chars = min(max(budget, self.min_chars), self.max_chars)
+
+    def utilization(self) -> Dict[str, float]:
+        """Mendapatkan utilisasi setiap worker, yaitu rasio waktu CPU worker terhadap waktu total.
+        Utilisasi yang rendah menunjukkan worker menunggu task (chunk terlalu kecil atau input
+        lambat) atau menunggu CPU / GIL.
+
+        Returns:
+            Dictionary worker ke utilisasinya (`0.0` - `1.0`).
+        """
+        elapsed = self.elapsed
+        if self._started is not None:
+            elapsed += time.perf_counter() - self._started
+        return {
+            k: min(v.cpu_time / elapsed, 1.0) if elapsed else 0.0 for k, v in self.workers.items()
+        }
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Mendapatkan statistik setiap worker beserta utilisasinya, misalnya untuk diekspor ke
+        sistem *metrics*.
+
+        Returns:
+            Dictionary worker ke statistiknya.
+        """
+        utilization = self.utilization()
+        return {
+            k: {
+                **{x: y for x, y in asdict(v).items() if x != "worker"},
+                "utilization": utilization[k],
+            }
+            for k, v in self.workers.items()
+        }
+
+    def summary(self) -> str:
+        """Ringkasan statistik setiap worker dalam bentuk tabel.
+
+        Returns:
+            Tabel statistik setiap worker.
+        """
+        utilization = self.utilization()
+        width = max([len("worker")] + [len(x) for x in self.workers])
+        header = (
+            f"{'worker':<{width}} {'tasks':>8} {'texts':>10} {'chars':>12} {'time (s)':>10}"
+            f" {'cpu (s)':>10} {'max (s)':>8} {'util':>6}"
+        )
+        rows: List[str] = [header, "-" * len(header)]
+        for k, x in self.workers.items():
+            rows.append(
+                f"{k:<{width}} {x.tasks:>8} {x.texts:>10} {x.chars:>12} {x.time:>10.4f}"
+                f" {x.cpu_time:>10.4f} {x.max_time:>8.4f} {utilization[k]:>6.1%}"
+            )
+        rows.append(
+            f"chunk_chars={self.chunk_chars} tasks={self.tasks} oversized={self.oversized}"
+            f" elapsed={self.elapsed:.4f}s"
+        )
+        return "\n".join(rows)
+
+    def __repr__(self) -> str:
+        return (
+            f"ChunkScheduler(chunk_chars={self.chunk_chars}, target_time={self.target_time}, "
+            f"workers={len(self.workers)}, tasks={self.tasks})"
+        )
+
+
+class PipelineExecutor(ProcessPoolExecutor):
+    """*Process pool* yang setiap workernya menyimpan sebuah pipeline beserta datanya sejak worker
+    dimulai sehingga pipeline tidak perlu dikirim dan data tidak perlu diload ulang pada setiap
+    task. Digunakan oleh `imap` dan `indoNLP.preprocessing.aio`.
+
+    Args:
+        pipe (Pipeline): Pipeline yang dijalankan oleh worker.
+        workers (int, optional): Jumlah worker, default `os.cpu_count()`.
+        disk_cache (DiskCache, optional): Cache persisten hasil pipeline.
+
+    Examples:
+        >>> pipe = indoNLP.preprocessing.pipeline([replace_slang, remove_stopwords])
+        >>> with PipelineExecutor(pipe, workers=4) as executor:
+        ...     await pipe.arun(text, executor=executor)
+    """
+
+    def __init__(
+        self, pipe: Pipeline, workers: Optional[int] = None, disk_cache: Optional[DiskCache] = None
+    ) -> None:
+        super().__init__(workers, initializer=_init_worker, initargs=(pipe, disk_cache))
+        self.pipeline = pipe
+
+
+def _create_executor(
+    pipe: Pipeline, workers: int, use_threads: bool, disk_cache: Optional[DiskCache]
+) -> Tuple[Executor, Any]:
+    """Membuat executor beserta fungsi yang dijalankan untuk setiap chunk"""
+    if use_threads:
+        pipe._load_tables()  # shared by every thread, the statistics are recorded directly
+        return ThreadPoolExecutor(workers), lambda chunk: (_run_chunk(pipe, chunk, disk_cache), [])
+    return PipelineExecutor(pipe, workers, disk_cache), _run_worker_chunk
+
+
+def imap(
+    pipe: Pipeline,
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+    buffer_size: Optional[int] = None,
+    disk_cache: Optional[DiskCache] = None,
+    shared_memory: bool = False,
+    scheduler: Optional[ChunkScheduler] = None,
+) -> Iterator[str]:
+    """Menjalankan pipeline pada setiap teks secara paralel.
+
+    Args:
+        pipe (Pipeline): Pipeline yang dijalankan.
+        texts (Iterable[str]): Iterable teks, dapat berupa iterable tanpa akhir (*generator*).
+        workers (int, optional): Jumlah worker, default `os.cpu_count()`. Jika `workers <= 1`
+            maka teks diproses secara berurutan pada proses utama.
+        chunksize (int, optional): Jumlah teks yang dikirim ke worker dalam satu task.
+        use_threads (bool, optional): Menggunakan *thread pool* sebagai pengganti *process pool*.
+        buffer_size (int, optional): Jumlah maksimum chunk yang sedang diproses atau menunggu
+            giliran untuk dikembalikan, default `2 * workers`.
+        disk_cache (DiskCache, optional): Cache persisten hasil pipeline, lihat `Pipeline.map`.
+        shared_memory (bool, optional): Mengirim teks ke *process pool* melalui
+            `multiprocessing.shared_memory` sebagai pengganti *pickle*, lihat `Pipeline.map`.
+            Diabaikan pada *thread pool* dan python 3.7.
+        scheduler (ChunkScheduler, optional): Membuat chunk berdasarkan jumlah karakter sebagai
+            pengganti `chunksize` sekaligus mencatat utilisasi setiap worker, lihat
+            `ChunkScheduler`.
+
+    Returns:
+        Iterator teks hasil preprocessing sesuai dengan urutan input.
+
+    Raises:
+        ValueError: `chunksize` lebih kecil dari 1.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize harus lebih besar dari 0!")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        if disk_cache is not None:
+            chunks = _chunks(texts, chunksize)
+            return itertools.chain.from_iterable(_run_chunk(pipe, x, disk_cache) for x in chunks)
+        return (pipe(x) for x in texts)
+    buffer_size = buffer_size or 2 * workers
+    chunks = _chunks(texts, chunksize) if scheduler is None else scheduler._chunks(texts)
+    if shared_memory and not use_threads and _has_shared_memory():
+        return _imap_shared(pipe, chunks, workers, buffer_size, disk_cache, scheduler)
+    return _imap(pipe, chunks, workers, use_threads, buffer_size, disk_cache, scheduler)
+
+
+def _imap(
+    pipe: Pipeline,
+    chunks: Iterable[List[str]],
+    workers: int,
+    use_threads: bool,
+    buffer_size: int,
+    disk_cache: Optional[DiskCache],
+    scheduler: Optional[ChunkScheduler],
+) -> Iterator[str]:
+    """Menjalankan pipeline pada setiap chunk menggunakan executor"""
+    executor, run = _create_executor(pipe, workers, use_threads, disk_cache)
+    # submitted chunks in input order, the oldest one is always yielded first
+    pending: Deque[Tuple["Future[Any]", List[str]]] = collections.deque()
+    if scheduler is not None:
+        run = functools.partial(_timed, run)
+        scheduler._start()
+
+    def pop() -> List[str]:
+        future, chunk = pending.popleft()
+        results: List[str]
+        if scheduler is None:
+            results, steps = future.result()
+        else:
+            (results, steps), worker, elapsed, cpu = future.result()
+            scheduler._record(worker, len(chunk), sum(map(len, chunk)), elapsed, cpu)
+        _merge_steps(pipe, steps)
+        return results
+
+    try:
+        for chunk in chunks:
+            if len(pending) >= buffer_size:
+                yield from pop()
+            pending.append((executor.submit(run, chunk), chunk))
+        while pending:
+            yield from pop()
+    finally:
+        for future, _ in pending:  # generator closed early or a chunk failed
+            future.cancel()
+        executor.shutdown(wait=True)
+        if scheduler is not None:
+            scheduler._stop()
+
+
+def _imap_shared(
+    pipe: Pipeline,
+    chunks: Iterable[List[str]],
+    workers: int,
+    buffer_size: int,
+    disk_cache: Optional[DiskCache],
+    scheduler: Optional[ChunkScheduler],
+) -> Iterator[str]:
+    """Menjalankan pipeline pada setiap chunk menggunakan *process pool* dan shared memory"""
+    executor = PipelineExecutor(pipe, workers, disk_cache)
+    run: Callable[[_SharedTask], Any] = _run_shared_chunk
+    if scheduler is not None:
+        run = functools.partial(_timed, run)
+        scheduler._start()
+    windows: Deque[_SharedWindow] = collections.deque()
+    pending: Deque[Tuple["Future[Any]", _SharedWindow, int]] = collections.deque()
+
+    def pop() -> List[str]:
+        future, window, index = pending.popleft()
+        if scheduler is None:
+            value, steps = future.result()
+            results = window.result(index, value)
+        else:
+            (value, steps), worker, elapsed, cpu = future.result()
+            results = window.result(index, value)
+            scheduler._record(worker, len(results), window.chars(index), elapsed, cpu)
+        _merge_steps(pipe, steps)
+        if index == len(window.tasks) - 1:  # chunks are consumed in order
+            windows.popleft().close()
+        return results
+
+    try:
+        # every window holds half of the buffer so the next one is packed while the workers are
+        # busy
+        for group in _chunks(chunks, max(1, buffer_size // 2)):
+            window = _SharedWindow(group)
+            windows.append(window)
+            for index, task in enumerate(window.tasks):
+                if len(pending) >= buffer_size:
+                    yield from pop()
+                pending.append((executor.submit(run, task), window, index))
+        while pending:
+            yield from pop()
+    finally:
+        for future, _, _ in pending:  # generator closed early or a chunk failed
+            future.cancel()
+        executor.shutdown(wait=True)  # workers may still write into the windows
+        for window in windows:
+            window.close()
+        if scheduler is not None:
+            scheduler._stop()
+
+
+def _batch(
+    step: PipelineStep,
+    texts: Iterable[str],
+    workers: Optional[int],
+    chunksize: int,
+    use_threads: bool,
+) -> Iterator[str]:
+    """Menjalankan satu fungsi preprocessing secara paralel"""
+    return imap(Pipeline([step]), texts, workers, chunksize, use_threads)
+
+
+def remove_html(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.remove_html`, lihat `imap` untuk argumen
+    lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang memiliki html tag di dalamnya.
+
+    Returns:
+        Iterator teks yang telah dibersihkan sesuai dengan urutan input.
+    """
+    return _batch("remove_html", texts, workers, chunksize, use_threads)
+
+
+def strip_html(
+    texts: Iterable[str],
+    max_tag_length: int = DEFAULT_MAX_TAG_LENGTH,
+    multiline: bool = False,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.strip_html`, lihat `imap` untuk argumen
+    lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang memiliki html tag di dalamnya.
+        max_tag_length (int, optional): Panjang maksimum tag / entity.
+        multiline (bool, optional): Menghapus tag yang mengandung baris baru.
+
+    Returns:
+        Iterator teks yang telah dibersihkan sesuai dengan urutan input.
+    """
+    params = {"max_tag_length": max_tag_length, "multiline": multiline}
+    return _batch(("strip_html", params), texts, workers, chunksize, use_threads)
+
+
+def remove_url(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.remove_url`, lihat `imap` untuk argumen
+    lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang terdapat URL di dalamnya.
+
+    Returns:
+        Iterator teks yang telah dibersihkan sesuai dengan urutan input.
+    """
+    return _batch("remove_url", texts, workers, chunksize, use_threads)
+
+
+def remove_stopwords(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.remove_stopwords`, lihat `imap` untuk argumen
+    lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang terdapat stopwords di dalamnya.
+
+    Returns:
+        Iterator teks yang telah dibersihkan sesuai dengan urutan input.
+    """
+    return _batch("remove_stopwords", texts, workers, chunksize, use_threads)
+
+
+def replace_slang(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.replace_slang`, lihat `imap` untuk argumen
+    lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang terdapat *slang words* di dalamnya.
+
+    Returns:
+        Iterator teks yang telah dimodifikasi sesuai dengan urutan input.
+    """
+    return _batch("replace_slang", texts, workers, chunksize, use_threads)
+
+
+def replace_word_elongation(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.replace_word_elongation`, lihat `imap` untuk
+    argumen lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang terdapat *word elongation* di dalamnya.
+
+    Returns:
+        Iterator teks yang telah ditransformasi sesuai dengan urutan input.
+    """
+    return _batch("replace_word_elongation", texts, workers, chunksize, use_threads)
+
+
+def emoji_to_words(
+    texts: Iterable[str],
+    lang: str = "id",
+    use_alias: bool = False,
+    delimiter: Tuple[str, str] = ("!", "!"),
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.emoji_to_words`, lihat `imap` untuk argumen
+    lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang terdapat emoji di dalamnya.
+        lang (str, optional): Kode bahasa, "en" (English) atau "id" (Bahasa Indonesia).
+        use_alias (bool, optional): Menggunakan alias translation.
+        delimiter (Tuple[str, str], optional): Delimiter (pembatas) pada terjemahan emoji.
+
+    Returns:
+        Iterator teks yang telah di transformasi sesuai dengan urutan input.
+    """
+    params = {"lang": lang, "use_alias": use_alias, "delimiter": delimiter}
+    return _batch(("emoji_to_words", params), texts, workers, chunksize, use_threads)
+
+
+def words_to_emoji(
+    texts: Iterable[str],
+    lang: str = "id",
+    use_alias: bool = False,
+    delimiter: Tuple[str, str] = ("!", "!"),
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+) -> Iterator[str]:
+    """Versi *batch* dari `indoNLP.preprocessing.words_to_emoji`, lihat `imap` untuk argumen
+    lainnya.
+
+    Args:
+        texts (Iterable[str]): Iterable teks yang terdapat kata - kata dengan kode emoji di
+            dalamnya.
+        lang (str, optional): Kode bahasa, "en" (English) atau "id" (Bahasa Indonesia).
+        use_alias (bool, optional): Menggunakan alias translation.
+        delimiter (Tuple[str, str], optional): Delimiter (pembatas) pada kata - kata kode emoji.
+
+    Returns:
+        Iterator teks yang telah di transformasi sesuai dengan urutan input.
+    """
+    params = {"lang": lang, "use_alias": use_alias, "delimiter": delimiter}
+    return _batch(("words_to_emoji", params), texts, workers, chunksize, use_threads)
@@ -0,0 +1,455 @@
+"""Memoization hasil preprocessing menggunakan *LRU cache* yang berukuran terbatas. Berguna untuk
+corpus media sosial yang banyak mengandung duplikat (retweet, spam, atau bot) sehingga teks yang
+sama tidak perlu diproses berulang kali. Hasil pipeline juga dapat disimpan secara persisten di
+disk (`DiskCache`) sehingga corpus yang sama tidak perlu diproses ulang pada eksperimen berikutnya.
+
+Examples:
+    Menggunakan cache pada pipeline.
+
+    >>> from indoNLP.preprocessing.cache import LRUCache
+    >>> pipe = indoNLP.preprocessing.pipeline([replace_slang], cache=LRUCache(10_000))
+    >>> pipe("gw gk mw"), pipe("gw gk mw")
+    ('gue enggak mau', 'gue enggak mau')
+    >>> pipe.cache.info()
+    CacheInfo(hits=1, misses=1, skipped=0, evictions=0, entries=1, bytes=120)
+
+    Menggunakan cache pada fungsi preprocessing.
+
+    >>> from indoNLP.preprocessing.cache import memoize
+    >>> cached_replace_slang = memoize(replace_slang, LRUCache(10_000, max_length=1000))
+    >>> cached_replace_slang("gw gk mw")
+    'gue enggak mau'
+
+    Menyimpan hasil pipeline di disk.
+
+    >>> from indoNLP.preprocessing.cache import DiskCache
+    >>> pipe = indoNLP.preprocessing.pipeline([replace_slang])
+    >>> list(pipe.map(["gw gk mw", "yg"], workers=1, disk_cache=DiskCache()))
+    ['gue enggak mau', 'yang']
+"""
+
+import collections
+import functools
+import hashlib
+import itertools
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from indoNLP.preprocessing.lexicon import Lexicon, Vocabulary
+
+__all__ = ["CacheInfo", "LRUCache", "memoize", "DiskCache", "DEFAULT_CACHE_PATH"]
+
+# same root directory as `indoNLP.dataset.utils.DatasetDirectoryHandler`
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "indoNLP", "preprocessing", "cache.sqlite"
+)
+
+
+@dataclass
+class CacheInfo:
+    """Statistik cache.
+
+    Attributes:
+        hits (int): Jumlah teks yang ditemukan dalam cache.
+        misses (int): Jumlah teks yang tidak ditemukan dalam cache.
+        skipped (int): Jumlah teks yang tidak di-cache karena lebih panjang dari `max_length`.
+        evictions (int): Jumlah entry yang dihapus karena melebihi batas cache.
+        entries (int): Jumlah entry dalam cache.
+        bytes (int): Perkiraan ukuran entry dalam cache (byte).
+    """
+
+    hits: int
+    misses: int
+    skipped: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class LRUCache:
+    """*Least recently used* cache yang *thread-safe* dengan batas jumlah entry dan ukuran.
+
+    Ukuran sebuah entry diperkirakan menggunakan `sys.getsizeof` teks input dan output. Ketika
+    di-*pickle* (contoh: dikirim ke worker `Pipeline.map`), hanya konfigurasi cache yang disimpan
+    sehingga setiap worker memiliki cache kosong masing - masing.
+
+    Args:
+        max_entries (int, optional): Jumlah maksimum entry.
+        max_bytes (int, optional): Perkiraan ukuran maksimum seluruh entry dalam byte, tanpa batas
+            jika `None`.
+        max_length (int, optional): Panjang maksimum teks yang di-cache, teks yang lebih panjang
+            tetap diproses tetapi tidak disimpan sehingga dokumen berukuran besar tidak
+            menghapus entry lain. Tanpa batas jika `None`.
+
+    Raises:
+        ValueError: `max_entries` atau `max_bytes` lebih kecil dari 1.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 65536,
+        max_bytes: Optional[int] = None,
+        max_length: Optional[int] = None,
+    ) -> None:
+        if max_entries < 1 or (max_bytes is not None and max_bytes < 1):
+            raise ValueError("max_entries dan max_bytes harus lebih besar dari 0!")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_length = max_length
+        self._entries: "collections.OrderedDict[Hashable, Tuple[str, int]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = self.misses = self.skipped = self.evictions = 0
+
+    def accepts(self, text: str) -> bool:
+        """Apakah teks dapat di-cache berdasarkan `max_length`.
+
+        Args:
+            text (str): Teks input.
+
+        Returns:
+            `True` jika teks dapat di-cache.
+        """
+        if self.max_length is not None and len(text) > self.max_length:
+            with self._lock:
+                self.skipped += 1
+            return False
+        return True
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Mendapatkan hasil yang tersimpan dalam cache.
+
+        Args:
+            key (Hashable): Key entry, biasanya teks input.
+
+        Returns:
+            Hasil yang tersimpan atau `None` jika key tidak ditemukan.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, text: str, value: str) -> None:
+        """Menyimpan hasil ke dalam cache, entry yang paling lama tidak digunakan akan dihapus jika
+        cache melebihi batas.
+
+        Args:
+            key (Hashable): Key entry, biasanya teks input.
+            text (str): Teks input, digunakan untuk memperkirakan ukuran entry.
+            value (str): Hasil preprocessing.
+        """
+        size = sys.getsizeof(text) + sys.getsizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._bytes -= self._entries.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Menghapus semua entry dan mengembalikan statistik ke nilai awal."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.skipped = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Statistik cache.
+
+        Returns:
+            Statistik cache (`CacheInfo`).
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.skipped,
+                self.evictions,
+                len(self._entries),
+                self._bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (LRUCache, (self.max_entries, self.max_bytes, self.max_length))
+
+    def __repr__(self) -> str:
+        return (
+            f"LRUCache(max_entries={self.max_entries}, max_bytes={self.max_bytes}, "
+            f"max_length={self.max_length})"
+        )
+
+
+def memoize(func: Callable[..., str], cache: Optional[LRUCache] = None) -> Callable[..., str]:
+    """Menambahkan memoization pada fungsi preprocessing. Hasil untuk
+    `indoNLP.preprocessing.lexicon.Lexicon` atau `Vocabulary` yang diubah setelah dipanggil tidak
+    digunakan kembali.
+
+    Args:
+        func (Callable[..., str]): Fungsi preprocessing dengan teks sebagai argumen pertama.
+        cache (LRUCache, optional): Cache yang digunakan, default `LRUCache()`. Satu cache dapat
+            digunakan bersama oleh beberapa fungsi.
+
+    Returns:
+        Fungsi dengan memoization, cache dapat diakses melalui atribut `cache`.
+
+    Examples:
+        >>> cached_emoji_to_words = memoize(emoji_to_words, LRUCache(max_bytes=16 * 2**20))
+        >>> cached_emoji_to_words("😀", lang="en")
+        '!grinning_face!'
+        >>> cached_emoji_to_words.cache.info().misses
+        1
+    """
+    lru = LRUCache() if cache is None else cache
+
+    @functools.wraps(func)
+    def _memoized(text: str, *args: Any, **kwargs: Any) -> str:
+        if not lru.accepts(text):
+            return func(text, *args, **kwargs)
+        # keyed by the wrapped function, a cache may be shared by several functions
+        key: Hashable = (func, text)
+        if args or kwargs:
+            params = tuple(sorted(kwargs.items()))
+            # a modified lexicon gets a new key, stale results are evicted eventually
+            versions = tuple(
+                x.version
+                for x in itertools.chain(args, kwargs.values())
+                if isinstance(x, (Lexicon, Vocabulary))
+            )
+            key = (func, text, args, params, versions)
+        result = lru.get(key)
+        if result is None:
+            result = func(text, *args, **kwargs)
+            lru.put(key, text, result)
+        return result
+
+    _memoized.cache = lru  # type: ignore[attr-defined]
+    return _memoized
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS meta (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE meta SET total = total + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE meta SET total = total - OLD.size WHERE id = 0;
+END;
+"""
+_KEY_SIZE = 16
+_ENTRY_OVERHEAD = 32  # approximate sqlite bookkeeping per row
+_MAX_VARIABLES = 500  # below SQLITE_MAX_VARIABLE_NUMBER of old sqlite builds
+
+
+def _encode(text: str) -> bytes:
+    """Encode teks, *lone surrogate* (contoh: hasil `surrogateescape`) tetap dapat disimpan"""
+    return text.encode("utf-8", "surrogatepass")
+
+
+class DiskCache:
+    """Cache hasil pipeline yang persisten di disk (SQLite). Key setiap entry adalah hash dari
+    fingerprint pipeline (`Pipeline.fingerprint`) dan teks input sehingga perubahan step,
+    parameter, versi `indoNLP`, atau data leksikon otomatis menggunakan entry yang berbeda.
+
+    Cache dapat digunakan bersama oleh beberapa thread maupun proses (contoh: worker
+    `Pipeline.map`). Ketika ukuran cache melebihi `max_bytes`, entry yang paling lama tidak
+    digunakan dihapus hingga ukuran cache kembali di bawah 90% `max_bytes`.
+
+    Args:
+        path (str, optional): Path file cache, default `~/.cache/indoNLP/preprocessing/cache.sqlite`.
+        max_bytes (int, optional): Perkiraan ukuran maksimum entry dalam byte, default 1 GiB.
+
+    Attributes:
+        hits (int): Jumlah teks yang ditemukan dalam cache pada proses ini.
+        misses (int): Jumlah teks yang tidak ditemukan dalam cache pada proses ini.
+        evictions (int): Jumlah entry yang dihapus oleh proses ini.
+
+    !!! warning
+        Fingerprint *custom step* tidak termasuk nilai variabel global yang digunakannya, hapus
+        cache (`clear`) jika variabel global tersebut diubah.
+
+    Examples:
+        >>> cache = DiskCache(max_bytes=256 * 2**20)
+        >>> fingerprint = pipe.fingerprint()
+        >>> cache.put_many(fingerprint, [("gw", "gue")])
+        >>> cache.get_many(fingerprint, ["gw", "yg"])
+        ['gue', None]
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = 2**30) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes harus lebih besar dari 0!")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection: Any = None
+        self._pid = -1
+
+    def _connect(self) -> Any:
+        """Membuka koneksi SQLite satu kali per proses"""
+        if self._connection is None or self._pid != os.getpid():
+            import sqlite3
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")  # readers never block the writer
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.executescript(_SCHEMA)
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _key(fingerprint: str, text: str) -> bytes:
+        """Hash fingerprint pipeline dan teks input"""
+        digest = hashlib.blake2b(digest_size=_KEY_SIZE, person=b"indoNLP")
+        digest.update(fingerprint.encode("ascii"))
+        digest.update(b"\0")
+        digest.update(_encode(text))
+        return digest.digest()
+
+    def get_many(self, fingerprint: str, texts: Sequence[str]) -> List[Optional[str]]:
+        """Mendapatkan hasil pipeline untuk banyak teks sekaligus.
+
+        Args:
+            fingerprint (str): Fingerprint pipeline (`Pipeline.fingerprint`).
+            texts (Sequence[str]): Teks - teks input.
+
+        Returns:
+            Hasil pipeline setiap teks sesuai urutan input, `None` jika tidak ditemukan.
+        """
+        keys = [self._key(fingerprint, x) for x in texts]
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            for i in range(0, len(keys), _MAX_VARIABLES):
+                batch = keys[i : i + _MAX_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                query = f"SELECT key, value FROM entries WHERE key IN ({placeholders})"
+                found.update(connection.execute(query, batch).fetchall())
+            if found:  # refresh the eviction order of the hits
+                hits = list(found)
+                with connection:
+                    for i in range(0, len(hits), _MAX_VARIABLES):
+                        batch = hits[i : i + _MAX_VARIABLES]
+                        placeholders = ",".join("?" * len(batch))
+                        connection.execute(
+                            f"UPDATE entries SET accessed = ? WHERE key IN ({placeholders})",
+                            [time.time(), *batch],
+                        )
+            self.hits += sum(x in found for x in keys)
+            self.misses += sum(x not in found for x in keys)
+        return [
+            bytes(found[x]).decode("utf-8", "surrogatepass") if x in found else None for x in keys
+        ]
+
+    def put_many(self, fingerprint: str, items: Iterable[Tuple[str, str]]) -> None:
+        """Menyimpan hasil pipeline untuk banyak teks sekaligus dalam satu transaksi.
+
+        Args:
+            fingerprint (str): Fingerprint pipeline (`Pipeline.fingerprint`).
+            items (Iterable[Tuple[str, str]]): Pasangan teks input dan hasil pipeline.
+        """
+        now = time.time()
+        rows = []
+        for text, value in items:
+            encoded = _encode(value)
+            size = len(encoded) + _KEY_SIZE + _ENTRY_OVERHEAD
+            rows.append((self._key(fingerprint, text), encoded, size, now))
+        if not rows:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                # the same key always maps to the same value, existing entries are kept as is
+                connection.executemany("INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?)", rows)
+                self._evict(connection)
+
+    def _evict(self, connection: Any) -> None:
+        """Menghapus entry yang paling lama tidak digunakan jika cache melebihi `max_bytes`"""
+        total = connection.execute("SELECT total FROM meta WHERE id = 0").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * 0.9)
+        freed, cutoff = 0, None
+        for accessed, size in connection.execute(
+            "SELECT accessed, size FROM entries ORDER BY accessed"
+        ):
+            freed += size
+            cutoff = accessed
+            if freed >= excess:
+                break
+        if cutoff is not None:
+            cursor = connection.execute("DELETE FROM entries WHERE accessed <= ?", (cutoff,))
+            self.evictions += cursor.rowcount
+
+    def get(self, fingerprint: str, text: str) -> Optional[str]:
+        """Mendapatkan hasil pipeline untuk sebuah teks, lihat `get_many`."""
+        return self.get_many(fingerprint, [text])[0]
+
+    def put(self, fingerprint: str, text: str, value: str) -> None:
+        """Menyimpan hasil pipeline untuk sebuah teks, lihat `put_many`."""
+        self.put_many(fingerprint, [(text, value)])
+
+    def size(self) -> int:
+        """Perkiraan ukuran seluruh entry dalam byte.
+
+        Returns:
+            Ukuran cache.
+        """
+        with self._lock:
+            total: int = self._connect().execute("SELECT total FROM meta").fetchone()[0]
+        return total
+
+    def clear(self) -> None:
+        """Menghapus semua entry."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Menutup koneksi, koneksi akan dibuka kembali ketika cache digunakan."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return count
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (DiskCache, (self.path, self.max_bytes))
+
+    def __repr__(self) -> str:
+        return f"DiskCache({self.path!r}, max_bytes={self.max_bytes})"
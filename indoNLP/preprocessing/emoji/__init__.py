@@ -1,6 +1,4 @@
-from typing import Dict
-
-from indoNLP.preprocessing.emoji.emoji_data import EMOJI_DATA
+from typing import Any, Callable, Dict, List
 
 # fmt: off
 __all__ = [
@@ -12,9 +10,10 @@ __all__ = [
     "ID_WORDS_EMOJI_PATTERN", "ALIAS_WORDS_EMOJI_PATTERN",
 ]
 
+
 # fmt: on
 def _generate_words_to_emoji_mapper(
-    emoji_data: Dict[str, Dict[str, str]]
+    emoji_data: Dict[str, Dict[str, str]],
 ) -> Dict[str, Dict[str, str]]:
     """Generate words to emoji mapper"""
     result: Dict[str, Dict[str, str]] = {"en": {}, "id": {}, "alias": {}}
@@ -28,12 +27,51 @@ def _generate_words_to_emoji_mapper(
     return result
 
 
-# data
-EMOJI_DATA = {k: v for k, v in sorted(EMOJI_DATA.items(), key=lambda x: len(x[0]), reverse=True)}
-WORDS_EMOJI_DATA = _generate_words_to_emoji_mapper(EMOJI_DATA)
+def _load_emoji_data() -> Dict[str, Dict[str, str]]:
+    """Loading emoji data, diurutkan dari emoji terpanjang"""
+    from indoNLP.preprocessing.emoji.emoji_data import EMOJI_DATA
+
+    return {k: v for k, v in sorted(EMOJI_DATA.items(), key=lambda x: len(x[0]), reverse=True)}
+
+
+# data and patterns are loaded on first access, see `__getattr__`
+_LAZY_LOADERS: Dict[str, Callable[[], Any]] = {
+    # data
+    "EMOJI_DATA": lambda: _load_data("EMOJI_DATA", _load_emoji_data),
+    "WORDS_EMOJI_DATA": lambda: _load_data(
+        "WORDS_EMOJI_DATA", lambda: _generate_words_to_emoji_mapper(_get("EMOJI_DATA"))
+    ),
+    # pattern
+    "EMOJI_PATTERN": lambda: f"({'|'.join(_get('EMOJI_DATA').keys())})",
+    "EN_WORDS_EMOJI_PATTERN": lambda: f"({'|'.join(_get('WORDS_EMOJI_DATA')['en'].keys())})",
+    "ID_WORDS_EMOJI_PATTERN": lambda: f"({'|'.join(_get('WORDS_EMOJI_DATA')['id'].keys())})",
+    "ALIAS_WORDS_EMOJI_PATTERN": lambda: f"({'|'.join(_get('WORDS_EMOJI_DATA')['alias'].keys())})",
+}
+
+
+def _load_data(name: str, fallback: Callable[[], Any]) -> Any:
+    """Loading data dari snapshot biner, lihat `indoNLP.preprocessing.snapshot`"""
+    from indoNLP.preprocessing.snapshot import _load_data
+
+    return _load_data(name, fallback)
+
+
+def _get(name: str) -> Any:
+    """Mendapatkan data / pattern, loading terlebih dahulu jika belum pernah diakses"""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+def __getattr__(name: str) -> Any:
+    """Loading data dan pattern secara lazy ketika pertama kali diakses (PEP 562)"""
+    loader = _LAZY_LOADERS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = loader()
+    return value
+
 
-# pattern
-EMOJI_PATTERN = f"({'|'.join(EMOJI_DATA.keys())})"
-EN_WORDS_EMOJI_PATTERN = f"({'|'.join(WORDS_EMOJI_DATA['en'].keys())})"
-ID_WORDS_EMOJI_PATTERN = f"({'|'.join(WORDS_EMOJI_DATA['id'].keys())})"
-ALIAS_WORDS_EMOJI_PATTERN = f"({'|'.join(WORDS_EMOJI_DATA['alias'].keys())})"
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_LOADERS))
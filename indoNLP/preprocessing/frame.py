@@ -0,0 +1,138 @@
+"""Preprocessing satu kolom data sekaligus untuk `pandas.Series` dan *string array* `pyarrow`.
+
+Modul ini membutuhkan dependency tambahan yang dapat diinstall menggunakan
+`pip install indoNLP[pandas]` atau `pip install indoNLP[arrow]`, `indoNLP` sendiri tetap tidak
+membutuhkan dependency apapun.
+
+Pipeline hanya dijalankan satu kali untuk setiap teks unik di dalam kolom menggunakan
+`indoNLP.preprocessing.batch.imap` (paralel), lalu hasilnya disebar kembali ke setiap baris dengan
+operasi vektor `numpy` / `pyarrow.compute`. Nilai null, index, nama, dan tipe data kolom tetap
+dipertahankan. Setiap teks unik hanya dikonversi satu kali dari dan ke buffer Arrow sehingga
+*overhead* per baris kolom berukuran besar (jutaan baris dengan banyak duplikat) sangat kecil.
+
+Examples:
+    >>> from indoNLP.preprocessing.frame import map_series
+    >>> pipe = indoNLP.preprocessing.pipeline([replace_slang, remove_stopwords])
+    >>> df["clean"] = map_series(pipe, df.text, workers=4)
+
+    Menggunakan `pyarrow`.
+
+    >>> from indoNLP.preprocessing.frame import map_arrow
+    >>> map_arrow(pipe, pyarrow.array(["gw gk mw", None, "gw gk mw"]), workers=1).to_pylist()
+    ['gue enggak mau', None, 'gue enggak mau']
+"""
+
+import importlib
+from typing import Any, Iterable, List, Optional
+
+from indoNLP.preprocessing import Pipeline
+from indoNLP.preprocessing.batch import DEFAULT_CHUNKSIZE, imap
+from indoNLP.preprocessing.cache import DiskCache
+
+__all__ = ["map_series", "map_arrow"]
+
+
+def _require(name: str, extra: str) -> Any:
+    """Import dependency tambahan"""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f"{name} tidak ditemukan, install menggunakan `pip install indoNLP[{extra}]`!"
+        ) from e
+
+
+def _run_unique(
+    pipe: Pipeline,
+    texts: Iterable[str],
+    workers: Optional[int],
+    chunksize: int,
+    use_threads: bool,
+    disk_cache: Optional[DiskCache],
+) -> List[str]:
+    """Menjalankan pipeline pada teks - teks unik"""
+    return list(imap(pipe, texts, workers, chunksize, use_threads, disk_cache=disk_cache))
+
+
+def map_series(
+    pipe: Pipeline,
+    series: Any,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+    disk_cache: Optional[DiskCache] = None,
+) -> Any:
+    """Menjalankan pipeline pada setiap baris `pandas.Series`, pengganti `series.map(pipe)`.
+
+    Args:
+        pipe (Pipeline): Pipeline yang dijalankan.
+        series (pandas.Series): Kolom teks, nilai null (`None`, `NaN`, `pandas.NA`) tidak
+            diproses.
+        workers (int, optional): Jumlah worker, lihat `indoNLP.preprocessing.batch.imap`.
+        chunksize (int, optional): Jumlah teks yang dikirim ke worker dalam satu task.
+        use_threads (bool, optional): Menggunakan *thread pool* sebagai pengganti *process pool*.
+        disk_cache (DiskCache, optional): Cache persisten hasil pipeline.
+
+    Returns:
+        `pandas.Series` hasil preprocessing dengan index, nama, dan nilai null yang sama. Tipe data
+            `string` / `str` dipertahankan, tipe data lainnya menjadi `object`.
+
+    Raises:
+        ImportError: `pandas` tidak terinstall.
+    """
+    pd = _require("pandas", "pandas")
+    np = _require("numpy", "pandas")
+
+    # every distinct text is processed once, nulls are coded as -1
+    codes, uniques = pd.factorize(series)
+    results = np.empty(len(uniques), dtype=object)
+    results[:] = _run_unique(pipe, uniques, workers, chunksize, use_threads, disk_cache)
+
+    values = np.empty(len(codes), dtype=object)
+    nulls = codes < 0
+    values[~nulls] = results[codes[~nulls]]
+    if nulls.any():  # the original null markers are kept as is
+        values[nulls] = np.asarray(series.array[nulls], dtype=object)
+
+    dtype = series.dtype if isinstance(series.dtype, pd.StringDtype) else object
+    return pd.Series(values, index=series.index, name=series.name, dtype=dtype)
+
+
+def map_arrow(
+    pipe: Pipeline,
+    array: Any,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    use_threads: bool = False,
+    disk_cache: Optional[DiskCache] = None,
+) -> Any:
+    """Menjalankan pipeline pada setiap nilai *string array* `pyarrow`.
+
+    Args:
+        pipe (Pipeline): Pipeline yang dijalankan.
+        array (pyarrow.Array | pyarrow.ChunkedArray): Array bertipe `string` atau
+            `large_string`.
+        workers (int, optional): Jumlah worker, lihat `indoNLP.preprocessing.batch.imap`.
+        chunksize (int, optional): Jumlah teks yang dikirim ke worker dalam satu task.
+        use_threads (bool, optional): Menggunakan *thread pool* sebagai pengganti *process pool*.
+        disk_cache (DiskCache, optional): Cache persisten hasil pipeline.
+
+    Returns:
+        Array hasil preprocessing dengan tipe, panjang, dan posisi null yang sama
+            (`pyarrow.ChunkedArray` jika input berupa `pyarrow.ChunkedArray`).
+
+    Raises:
+        ImportError: `pyarrow` tidak terinstall.
+        TypeError: Tipe array bukan `string` atau `large_string`.
+    """
+    pa = _require("pyarrow", "arrow")
+    pc = _require("pyarrow.compute", "arrow")
+
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        raise TypeError(f"Tipe array harus string atau large_string, bukan {array.type}!")
+
+    uniques = pc.unique(array)
+    uniques = uniques.filter(pc.is_valid(uniques))  # `pc.drop_null` requires pyarrow 6.0
+    indices = pc.index_in(array, value_set=uniques, skip_nulls=True)  # nulls stay null
+    results = _run_unique(pipe, uniques.to_pylist(), workers, chunksize, use_threads, disk_cache)
+    return pc.take(pa.array(results, type=array.type), indices)
@@ -0,0 +1,313 @@
+"""Pencocokan *slang words* secara *fuzzy* menggunakan index *symmetric delete* (SymSpell).
+
+Setiap key kamus diindex beserta semua variasinya yang didapatkan dengan menghapus hingga
+`max_distance` karakter. Kata dalam teks cukup dicocokkan dengan cara yang sama (menghapus hingga
+`max_distance` karakter lalu *lookup* dictionary untuk setiap variasinya) sehingga kandidat key
+didapatkan tanpa membandingkan kata dengan seluruh isi kamus seperti `difflib`. Kandidat kemudian
+divalidasi menggunakan jarak Damerau-Levenshtein (*optimal string alignment*).
+
+Index dapat disimpan di disk (`FuzzyIndex.save`) sehingga tidak perlu dibuat ulang setiap kali
+proses dimulai, `FuzzyIndex.slang` menyimpan index secara otomatis di `DEFAULT_INDEX_DIR`.
+
+Kata baku yang tidak terdapat di dalam data bawaan (kata pengganti `SLANG_DATA` dan `STOPWORDS`)
+dapat tercocokkan dengan *slang words* yang mirip (contoh: "makan" -> "mayan"), gunakan parameter
+`exclude` untuk menambahkan kosakata baku.
+
+Examples:
+    >>> indoNLP.preprocessing.replace_slang("emgg siapa yg nanyaa?", fuzzy=1)
+    'memang siapa yang bertanya?'
+
+    Menggunakan index secara langsung.
+
+    >>> from indoNLP.preprocessing.fuzzy import FuzzyIndex
+    >>> index = FuzzyIndex.slang(max_distance=2, exclude=["makan"])
+    >>> index.lookup("gatauu"), index.lookup("makan")
+    (('gatau', 1), None)
+    >>> indoNLP.preprocessing.replace_slang("gatauu makan", fuzzy=index)
+    'enggak tahu makan'
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from indoNLP.preprocessing.cache import DEFAULT_CACHE_PATH
+from indoNLP.preprocessing.trie import fold
+
+__all__ = ["FuzzyIndex", "distance", "DEFAULT_INDEX_DIR"]
+
+DEFAULT_INDEX_DIR = os.path.dirname(DEFAULT_CACHE_PATH)
+INDEX_VERSION = 1
+
+_WORD_PATTERN = re.compile(r"\w+")
+_LOOKUP_CACHE_SIZE = 65536
+
+
+def distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """Jarak Damerau-Levenshtein (*optimal string alignment*) antara dua kata.
+
+    Args:
+        a (str): Kata pertama.
+        b (str): Kata kedua.
+        max_distance (int, optional): Batas jarak, perhitungan dihentikan lebih awal ketika jarak
+            pasti melebihi batas.
+
+    Returns:
+        Jarak kedua kata, `max_distance + 1` jika jarak melebihi `max_distance`.
+
+    Examples:
+        >>> indoNLP.preprocessing.fuzzy.distance("bgt", "bgtt")
+        1
+    """
+    limit = max(len(a), len(b)) if max_distance is None else max_distance
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous: List[int] = []
+    current = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)  # transposition
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+    return min(current[-1], limit + 1)
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """Variasi kata dengan menghapus hingga `max_distance` karakter, termasuk kata itu sendiri"""
+    result = frontier = {word}
+    for _ in range(max_distance):
+        frontier = {x[:i] + x[i + 1 :] for x in frontier for i in range(len(x))}
+        result = result | frontier
+    return result
+
+
+class FuzzyIndex:
+    """Index *symmetric delete* untuk mencari key kamus terdekat dari sebuah kata.
+
+    Hanya key berupa satu kata (`\\w+`) yang diindex. Kata yang lebih pendek dari `min_length`,
+    kata yang merupakan key kamus, dan kata pada `exclude` (contoh: kata baku) tidak pernah
+    dicocokkan. Jika terdapat beberapa key dengan jarak yang sama, key yang lebih dahulu
+    ditambahkan yang dipilih.
+
+    Args:
+        data (Mapping[str, str]): Mapper key (kata) ke nilai penggantinya.
+        max_distance (int, optional): Jarak edit maksimum.
+        min_length (int, optional): Panjang minimum kata yang dicocokkan, kata pendek memiliki
+            banyak key dengan jarak yang dekat.
+        exclude (Iterable[str], optional): Kata - kata yang tidak dicocokkan.
+
+    Raises:
+        ValueError: `max_distance` lebih kecil dari 1.
+
+    Examples:
+        >>> index = indoNLP.preprocessing.fuzzy.FuzzyIndex({"bgt": "banget"}, min_length=3)
+        >>> index("bgtt"), index("bgt"), index("xyz")
+        ('banget', None, None)
+    """
+
+    def __init__(
+        self,
+        data: Mapping[str, str],
+        max_distance: int = 1,
+        min_length: int = 4,
+        exclude: Iterable[str] = (),
+    ) -> None:
+        if max_distance < 1:
+            raise ValueError("max_distance harus lebih besar dari 0!")
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self._values: Dict[str, Tuple[int, str]] = {}
+        self._deletes: Dict[str, List[str]] = {}
+        for key, value in data.items():
+            key = fold(key)
+            if key in self._values or not _WORD_PATTERN.fullmatch(key):
+                continue
+            self._values[key] = (len(self._values), value)
+            for variant in _deletes(key, max_distance):
+                self._deletes.setdefault(variant, []).append(key)
+        self._exclude = {fold(x) for x in exclude}
+        self._cache: Dict[str, Optional[str]] = {}
+        self._fingerprint: Optional[str] = None
+
+    @classmethod
+    def slang(
+        cls,
+        max_distance: int = 1,
+        min_length: int = 4,
+        exclude: Iterable[str] = (),
+        cache_dir: Optional[str] = DEFAULT_INDEX_DIR,
+    ) -> "FuzzyIndex":
+        """Membuat index dari kamus *slang words* bawaan (`SLANG_DATA`). Kata pengganti
+        `SLANG_DATA` dan `STOPWORDS` tidak dicocokkan karena merupakan kata baku.
+
+        Args:
+            max_distance (int, optional): Jarak edit maksimum.
+            min_length (int, optional): Panjang minimum kata yang dicocokkan.
+            exclude (Iterable[str], optional): Kata - kata tambahan yang tidak dicocokkan.
+            cache_dir (str, optional): Direktori untuk menyimpan index, index diload dari
+                direktori tersebut jika tersedia dan masih sesuai dengan `SLANG_DATA`. Index
+                tidak disimpan jika `None`.
+
+        Returns:
+            Index *slang words*.
+        """
+        exclude = sorted({fold(x) for x in exclude})
+        header = {
+            "version": INDEX_VERSION,
+            "exclude": hashlib.sha256("\n".join(exclude).encode("utf-8")).hexdigest(),
+        }
+        path = None
+        if cache_dir is not None:
+            path = os.path.join(cache_dir, f"slang-{max_distance}-{min_length}.fuzzy")
+            index = cls.load(path, header)
+            if index is not None:
+                return index
+
+        from indoNLP.preprocessing import _get, _unescape
+        from indoNLP.preprocessing.lexicon import _default_words
+
+        data = {_unescape(k): v for k, v in _get("SLANG_DATA").items()}
+        index = cls(data, max_distance, min_length, exclude=_default_words() + exclude)
+        if path is not None:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                index.save(path, header)
+            except OSError:  # e.g. read-only home directory, the index is built again next time
+                pass
+        return index
+
+    def save(self, path: str, header: Optional[Dict[str, Any]] = None) -> None:
+        """Menyimpan index ke disk.
+
+        Args:
+            path (str): Path file index.
+            header (Dict[str, Any], optional): Metadata (JSON) yang harus sama ketika loading.
+        """
+        import marshal
+
+        from indoNLP.preprocessing.snapshot import _write_file
+
+        header = {"version": INDEX_VERSION} if header is None else header
+        _write_file(path, header, marshal.dumps(self.__getstate__()))
+
+    @classmethod
+    def load(cls, path: str, header: Optional[Dict[str, Any]] = None) -> Optional["FuzzyIndex"]:
+        """Loading index yang disimpan menggunakan `save`.
+
+        Args:
+            path (str): Path file index.
+            header (Dict[str, Any], optional): Metadata yang digunakan ketika menyimpan index.
+
+        Returns:
+            Index, `None` jika file tidak ditemukan, rusak, dibuat oleh versi lain, atau
+                metadatanya berbeda.
+        """
+        from indoNLP.preprocessing.snapshot import _read_file
+
+        header = {"version": INDEX_VERSION} if header is None else header
+        state = _read_file(path, header)
+        if state is None:
+            return None
+        index = cls.__new__(cls)
+        index.__setstate__(state)
+        return index
+
+    def lookup(self, word: str) -> Optional[Tuple[str, int]]:
+        """Mencari key terdekat dari sebuah kata.
+
+        Args:
+            word (str): Kata yang dicari.
+
+        Returns:
+            Tuple key dan jaraknya, `None` jika tidak ada key dalam jarak `max_distance` atau kata
+                tidak dicocokkan (lihat `FuzzyIndex`).
+        """
+        word = fold(word)
+        if len(word) < self.min_length or word in self._values or word in self._exclude:
+            return None
+        best: Optional[Tuple[int, int, str]] = None
+        seen: Set[str] = set()
+        for variant in _deletes(word, self.max_distance):
+            for key in self._deletes.get(variant, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                value = distance(word, key, self.max_distance)
+                if value <= self.max_distance:
+                    candidate = (value, self._values[key][0], key)
+                    if best is None or candidate < best:
+                        best = candidate
+        return None if best is None else (best[2], best[0])
+
+    def __call__(self, word: str) -> Optional[str]:
+        """Mendapatkan nilai pengganti key terdekat dari sebuah kata, dapat digunakan sebagai
+        `fallback` pada `indoNLP.preprocessing.trie.WordTrie.scan`.
+
+        Args:
+            word (str): Kata yang dicari.
+
+        Returns:
+            Nilai pengganti, `None` jika tidak ada key yang cocok.
+        """
+        try:
+            return self._cache[word]
+        except KeyError:
+            pass
+        match = self.lookup(word)
+        value = None if match is None else self._values[match[0]][1]
+        if len(self._cache) >= _LOOKUP_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[word] = value
+        return value
+
+    def fingerprint(self) -> str:
+        """Mendapatkan fingerprint index, digunakan oleh `Pipeline.fingerprint`.
+
+        Returns:
+            Fingerprint (sha256) index.
+        """
+        if self._fingerprint is None:
+            state = {
+                "max_distance": self.max_distance,
+                "min_length": self.min_length,
+                "values": self._values,
+                "exclude": sorted(self._exclude),
+            }
+            payload = json.dumps(state, sort_keys=True, ensure_ascii=False)
+            self._fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # plain builtins only so the state can be stored with `marshal`
+        return {
+            "max_distance": self.max_distance,
+            "min_length": self.min_length,
+            "values": self._values,
+            "deletes": self._deletes,
+            "exclude": sorted(self._exclude),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.max_distance = state["max_distance"]
+        self.min_length = state["min_length"]
+        self._values = state["values"]
+        self._deletes = state["deletes"]
+        self._exclude = set(state["exclude"])
+        self._cache = {}
+        self._fingerprint = None
+
+    def __repr__(self) -> str:
+        return (
+            f"FuzzyIndex(keys={len(self)}, max_distance={self.max_distance}, "
+            f"min_length={self.min_length})"
+        )
@@ -0,0 +1,187 @@
+"""Penghapusan tag dan entity HTML secara *streaming* untuk dokumen berukuran sangat besar.
+
+`HTMLStripper` menerima dokumen per potongan (*chunk*) melalui `feed` dan mengembalikan teks
+yang sudah pasti bersih. Tag atau entity yang terpotong di batas chunk disimpan hingga chunk
+berikutnya sehingga memori yang digunakan hanya sebesar `max_tag_length` berapapun ukuran
+dokumennya.
+
+Tag dan entity yang dihapus sama dengan `indoNLP.preprocessing.remove_html` (`HTML_PATTERN`)
+dengan batas panjang `max_tag_length`: tag / entity yang lebih panjang (contoh: tag yang tidak
+pernah ditutup) dianggap sebagai teks biasa. Hasil tidak bergantung pada cara dokumen dipotong.
+
+Examples:
+    >>> from indoNLP.preprocessing.html import HTMLStripper
+    >>> stripper = HTMLStripper()
+    >>> stripper.feed("<p>Jakarta <b")
+    'Jakarta '
+    >>> stripper.feed(">macet</b> &am")
+    'macet '
+    >>> stripper.feed("p; banjir</p>")
+    ' banjir'
+    >>> stripper.close()
+    ''
+"""
+
+import re
+from typing import Iterable, Iterator, Pattern, Tuple
+
+__all__ = ["HTMLStripper", "DEFAULT_MAX_TAG_LENGTH"]
+
+DEFAULT_MAX_TAG_LENGTH = 4096
+
+# an entity that may still be completed by the next chunk
+_PARTIAL_ENTITY_PATTERN = re.compile(r"(?i)&(?:[a-z0-9]*|#[0-9]{0,6}|#x[0-9a-f]{0,6})")
+
+
+def _compile_markup_pattern(max_length: int, multiline: bool) -> Pattern[str]:
+    """`HTML_PATTERN` dengan batas panjang tag / entity"""
+    # `<[^>\n]*>` matches exactly like the lazy `<.*?>` of `HTML_PATTERN` (`.` never matches a
+    # newline), the bounded repeat limits the work spent on every unclosed `<`
+    tag = r"<[^>]{0,%d}>" if multiline else r"<[^>\n]{0,%d}>"
+    entities = [
+        f"{prefix}{chars}{{1,{min(limit, max_length - len(prefix) - 2)}}}"
+        for prefix, chars, limit in [
+            ("", "[a-z0-9]", max_length),
+            ("#", "[0-9]", 6),
+            ("#x", "[0-9a-f]", 6),
+        ]
+        if max_length - len(prefix) - 2 >= 1
+    ]
+    pattern = tag % (max_length - 2)
+    if entities:
+        pattern += f"|&(?:{'|'.join(entities)});"
+    return re.compile(f"(?i){pattern}")
+
+
+class HTMLStripper:
+    """Penghapus tag dan entity HTML *incremental*.
+
+    Args:
+        max_tag_length (int, optional): Panjang maksimum tag / entity (termasuk `<` dan `>`),
+            sekaligus batas ukuran data yang disimpan di antara dua chunk.
+        multiline (bool, optional): Menghapus tag yang mengandung baris baru (contoh:
+            `<a\\nhref="#">`), `remove_html` tidak menghapus tag tersebut.
+
+    Attributes:
+        removed (int): Jumlah tag dan entity yang telah dihapus.
+
+    Raises:
+        ValueError: `max_tag_length` lebih kecil dari 2.
+
+    Examples:
+        Membersihkan file HTML berukuran besar tanpa membaca seluruh isinya.
+
+        >>> stripper = HTMLStripper(multiline=True)
+        >>> with open("page.html", encoding="utf-8") as reader, open("page.txt", "w") as writer:
+        ...     for text in stripper.stream(iter(lambda: reader.read(65536), "")):
+        ...         writer.write(text)
+    """
+
+    def __init__(
+        self, max_tag_length: int = DEFAULT_MAX_TAG_LENGTH, multiline: bool = False
+    ) -> None:
+        if max_tag_length < 2:
+            raise ValueError("max_tag_length harus lebih besar dari 1!")
+        self.max_tag_length = max_tag_length
+        self.multiline = multiline
+        self.removed = 0
+        self._pending = ""
+        self._pattern = _compile_markup_pattern(max_tag_length, multiline)
+
+    def _pending_start(self, text: str) -> int:
+        """Posisi awal markup yang belum lengkap di akhir chunk, `len(text)` jika tidak ada"""
+        # only markup starting within the last `max_tag_length` characters can be cut short,
+        # every match before it is complete no matter what the next chunk contains
+        n = len(text)
+        low = max(0, n - self.max_tag_length + 1)
+        end = text.rfind(">", low)
+        if not self.multiline:
+            end = max(end, text.rfind("\n", low))
+        stop = text.find("<", max(low, end + 1))  # a tag without `>` / newline after it
+        stop = n if stop == -1 else stop
+        entity = text.rfind("&", low, stop)
+        if entity != -1 and _PARTIAL_ENTITY_PATTERN.fullmatch(text, entity):
+            stop = entity
+        return stop
+
+    def _strip(self, text: str, final: bool) -> Tuple[str, int, int]:
+        """Menghapus markup, mengembalikan teks bersih, jumlah markup, dan posisi awal markup
+        yang belum lengkap"""
+        stop = len(text) if final else self._pending_start(text)
+        clean, count = self._pattern.subn("", text if stop == len(text) else text[:stop])
+        return clean, count, stop
+
+    def _consume(self, text: str, final: bool) -> str:
+        """`_strip` sekaligus menyimpan markup yang belum lengkap untuk chunk berikutnya"""
+        clean, count, stop = self._strip(text, final)
+        self._pending = text[stop:]
+        self.removed += count
+        return clean
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Mencari tag dan entity di dalam teks yang utuh (bukan chunk).
+
+        Args:
+            text (str): Teks yang akan dicari.
+
+        Yields:
+            Tuple posisi awal dan posisi akhir (eksklusif) setiap tag / entity.
+        """
+        return (x.span() for x in self._pattern.finditer(text))
+
+    def feed(self, chunk: str) -> str:
+        """Memproses satu chunk dokumen.
+
+        Args:
+            chunk (str): Potongan dokumen.
+
+        Returns:
+            Teks bersih yang sudah dapat ditulis, dapat berupa string kosong jika chunk hanya
+                berisi markup yang belum lengkap.
+        """
+        return self._consume(self._pending + chunk, False)
+
+    def close(self) -> str:
+        """Mengakhiri dokumen, markup yang belum lengkap dianggap sebagai teks biasa. Stripper
+        dapat digunakan kembali untuk dokumen berikutnya.
+
+        Returns:
+            Sisa teks bersih.
+        """
+        return self._consume(self._pending, True)
+
+    def stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Memproses seluruh chunk sebuah dokumen, lalu memanggil `close`.
+
+        Args:
+            chunks (Iterable[str]): Potongan - potongan dokumen.
+
+        Yields:
+            Teks bersih (tanpa string kosong).
+        """
+        for chunk in chunks:
+            text = self.feed(chunk)
+            if text:
+                yield text
+        text = self.close()
+        if text:
+            yield text
+
+    def strip(self, text: str) -> Tuple[str, int]:
+        """Membersihkan teks yang utuh tanpa mengubah state stripper.
+
+        Args:
+            text (str): Teks input.
+
+        Returns:
+            Teks bersih beserta jumlah tag dan entity yang dihapus.
+        """
+        return self._strip(text, True)[:2]
+
+    @property
+    def pending(self) -> int:
+        """Jumlah karakter markup yang belum lengkap dan menunggu chunk berikutnya."""
+        return len(self._pending)
+
+    def __repr__(self) -> str:
+        return f"HTMLStripper(max_tag_length={self.max_tag_length}, multiline={self.multiline})"
@@ -0,0 +1,533 @@
+"""Leksikon (kamus *slang words* dan stopwords) yang dapat diubah ketika runtime. Leksikon dapat
+dibuat dari data bawaan `indoNLP` beserta penambahan dan penghapusan entry sesuai domain (contoh:
+istilah keuangan, game, atau forum daerah) lalu digunakan pada `replace_slang`,
+`remove_stopwords`, dan pipeline tanpa mengubah `SLANG_DATA` / `STOPWORDS` dan tanpa membuat
+ulang regex global.
+
+Index pencocokan leksikon (`indoNLP.preprocessing.trie.WordTrie`) diperbarui secara inkremental:
+
+- `Lexicon.add` dan `Lexicon.remove` mengubah index secara langsung, setiap perubahan terlihat
+  secara utuh oleh *thread* lain yang sedang menggunakan leksikon.
+- `Lexicon.update` menerapkan banyak perubahan pada salinan index lalu menukarnya sekaligus
+  sehingga setiap teks diproses menggunakan index sebelum atau sesudah seluruh perubahan, tidak
+  pernah sebagian.
+
+Examples:
+    Menambahkan dan menghapus *slang words*.
+
+    >>> from indoNLP.preprocessing.lexicon import Lexicon
+    >>> lexicon = Lexicon.slang(add={"cuan": "untung", "gg": "hebat"}, remove=["gw"])
+    >>> indoNLP.preprocessing.replace_slang("gw dpt cuan, gg", lexicon=lexicon)
+    'gw dapat untung, hebat'
+
+    Menggunakan leksikon stopwords pada pipeline.
+
+    >>> stopwords = Lexicon.stopwords(add=["nih", "dong"])
+    >>> pipe = indoNLP.preprocessing.pipeline([("remove_stopwords", {"lexicon": stopwords})])
+    >>> pipe("cek nih dong")
+    'cek'
+
+    Memperbarui leksikon pada service yang sedang berjalan.
+
+    >>> lexicon.update(add={"hodl": "tahan"}, remove=["gg"])
+
+    Memvalidasi *word elongation* menggunakan daftar kata.
+
+    >>> from indoNLP.preprocessing.lexicon import Vocabulary
+    >>> vocabulary = Vocabulary.default(add=["full"])
+    >>> indoNLP.preprocessing.replace_word_elongation("mantaaap fulll", vocabulary=vocabulary)
+    'mantap full'
+"""
+
+import hashlib
+import itertools
+import json
+import re
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from indoNLP.preprocessing.trie import Fallback, WordTrie, fold, split_segments
+
+__all__ = ["Lexicon", "Vocabulary"]
+
+_WORD_PATTERN = re.compile(r"\w+")
+_LETTER_RUN_PATTERN = re.compile(r"([a-z])\1+")
+# shorter runs inside a word are treated as part of the word (e.g. "Allah", "tinggi")
+_MIN_INNER_RUN = 3
+# a run of letters that can be shortened, words without it are never modified
+_RUN_PATTERN = re.compile(r"(?i)([a-zA-Z])\1(?:\1|\b)")
+
+
+def _default_words() -> List[str]:
+    """Kata - kata pengganti `SLANG_DATA` dan `STOPWORDS`"""
+    from indoNLP.preprocessing import _get, _is_literal
+
+    phrases = itertools.chain(
+        _get("SLANG_DATA").values(), [x for x in _get("STOPWORDS") if _is_literal(x)]
+    )
+    return [x for phrase in phrases for x in _WORD_PATTERN.findall(phrase)]
+
+
+class Lexicon:
+    """Kamus pengganti kata / frasa yang dapat diubah ketika runtime secara *thread-safe*.
+
+    Key dicocokkan sebagai literal per kata dan *case insensitive* (lihat
+    `indoNLP.preprocessing.trie.WordTrie`). Gunakan `Lexicon.slang` dan `Lexicon.stopwords` untuk
+    membuat leksikon dari data bawaan `indoNLP`.
+
+    !!! note
+        Leksikon yang digunakan pada `Pipeline.map` dengan *process pool* di-*pickle* ke setiap
+        worker sehingga perubahan leksikon setelah `map` dipanggil tidak terlihat oleh worker.
+
+    Args:
+        data (Mapping[str, str], optional): Mapper key (kata / frasa) ke nilai penggantinya.
+        longest (bool, optional): Memilih key terpanjang ketika terdapat beberapa key yang cocok.
+        patterns (Mapping[str, str], optional): Mapper regex ke nilai penggantinya, dicocokkan
+            terhadap satu kata secara utuh.
+
+    Attributes:
+        version (int): Bertambah setiap kali leksikon diubah.
+
+    Examples:
+        >>> lexicon = indoNLP.preprocessing.lexicon.Lexicon({"cuan": "untung"})
+        >>> lexicon.add("gg", "hebat")
+        >>> lexicon.sub("cuan gg")
+        'untung hebat'
+    """
+
+    def __init__(
+        self,
+        data: Optional[Mapping[str, str]] = None,
+        longest: bool = False,
+        patterns: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self._trie = WordTrie(data, longest=longest, patterns=patterns)
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[Tuple[int, str]] = None
+        self.version = 0
+
+    @classmethod
+    def _from_trie(cls, trie: WordTrie) -> "Lexicon":
+        """Membuat leksikon dari salinan *trie*"""
+        lexicon = cls.__new__(cls)
+        lexicon.__setstate__({"trie": trie.copy(), "version": 0})
+        return lexicon
+
+    @classmethod
+    def slang(
+        cls, add: Optional[Mapping[str, str]] = None, remove: Iterable[str] = ()
+    ) -> "Lexicon":
+        """Membuat leksikon dari kamus *slang words* bawaan (`SLANG_DATA`).
+
+        Args:
+            add (Mapping[str, str], optional): *Slang words* tambahan beserta penggantinya,
+                menimpa pengganti bawaan jika *slang words* sudah ada.
+            remove (Iterable[str], optional): *Slang words* bawaan yang dihapus.
+
+        Returns:
+            Leksikon *slang words*.
+
+        Raises:
+            KeyError: *Slang words* yang akan dihapus tidak ditemukan.
+        """
+        from indoNLP.preprocessing import _get
+
+        lexicon = cls._from_trie(_get("_SLANG_TRIE"))
+        lexicon._apply(lexicon._trie, add or {}, remove)
+        return lexicon
+
+    @classmethod
+    def stopwords(cls, add: Iterable[str] = (), remove: Iterable[str] = ()) -> "Lexicon":
+        """Membuat leksikon dari stopwords bawaan (`STOPWORDS`).
+
+        Args:
+            add (Iterable[str], optional): Stopwords tambahan.
+            remove (Iterable[str], optional): Stopwords bawaan yang dihapus.
+
+        Returns:
+            Leksikon stopwords.
+
+        Raises:
+            KeyError: Stopwords yang akan dihapus tidak ditemukan.
+        """
+        from indoNLP.preprocessing import _get
+
+        lexicon = cls._from_trie(_get("_STOPWORDS_TRIE"))
+        lexicon._apply(lexicon._trie, {x: "" for x in add}, remove)
+        return lexicon
+
+    @staticmethod
+    def _apply(trie: WordTrie, add: Mapping[str, str], remove: Iterable[str]) -> None:
+        """Menerapkan penambahan dan penghapusan entry pada *trie*"""
+        for key in remove:
+            Lexicon._remove(trie, key)
+        for key, value in add.items():
+            trie.add(key, value)
+
+    @staticmethod
+    def _remove(trie: WordTrie, key: str) -> None:
+        """Menghapus key atau regex dari *trie*"""
+        try:
+            trie.remove(key)
+        except (KeyError, ValueError):
+            trie.remove_pattern(key)
+
+    def add(self, key: str, value: str = "") -> None:
+        """Menambahkan entry baru atau memperbarui pengganti dari entry yang sudah ada.
+
+        Args:
+            key (str): Kata / frasa yang dicari.
+            value (str, optional): Nilai pengganti, string kosong untuk stopwords.
+
+        Raises:
+            ValueError: Key tidak mengandung karakter kata sehingga tidak pernah cocok.
+        """
+        with self._lock:
+            self._trie.add(key, value)
+            self.version += 1
+
+    def add_pattern(self, pattern: str, value: str = "") -> None:
+        """Menambahkan regex yang dicocokkan terhadap satu kata secara utuh.
+
+        Args:
+            pattern (str): Regex, dicocokkan secara *case insensitive*.
+            value (str, optional): Nilai pengganti.
+        """
+        with self._lock:
+            self._trie.add_pattern(pattern, value)
+            self.version += 1
+
+    def remove(self, key: str) -> None:
+        """Menghapus entry atau regex dari leksikon.
+
+        Args:
+            key (str): Kata / frasa atau regex yang akan dihapus.
+
+        Raises:
+            KeyError: Entry tidak ditemukan.
+        """
+        with self._lock:
+            self._remove(self._trie, key)
+            self.version += 1
+
+    def update(self, add: Optional[Mapping[str, str]] = None, remove: Iterable[str] = ()) -> None:
+        """Menambahkan dan menghapus banyak entry sekaligus. Perubahan diterapkan pada salinan
+        index lalu ditukar sekaligus sehingga tidak ada teks yang diproses dengan sebagian
+        perubahan saja. Jika terdapat error, leksikon tidak berubah.
+
+        Args:
+            add (Mapping[str, str], optional): Entry baru beserta penggantinya.
+            remove (Iterable[str], optional): Entry atau regex yang dihapus.
+
+        Raises:
+            KeyError: Entry yang akan dihapus tidak ditemukan.
+            ValueError: Key baru tidak mengandung karakter kata.
+        """
+        with self._lock:
+            trie = self._trie.copy()
+            self._apply(trie, add or {}, remove)
+            self._trie = trie
+            self.version += 1
+
+    def copy(self) -> "Lexicon":
+        """Membuat salinan leksikon yang dapat diubah tanpa mengubah leksikon awal.
+
+        Returns:
+            Salinan leksikon.
+        """
+        with self._lock:
+            return self._from_trie(self._trie)
+
+    def fingerprint(self) -> str:
+        """Mendapatkan fingerprint isi leksikon, digunakan oleh `Pipeline.fingerprint`.
+
+        Returns:
+            Fingerprint (sha256) leksikon.
+        """
+        with self._lock:
+            if self._fingerprint is None or self._fingerprint[0] != self.version:
+                state = json.dumps(self._trie.__getstate__(), sort_keys=True, ensure_ascii=False)
+                digest = hashlib.sha256(state.encode("utf-8")).hexdigest()
+                self._fingerprint = (self.version, digest)
+            return self._fingerprint[1]
+
+    def finditer(
+        self, text: str, fallback: Optional[Fallback] = None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """Mencari entry leksikon di dalam teks, lihat `WordTrie.finditer`.
+
+        Args:
+            text (str): Teks yang akan dicari.
+            fallback (Callable[[str], Optional[str]], optional): Lihat `WordTrie.scan`.
+
+        Yields:
+            Tuple posisi awal, posisi akhir (eksklusif), dan nilai pengganti.
+        """
+        return self._trie.finditer(text, fallback)
+
+    def sub(self, text: str) -> str:
+        """Mengganti setiap entry leksikon yang terdapat di dalam teks dengan penggantinya.
+
+        Args:
+            text (str): Teks yang akan dimodifikasi.
+
+        Returns:
+            Teks yang telah dimodifikasi.
+        """
+        return self._trie.subn(text)[0]
+
+    def subn(self, text: str, fallback: Optional[Fallback] = None) -> Tuple[str, int]:
+        """Sama seperti `sub` namun juga mengembalikan jumlah penggantian."""
+        return self._trie.subn(text, fallback)
+
+    def subn_segments(
+        self, parts: List[str], fallback: Optional[Fallback] = None
+    ) -> Tuple[List[str], int]:
+        """`subn` untuk teks yang telah dipecah menggunakan `split_segments`."""
+        return self._trie.subn_segments(parts, fallback)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._trie
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"trie": self._trie, "version": self.version}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._trie = state["trie"]
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self.version = state["version"]
+
+    def __repr__(self) -> str:
+        return f"Lexicon(entries={len(self)}, version={self.version})"
+
+
+class Vocabulary:
+    """Daftar kata yang digunakan untuk memvalidasi *word elongation* (lihat
+    `indoNLP.preprocessing.replace_word_elongation`).
+
+    Setiap kata diindex berdasarkan kerangkanya, yaitu kata dengan setiap huruf berulang diringkas
+    menjadi satu huruf (contoh: "maaf" -> "maf"), beserta panjang setiap huruf berulang. Kata yang
+    mengalami *word elongation* memiliki kerangka yang sama dengan kata aslinya sehingga kandidat
+    kata cukup dicari dengan satu *lookup* dictionary, biaya per kata tidak bergantung pada jumlah
+    kata di dalam daftar.
+
+    Huruf berulang di akhir kata (minimal 2 huruf) atau di tengah kata (minimal 3 huruf) dapat
+    dipersingkat. Jika terdapat beberapa kandidat, kandidat terpanjang yang dipilih. Jika tidak ada
+    kandidat, huruf berulang di akhir kata diringkas menjadi satu huruf (sama seperti
+    `replace_word_elongation` tanpa validasi).
+
+    Args:
+        words (Iterable[str], optional): Daftar kata, dicocokkan secara *case insensitive*.
+
+    Attributes:
+        version (int): Bertambah setiap kali daftar kata diubah.
+
+    Examples:
+        >>> vocabulary = indoNLP.preprocessing.lexicon.Vocabulary(["maaf", "mantap"])
+        >>> vocabulary.normalize("Maaaaf"), vocabulary.normalize("mantaaap")
+        ('Maaf', 'mantap')
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._words: Set[str] = set()
+        self._index: Dict[str, Dict[str, Dict[int, int]]] = {}
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[Tuple[int, str]] = None
+        self.version = 0
+        for word in words:
+            self._add(word)
+
+    @classmethod
+    def default(cls, add: Iterable[str] = ()) -> "Vocabulary":
+        """Membuat daftar kata dari kata - kata pengganti `SLANG_DATA` dan `STOPWORDS`.
+
+        Args:
+            add (Iterable[str], optional): Kata - kata tambahan.
+
+        Returns:
+            Daftar kata.
+        """
+        return cls(itertools.chain(_default_words(), add))
+
+    @staticmethod
+    def _runs(word: str) -> Tuple[str, Dict[int, Tuple[int, int]]]:
+        """Kerangka kata beserta huruf - huruf berulang (posisi pada kerangka -> span pada kata)"""
+        runs: Dict[int, Tuple[int, int]] = {}
+        pieces: List[str] = []
+        cursor = removed = 0
+        for match in _LETTER_RUN_PATTERN.finditer(word):
+            start, end = match.span()
+            pieces.append(word[cursor : start + 1])
+            runs[start - removed] = (start, end)
+            removed += end - start - 1
+            cursor = end
+        if not runs:
+            return word, runs
+        pieces.append(word[cursor:])
+        return "".join(pieces), runs
+
+    def _add(self, word: str) -> None:
+        """Menambahkan kata ke dalam index"""
+        word = fold(word)
+        if word in self._words:
+            return
+        skeleton, runs = self._runs(word)
+        counts = {pos: end - start for pos, (start, end) in runs.items()}
+        # buckets are replaced instead of mutated so concurrent readers never see a change in size
+        self._index[skeleton] = {**self._index.get(skeleton, {}), word: counts}
+        self._words.add(word)
+
+    def add(self, word: str) -> None:
+        """Menambahkan kata ke dalam daftar kata.
+
+        Args:
+            word (str): Kata baru.
+        """
+        with self._lock:
+            self._add(word)
+            self.version += 1
+
+    def remove(self, word: str) -> None:
+        """Menghapus kata dari daftar kata.
+
+        Args:
+            word (str): Kata yang akan dihapus.
+
+        Raises:
+            KeyError: Kata tidak ditemukan.
+        """
+        with self._lock:
+            word = fold(word)
+            if word not in self._words:
+                raise KeyError(word)
+            self._words.discard(word)
+            skeleton = self._runs(word)[0]
+            bucket = {k: v for k, v in self._index[skeleton].items() if k != word}
+            if bucket:
+                self._index[skeleton] = bucket
+            else:
+                del self._index[skeleton]
+            self.version += 1
+
+    def _deletions(self, token: str) -> List[Tuple[int, int]]:
+        """Posisi huruf - huruf berulang yang dihapus dari sebuah kata"""
+        folded = fold(token)
+        if folded in self._words:
+            return []
+        skeleton, runs = self._runs(folded)
+        if not runs:
+            return []
+        last = runs[max(runs)]
+        trailing = last[1] == len(folded)
+        flexible = {
+            pos: y - x >= _MIN_INNER_RUN or y == len(folded) for pos, (x, y) in runs.items()
+        }
+        if not any(flexible.values()):
+            return []
+
+        # a word matches when every run of the word is also a run of the token and every run of
+        # the token has the same length as in the word or is longer and can be shortened
+        best: Optional[Dict[int, int]] = None
+        best_size = 0
+        for counts in self._index.get(skeleton, {}).values():
+            if not all(pos in runs for pos in counts):
+                continue
+            sizes = [(counts.get(pos, 1), y - x, flexible[pos]) for pos, (x, y) in runs.items()]
+            if all(size == length or (flex and size < length) for size, length, flex in sizes):
+                size = sum(x for x, _, _ in sizes)
+                if best is None or size > best_size:
+                    best, best_size = counts, size
+        if best is None:
+            return [(last[0] + 1, last[1])] if trailing else []
+        result = [(x + best.get(pos, 1), y) for pos, (x, y) in runs.items()]
+        return [(x, y) for x, y in result if x < y]
+
+    def normalize(self, token: str) -> str:
+        """Mengganti *word elongation* pada satu kata.
+
+        Args:
+            token (str): Kata (`\\w+`).
+
+        Returns:
+            Kata yang telah dinormalisasi.
+        """
+        deletions = self._deletions(token)
+        if not deletions:
+            return token
+        cursor, out = 0, []
+        for start, end in deletions:
+            out.append(token[cursor:start])
+            cursor = end
+        out.append(token[cursor:])
+        return "".join(out)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Mencari huruf - huruf berulang yang dihapus di dalam teks.
+
+        Args:
+            text (str): Teks yang akan dicari.
+
+        Yields:
+            Tuple posisi awal, posisi akhir (eksklusif), dan nilai pengganti (string kosong).
+        """
+        offset = 0
+        for i, part in enumerate(split_segments(text)):
+            if i % 2 == 0 and _RUN_PATTERN.search(part):
+                for start, end in self._deletions(part):
+                    yield offset + start, offset + end, ""
+            offset += len(part)
+
+    def subn(self, text: str) -> Tuple[str, int]:
+        """Mengganti *word elongation* pada teks.
+
+        Args:
+            text (str): Teks yang akan dimodifikasi.
+
+        Returns:
+            Teks yang telah dimodifikasi beserta jumlah kata yang diganti.
+        """
+        if _RUN_PATTERN.search(text) is None:
+            return text, 0
+        parts, count = self.subn_segments(split_segments(text))
+        return "".join(parts), count
+
+    def subn_segments(self, parts: List[str]) -> Tuple[List[str], int]:
+        """`subn` untuk teks yang telah dipecah menggunakan `split_segments`."""
+        search = _RUN_PATTERN.search
+        count = 0
+        for i in range(0, len(parts), 2):
+            word = parts[i]
+            if search(word):
+                parts[i] = self.normalize(word)
+                count += parts[i] != word
+        return parts, count
+
+    def fingerprint(self) -> str:
+        """Mendapatkan fingerprint daftar kata, digunakan oleh `Pipeline.fingerprint`.
+
+        Returns:
+            Fingerprint (sha256) daftar kata.
+        """
+        with self._lock:
+            if self._fingerprint is None or self._fingerprint[0] != self.version:
+                state = "\n".join(sorted(self._words))
+                digest = hashlib.sha256(state.encode("utf-8")).hexdigest()
+                self._fingerprint = (self.version, digest)
+            return self._fingerprint[1]
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and fold(word) in self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the index is rebuilt from the words, it is larger and cheap to build
+        return (Vocabulary, (sorted(self._words),))
+
+    def __repr__(self) -> str:
+        return f"Vocabulary(words={len(self)}, version={self.version})"
@@ -1,6 +1,6 @@
 """Data containing Indonesian slang words
-   based on: Kamus Alay - Colloquial Indonesian Lexicon by Salsabila, Ali, Yosef, and Ade
-   https://github.com/nasalsabila/kamus-alay
+based on: Kamus Alay - Colloquial Indonesian Lexicon by Salsabila, Ali, Yosef, and Ade
+https://github.com/nasalsabila/kamus-alay
 """
 
 __all__ = ["SLANG_DATA"]
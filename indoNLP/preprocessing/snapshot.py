@@ -0,0 +1,152 @@
+"""Snapshot biner untuk data emoji, *slang words*, dan stopwords. Snapshot berisi data yang telah
+siap digunakan (emoji yang telah diurutkan, `WORDS_EMOJI_DATA`, `SLANG_DATA`, `STOPWORDS`, dan
+*trie* untuk setiap data) dalam format `marshal` sehingga dapat diload dengan sekali baca tanpa
+parsing dan eksekusi modul data yang berukuran besar.
+
+Snapshot dibuat menggunakan `tools/build-snapshot.py` (`make build-snapshot`). Jika file snapshot
+tidak ditemukan atau sudah tidak sesuai dengan modul data maupun modul yang membuat data snapshot
+(*stale*) maka data akan diload dari modul data python.
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+from typing import Any, Callable, Dict, Optional, Sequence, TypeVar
+
+__all__ = ["SNAPSHOT_PATH", "source_fingerprint", "write_snapshot", "load_snapshot"]
+
+T = TypeVar("T")
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "lexicon.snapshot")
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b"IDNLPSNP"
+_HEADER = struct.Struct("<8sI")  # magic, header length
+_SOURCES = (
+    os.path.join("emoji", "emoji_data.py"),
+    "slang_data.py",
+    "stopwords_data.py",
+)
+# modules building the snapshot data, the tries state format is defined by `trie.py`
+_BUILDERS = (
+    "__init__.py",
+    os.path.join("emoji", "__init__.py"),
+    "trie.py",
+)
+
+_NOT_LOADED = object()
+_snapshot: Any = _NOT_LOADED
+
+
+def source_fingerprint() -> Optional[str]:
+    """Mendapatkan fingerprint (sha256) dari modul - modul data.
+
+    Returns:
+        Fingerprint modul data, `None` jika salah satu modul data tidak dapat dibaca.
+    """
+    return _fingerprint_files(_SOURCES)
+
+
+def _fingerprint_files(sources: Sequence[str]) -> Optional[str]:
+    """Fingerprint (sha256) file - file di dalam `indoNLP.preprocessing`"""
+    digest = hashlib.sha256()
+    base = os.path.dirname(__file__)
+    for source in sources:
+        try:
+            with open(os.path.join(base, source), "rb") as reader:
+                digest.update(reader.read())
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
+def write_snapshot(path: str = SNAPSHOT_PATH) -> None:
+    """Membuat snapshot biner dari modul - modul data.
+
+    Args:
+        path (str, optional): Path file snapshot.
+    """
+    from indoNLP.preprocessing import _build_slang_trie, _build_stopwords_trie
+    from indoNLP.preprocessing.emoji import _generate_words_to_emoji_mapper, _load_emoji_data
+    from indoNLP.preprocessing.slang_data import SLANG_DATA
+    from indoNLP.preprocessing.stopwords_data import STOPWORDS
+    from indoNLP.preprocessing.trie import CharTrie
+
+    emoji_data = _load_emoji_data()
+    payload = marshal.dumps(
+        {
+            "EMOJI_DATA": emoji_data,
+            "WORDS_EMOJI_DATA": _generate_words_to_emoji_mapper(emoji_data),
+            "SLANG_DATA": SLANG_DATA,
+            "STOPWORDS": STOPWORDS,
+            # matchers state, see `__getstate__` on `indoNLP.preprocessing.trie`
+            "_SLANG_TRIE": _build_slang_trie(SLANG_DATA).__getstate__(),
+            "_STOPWORDS_TRIE": _build_stopwords_trie(STOPWORDS).__getstate__(),
+            "_EMOJI_TRIE": CharTrie(emoji_data).__getstate__(),
+        }
+    )
+    _write_file(path, _snapshot_header(), payload)
+
+
+def load_snapshot(path: str = SNAPSHOT_PATH) -> Optional[Dict[str, Any]]:
+    """Loading snapshot biner.
+
+    Args:
+        path (str, optional): Path file snapshot.
+
+    Returns:
+        Data di dalam snapshot, `None` jika snapshot tidak ditemukan, rusak, atau *stale*.
+    """
+    data: Optional[Dict[str, Any]] = _read_file(path, _snapshot_header())
+    return data
+
+
+def _snapshot_header() -> Dict[str, Any]:
+    """Header snapshot, snapshot *stale* jika modul yang membuat data snapshot diubah"""
+    return {"version": SNAPSHOT_VERSION, "builders": _fingerprint_files(_BUILDERS)}
+
+
+def _write_file(path: str, header: Dict[str, Any], payload: bytes) -> None:
+    """Menulis payload `marshal` beserta header, fingerprint modul data ditambahkan ke header"""
+    header = {**header, "marshal": marshal.version, "fingerprint": source_fingerprint()}
+    encoded = marshal.dumps(header)
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as writer:
+        writer.write(_HEADER.pack(_MAGIC, len(encoded)) + encoded + payload)
+    os.replace(temp, path)  # atomic, readers never see a partial file
+
+
+def _read_file(path: str, header: Dict[str, Any]) -> Any:
+    """Membaca payload `marshal`, `None` jika file tidak ditemukan, rusak, atau header berbeda"""
+    expected = {**header, "marshal": marshal.version, "fingerprint": source_fingerprint()}
+    try:
+        with open(path, "rb") as reader:
+            buffer = memoryview(reader.read())
+        magic, length = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            return None
+        offset = _HEADER.size
+        if marshal.loads(buffer[offset : offset + length]) != expected:
+            return None
+        return marshal.loads(buffer[offset + length :])
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+
+
+def _get_snapshot() -> Optional[Dict[str, Any]]:
+    """Loading snapshot default sekali per proses"""
+    global _snapshot
+    if _snapshot is _NOT_LOADED:
+        _snapshot = load_snapshot()
+    snapshot: Optional[Dict[str, Any]] = _snapshot
+    return snapshot
+
+
+def _load_data(name: str, fallback: Callable[[], T]) -> T:
+    """Loading data dari snapshot, menggunakan `fallback` jika data tidak tersedia"""
+    snapshot = _get_snapshot()
+    if snapshot is not None and name in snapshot:
+        data: T = snapshot[name]
+        return data
+    return fallback()
@@ -0,0 +1,507 @@
+"""Mode anotasi (*span*) untuk fungsi - fungsi preprocessing dan pipeline. Alih - alih membuat
+teks baru, setiap fungsi menghasilkan daftar perubahan `(start, end, kind, replacement)` relatif
+terhadap teks asli sehingga posisi slang, stopwords, URL, HTML, dan emoji dapat diketahui
+(contoh: untuk *labelling tools* atau *alignment* NER). Teks hasil preprocessing dibuat ketika
+dibutuhkan saja (`Annotation.apply`) dan posisi pada teks hasil dapat dipetakan kembali ke teks
+asli (`Annotation.to_original`).
+
+Examples:
+    >>> from indoNLP.preprocessing import spans
+    >>> annotation = spans.replace_slang("gw gk mw")
+    >>> list(annotation)
+    [Span(start=0, end=2, kind='replace_slang', replacement='gue'), ...]
+    >>> annotation.apply()
+    'gue enggak mau'
+"""
+
+import bisect
+import re
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from indoNLP.preprocessing import (
+    _WE_INNER_PATTERN,
+    HTML_PATTERN,
+    URL_PATTERN,
+    Pipeline,
+    _find_words_emoji,
+    _fuzzy_index,
+    _get,
+)
+from indoNLP.preprocessing.fuzzy import FuzzyIndex
+from indoNLP.preprocessing.html import DEFAULT_MAX_TAG_LENGTH, HTMLStripper
+from indoNLP.preprocessing.lexicon import Lexicon, Vocabulary
+from indoNLP.preprocessing.trie import CharTrie, WordTrie
+
+__all__ = [
+    "Span",
+    "Annotation",
+    "annotate",
+    "remove_html",
+    "strip_html",
+    "remove_url",
+    "remove_stopwords",
+    "replace_slang",
+    "replace_word_elongation",
+    "emoji_to_words",
+    "words_to_emoji",
+]
+
+
+class Span(NamedTuple):
+    """Perubahan pada teks.
+
+    Attributes:
+        start (int): Posisi awal pada teks asli.
+        end (int): Posisi akhir (eksklusif) pada teks asli.
+        kind (str): Nama step yang melakukan perubahan, `"strip"` untuk whitespace yang dihapus
+            di awal / akhir teks. Perubahan dari beberapa step yang saling bertumpuk digabungkan
+            dengan nama step dipisahkan `+` (contoh: `"replace_slang+remove_stopwords"`).
+        replacement (str): Teks pengganti, string kosong jika teks dihapus.
+    """
+
+    start: int
+    end: int
+    kind: str
+    replacement: str
+
+
+class Annotation:
+    """Teks asli beserta perubahan - perubahan yang terurut dan tidak saling bertumpuk.
+
+    Args:
+        text (str): Teks asli.
+        spans (List[Span]): Perubahan relatif terhadap teks asli.
+    """
+
+    def __init__(self, text: str, spans: List[Span]) -> None:
+        self.text = text
+        self.spans = spans
+
+    def apply(self) -> str:
+        """Menerapkan semua perubahan.
+
+        Returns:
+            Teks hasil preprocessing.
+        """
+        return _apply(self.text, self.spans)
+
+    def to_original(self, offset: int, end: bool = False) -> int:
+        """Memetakan posisi pada teks hasil (`apply`) ke posisi pada teks asli.
+
+        Args:
+            offset (int): Posisi pada teks hasil.
+            end (bool, optional): Posisi merupakan batas akhir (eksklusif) sebuah rentang. Posisi
+                awal dipetakan setelah teks yang dihapus sedangkan posisi akhir dipetakan
+                sebelum teks yang dihapus. Posisi di dalam teks pengganti dipetakan ke awal
+                (atau akhir jika `end=True`) teks yang digantikan.
+
+        Returns:
+            Posisi pada teks asli.
+
+        Examples:
+            >>> annotation = spans.remove_html("<b>Jakarta</b> macet")
+            >>> annotation.apply()
+            'Jakarta macet'
+            >>> annotation.to_original(0), annotation.to_original(7, end=True)
+            (3, 10)
+        """
+        delta = 0  # original position - cleaned position
+        for span in self.spans:
+            start = span.start - delta
+            stop = start + len(span.replacement)
+            if offset < start or (offset == start and (end or span.replacement)):
+                return offset + delta
+            if offset < stop:
+                return span.end if end else span.start
+            if offset == stop and end and span.replacement:
+                return span.end
+            delta += span.end - span.start - len(span.replacement)
+        return offset + delta
+
+    def __iter__(self) -> Iterator[Span]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Annotation):
+            return NotImplemented
+        return self.text == other.text and self.spans == other.spans
+
+    def __repr__(self) -> str:
+        return f"Annotation({self.text!r}, {self.spans!r})"
+
+
+def _apply(text: str, spans: List[Span]) -> str:
+    """Menerapkan perubahan pada teks"""
+    result: List[str] = []
+    cursor = 0
+    for span in spans:
+        result.append(text[cursor : span.start])
+        result.append(span.replacement)
+        cursor = span.end
+    result.append(text[cursor:])
+    return "".join(result)
+
+
+def _strip_spans(text: str, spans: List[Span]) -> List[Span]:
+    """Menambahkan perubahan `str.strip` pada teks hasil penghapusan `spans`"""
+    # every span deletes text, the result is made of the regions between them
+    kept: List[Tuple[int, int]] = []
+    cursor = 0
+    for span in spans:
+        if span.start > cursor:
+            kept.append((cursor, span.start))
+        cursor = span.end
+    if cursor < len(text):
+        kept.append((cursor, len(text)))
+
+    strip: List[Span] = []
+    for start, end in kept:  # leading whitespace
+        stop = start
+        while stop < end and text[stop].isspace():
+            stop += 1
+        if stop > start:
+            strip.append(Span(start, stop, "strip", ""))
+        if stop < end:
+            break
+    else:
+        return sorted(spans + strip)  # nothing but whitespace is left
+    for start, end in reversed(kept):  # trailing whitespace
+        stop = end
+        while stop > start and text[stop - 1].isspace():
+            stop -= 1
+        if stop < end:
+            strip.append(Span(stop, end, "strip", ""))
+        if stop > start:
+            break
+    return sorted(spans + strip)
+
+
+def _html_spans(text: str) -> List[Span]:
+    """Perubahan `remove_html`"""
+    matches = [Span(x.start(), x.end(), "remove_html", "") for x in re.finditer(HTML_PATTERN, text)]
+    return _strip_spans(text, matches)
+
+
+def _strip_html_spans(
+    text: str, max_tag_length: int = DEFAULT_MAX_TAG_LENGTH, multiline: bool = False
+) -> List[Span]:
+    """Perubahan `strip_html`"""
+    stripper = HTMLStripper(max_tag_length, multiline)
+    matches = [Span(x, y, "strip_html", "") for x, y in stripper.finditer(text)]
+    return _strip_spans(text, matches)
+
+
+def _url_spans(text: str) -> List[Span]:
+    """Perubahan `remove_url`"""
+    matches = [Span(x.start(), x.end(), "remove_url", "") for x in re.finditer(URL_PATTERN, text)]
+    return _strip_spans(text, matches)
+
+
+def _stopwords_spans(text: str, lexicon: Optional[Lexicon] = None) -> List[Span]:
+    """Perubahan `remove_stopwords`"""
+    matcher: Union[WordTrie, Lexicon] = _get("_STOPWORDS_TRIE") if lexicon is None else lexicon
+    matches = [Span(x, y, "remove_stopwords", z) for x, y, z in matcher.finditer(text)]
+    return _strip_spans(text, matches)
+
+
+def _slang_spans(
+    text: str, lexicon: Optional[Lexicon] = None, fuzzy: Union[int, FuzzyIndex] = 0
+) -> List[Span]:
+    """Perubahan `replace_slang`"""
+    matcher: Union[WordTrie, Lexicon] = _get("_SLANG_TRIE") if lexicon is None else lexicon
+    matches = matcher.finditer(text, _fuzzy_index(fuzzy))
+    return [Span(x, y, "replace_slang", z) for x, y, z in matches]
+
+
+def _elongation_spans(text: str, vocabulary: Optional[Vocabulary] = None) -> List[Span]:
+    """Perubahan `replace_word_elongation`, hanya huruf berulang yang dihapus"""
+    if vocabulary is not None:
+        return [Span(x, y, "replace_word_elongation", z) for x, y, z in vocabulary.finditer(text)]
+    matches = _WE_INNER_PATTERN.finditer(text)
+    return [Span(x.start(2), x.end(2), "replace_word_elongation", "") for x in matches]
+
+
+def _emoji_spans(
+    text: str, lang: str = "id", use_alias: bool = False, delimiter: Tuple[str, str] = ("!", "!")
+) -> List[Span]:
+    """Perubahan `emoji_to_words`"""
+    assert lang in ["en", "id"], "Bahasa yang disupport hanya English (en) dan Indonesia (id)"
+    if use_alias:
+        assert lang == "id", "use_alias hanya bekerja untuk Bahasa Indonesia `lang='id'`"
+    trie: CharTrie = _get("_EMOJI_TRIE")
+    result: List[Span] = []
+    for start, end, emoji in trie.finditer(text):
+        name = emoji.get("alias", emoji["id"]) if use_alias else emoji[lang]
+        result.append(Span(start, end, "emoji_to_words", delimiter[0] + name + delimiter[1]))
+    return result
+
+
+def _words_emoji_spans(
+    text: str, lang: str = "id", use_alias: bool = False, delimiter: Tuple[str, str] = ("!", "!")
+) -> List[Span]:
+    """Perubahan `words_to_emoji`"""
+    matches = _find_words_emoji(text, lang, use_alias, delimiter)
+    return [Span(x, y, "words_to_emoji", z) for x, y, z in matches]
+
+
+def _get_span_steps() -> Dict[str, Callable[..., List[Span]]]:
+    """Fungsi perubahan untuk setiap step bawaan"""
+    return {
+        "remove_html": _html_spans,
+        "strip_html": _strip_html_spans,
+        "remove_url": _url_spans,
+        "remove_stopwords": _stopwords_spans,
+        "replace_slang": _slang_spans,
+        "replace_word_elongation": _elongation_spans,
+        "emoji_to_words": _emoji_spans,
+        "words_to_emoji": _words_emoji_spans,
+    }
+
+
+def _diff_spans(before: str, after: str, kind: str) -> List[Span]:
+    """Perubahan custom step, satu span dari bagian teks yang berbeda"""
+    if before == after:
+        return []
+    prefix = 0
+    limit = min(len(before), len(after))
+    while prefix < limit and before[prefix] == after[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and before[-suffix - 1] == after[-suffix - 1]:
+        suffix += 1
+    return [Span(prefix, len(before) - suffix, kind, after[prefix : len(after) - suffix])]
+
+
+def _compose(text: str, base: List[Span], edits: List[Span]) -> List[Span]:
+    """Menggabungkan perubahan `edits` pada `text` (teks hasil perubahan `base`) dengan `base`
+    sehingga semua perubahan relatif terhadap teks asli"""
+    if not base:
+        return edits
+    # pieces of `text` alternating between (possibly empty) untouched gaps and replacements of
+    # `base`: (start, end, original start, span or None)
+    pieces: List[Tuple[int, int, int, Any]] = []
+    position, original = 0, 0
+    for span in base:
+        length = span.start - original
+        pieces.append((position, position + length, original, None))
+        position += length
+        pieces.append((position, position + len(span.replacement), span.start, span))
+        position += len(span.replacement)
+        original = span.end
+    pieces.append((position, len(text), original, None))
+    starts = [x[0] for x in pieces]
+
+    def _original(position: int, start: bool) -> int:
+        """Posisi pada teks asli, posisi awal dipetakan setelah teks yang dihapus"""
+        i = bisect.bisect_right(starts, position) - 1
+        if pieces[i][3] is not None:  # start of a replacement, the gap before it ends here
+            i -= 1
+        while not start and i >= 2 and pieces[i - 2][1] == position:
+            i -= 2  # end positions are mapped before deleted regions
+        return pieces[i][2] + position - pieces[i][0]
+
+    def _absorbs(piece: Tuple[int, int, int, Any], start: int, end: int) -> bool:
+        """Apakah perubahan `base` bertumpuk dengan rentang `start` - `end`"""
+        if piece[3] is None:
+            return False
+        if piece[0] == piece[1]:  # deletion
+            return start < piece[0] < end
+        if start == end:  # insertion
+            return piece[0] < start < piece[1]
+        return piece[0] < end and start < piece[1]
+
+    result: List[Span] = []
+    absorbed: Set[int] = set()
+    i = 0
+    while i < len(edits):
+        # grow the region until it covers every overlapping edit and replacement of `base`
+        start, end, j = edits[i].start, edits[i].end, i + 1
+        changed = True
+        while changed:
+            changed = False
+            while j < len(edits) and edits[j].start < end:
+                end = max(end, edits[j].end)
+                j += 1
+            low = max(bisect.bisect_left(starts, start) - 1, 0)
+            high = bisect.bisect_right(starts, end)
+            for k in range(low, high):
+                if k not in absorbed and _absorbs(pieces[k], start, end):
+                    absorbed.add(k)
+                    if pieces[k][0] < start or pieces[k][1] > end:
+                        start, end = min(start, pieces[k][0]), max(end, pieces[k][1])
+                        changed = True
+
+        group = edits[i:j]
+        kinds: List[str] = []
+        low = max(bisect.bisect_left(starts, start) - 1, 0)
+        for k in range(low, bisect.bisect_right(starts, end)):
+            if k in absorbed and start <= pieces[k][0] <= end:
+                kinds.extend(pieces[k][3].kind.split("+"))
+        kinds.extend(x.kind for x in group)
+        replacement = _apply(
+            text[start:end], [x._replace(start=x.start - start, end=x.end - start) for x in group]
+        )
+        result.append(
+            Span(
+                _original(start, True),
+                _original(end, start == end),
+                "+".join(dict.fromkeys(kinds)),  # unique kinds, in order
+                replacement,
+            )
+        )
+        i = j
+
+    result.extend(x[3] for k, x in enumerate(pieces) if x[3] is not None and k not in absorbed)
+    return sorted(result)
+
+
+def annotate(pipe: Pipeline, text: str) -> Annotation:
+    """Menjalankan pipeline dalam mode anotasi, lihat `Pipeline.annotate`.
+
+    Args:
+        pipe (Pipeline): Pipeline yang dijalankan.
+        text (str): Teks input.
+
+    Returns:
+        Anotasi perubahan pipeline relatif terhadap teks asli.
+    """
+    steps = _get_span_steps()
+    spans: List[Span] = []
+    current = text
+    for step, params in pipe._steps:
+        if isinstance(step, str):
+            edits = steps[step](current, **params)
+            after = _apply(current, edits)
+        else:  # custom steps can only be compared before and after
+            after = step(current)
+            name = getattr(step, "__name__", type(step).__name__)
+            edits = _diff_spans(current, after, name)
+        if edits:
+            spans = _compose(current, spans, edits)
+        current = after
+    return Annotation(text, spans)
+
+
+def remove_html(text: str) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.remove_html`.
+
+    Args:
+        text (str): Teks yang memiliki html tag di dalamnya.
+
+    Returns:
+        Anotasi tag - tag HTML yang dihapus.
+    """
+    return Annotation(text, _html_spans(text))
+
+
+def strip_html(
+    text: str, max_tag_length: int = DEFAULT_MAX_TAG_LENGTH, multiline: bool = False
+) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.strip_html`.
+
+    Args:
+        text (str): Teks yang memiliki html tag di dalamnya.
+        max_tag_length (int, optional): Panjang maksimum tag / entity.
+        multiline (bool, optional): Menghapus tag yang mengandung baris baru.
+
+    Returns:
+        Anotasi tag - tag HTML yang dihapus.
+    """
+    return Annotation(text, _strip_html_spans(text, max_tag_length, multiline))
+
+
+def remove_url(text: str) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.remove_url`.
+
+    Args:
+        text (str): Teks yang terdapat URL di dalamnya.
+
+    Returns:
+        Anotasi URL yang dihapus.
+    """
+    return Annotation(text, _url_spans(text))
+
+
+def remove_stopwords(text: str, lexicon: Optional[Lexicon] = None) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.remove_stopwords`.
+
+    Args:
+        text (str): Teks yang terdapat stopwords di dalamnya.
+        lexicon (Lexicon, optional): Leksikon stopwords sebagai pengganti `STOPWORDS`.
+
+    Returns:
+        Anotasi stopwords yang dihapus.
+    """
+    return Annotation(text, _stopwords_spans(text, lexicon))
+
+
+def replace_slang(
+    text: str, lexicon: Optional[Lexicon] = None, fuzzy: Union[int, FuzzyIndex] = 0
+) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.replace_slang`.
+
+    Args:
+        text (str): Teks yang terdapat *slang words* di dalamnya.
+        lexicon (Lexicon, optional): Leksikon *slang words* sebagai pengganti `SLANG_DATA`.
+        fuzzy (Union[int, FuzzyIndex], optional): Jarak edit maksimum atau index *fuzzy*.
+
+    Returns:
+        Anotasi *slang words* beserta penggantinya.
+    """
+    return Annotation(text, _slang_spans(text, lexicon, fuzzy))
+
+
+def replace_word_elongation(text: str, vocabulary: Optional[Vocabulary] = None) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.replace_word_elongation`.
+
+    Args:
+        text (str): Teks yang terdapat *word elongation* di dalamnya.
+        vocabulary (Vocabulary, optional): Daftar kata untuk memvalidasi hasil peringkasan.
+
+    Returns:
+        Anotasi huruf - huruf berulang yang dihapus.
+    """
+    return Annotation(text, _elongation_spans(text, vocabulary))
+
+
+def emoji_to_words(
+    text: str,
+    lang: str = "id",
+    use_alias: bool = False,
+    delimiter: Tuple[str, str] = ("!", "!"),
+) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.emoji_to_words`.
+
+    Args:
+        text (str): Teks yang terdapat emoji di dalamnya.
+        lang (str, optional): Kode bahasa, "en" (English) atau "id" (Bahasa Indonesia).
+        use_alias (bool, optional): Menggunakan alias translation.
+        delimiter (Tuple[str, str], optional): Delimiter (pembatas) pada terjemahan emoji.
+
+    Returns:
+        Anotasi emoji beserta terjemahannya.
+    """
+    return Annotation(text, _emoji_spans(text, lang, use_alias, delimiter))
+
+
+def words_to_emoji(
+    text: str,
+    lang: str = "id",
+    use_alias: bool = False,
+    delimiter: Tuple[str, str] = ("!", "!"),
+) -> Annotation:
+    """Versi anotasi dari `indoNLP.preprocessing.words_to_emoji`.
+
+    Args:
+        text (str): Teks yang terdapat kata - kata dengan kode emoji di dalamnya.
+        lang (str, optional): Kode bahasa, "en" (English) atau "id" (Bahasa Indonesia).
+        use_alias (bool, optional): Menggunakan alias translation.
+        delimiter (Tuple[str, str], optional): Delimiter (pembatas) pada kata - kata kode emoji.
+
+    Returns:
+        Anotasi kata - kata kode emoji beserta emojinya.
+    """
+    return Annotation(text, _words_emoji_spans(text, lang, use_alias, delimiter))
@@ -0,0 +1,190 @@
+"""Statistik (*instrumentation*) pipeline preprocessing per step, berisi waktu eksekusi kumulatif,
+jumlah pemanggilan, jumlah karakter input / output, jumlah penggantian (*match*) yang dilakukan,
+dan jumlah pemanggilan yang dilewati oleh prefilter pada setiap step. Statistik setiap worker
+*batch preprocessing* dicatat menggunakan `WorkerStats`, lihat
+`indoNLP.preprocessing.batch.ChunkScheduler`."""
+
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+__all__ = ["StepStats", "PipelineStats", "WorkerStats"]
+
+
+@dataclass
+class StepStats:
+    """Statistik sebuah step pipeline.
+
+    Attributes:
+        name (str): Nama step, step - step yang digabungkan (`fuse=True`) dipisahkan dengan `+`.
+        calls (int): Jumlah pemanggilan.
+        time (float): Waktu eksekusi kumulatif dalam detik.
+        chars_in (int): Jumlah karakter input.
+        chars_out (int): Jumlah karakter output.
+        matches (int): Jumlah penggantian yang dilakukan, selalu `0` untuk *custom step*.
+        skipped (int): Jumlah pemanggilan yang dilewati karena prefilter menunjukkan step pasti
+            tidak mengubah teks.
+    """
+
+    name: str
+    calls: int = 0
+    time: float = 0.0
+    chars_in: int = 0
+    chars_out: int = 0
+    matches: int = 0
+    skipped: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        """Rasio pemanggilan yang dilewati oleh prefilter, `0.0` jika step belum dipanggil."""
+        return self.skipped / self.calls if self.calls else 0.0
+
+    def update(
+        self, time: float, chars_in: int, chars_out: int, matches: int, skipped: int = 0
+    ) -> None:
+        """Menambahkan hasil satu kali pemanggilan step.
+
+        Args:
+            time (float): Waktu eksekusi dalam detik.
+            chars_in (int): Jumlah karakter input.
+            chars_out (int): Jumlah karakter output.
+            matches (int): Jumlah penggantian.
+            skipped (int, optional): `1` jika pemanggilan dilewati oleh prefilter.
+        """
+        self.calls += 1
+        self.time += time
+        self.chars_in += chars_in
+        self.chars_out += chars_out
+        self.matches += matches
+        self.skipped += skipped
+
+
+@dataclass
+class WorkerStats:
+    """Statistik sebuah worker *batch preprocessing*.
+
+    Attributes:
+        worker (str): Identitas worker, `pid/nama thread`.
+        tasks (int): Jumlah task (chunk) yang dijalankan.
+        texts (int): Jumlah teks yang diproses.
+        chars (int): Jumlah karakter yang diproses.
+        time (float): Waktu eksekusi kumulatif dalam detik.
+        cpu_time (float): Waktu CPU kumulatif dalam detik, lebih kecil dari `time` ketika worker
+            menunggu CPU (jumlah worker melebihi jumlah core) atau GIL (*thread pool*).
+        max_time (float): Waktu eksekusi task terlama dalam detik.
+    """
+
+    worker: str
+    tasks: int = 0
+    texts: int = 0
+    chars: int = 0
+    time: float = 0.0
+    cpu_time: float = 0.0
+    max_time: float = 0.0
+
+    def update(self, texts: int, chars: int, time: float, cpu_time: float) -> None:
+        """Menambahkan hasil satu task.
+
+        Args:
+            texts (int): Jumlah teks.
+            chars (int): Jumlah karakter.
+            time (float): Waktu eksekusi dalam detik.
+            cpu_time (float): Waktu CPU dalam detik.
+        """
+        self.tasks += 1
+        self.texts += texts
+        self.chars += chars
+        self.time += time
+        self.cpu_time += cpu_time
+        self.max_time = max(self.max_time, time)
+
+
+class PipelineStats:
+    """Kumpulan statistik setiap step pipeline sesuai dengan urutan step. Statistik dapat diperbarui
+    oleh beberapa thread sekaligus (contoh: `Pipeline.map` dengan `use_threads=True`).
+
+    Args:
+        names (Sequence[str]): Nama - nama step.
+
+    Examples:
+        >>> pipe = indoNLP.preprocessing.pipeline([replace_slang, remove_stopwords], instrument=True)
+        >>> pipe("gw gk mw makan")
+        "gue   makan"
+        >>> pipe.stats["replace_slang"].matches
+        3
+        >>> pipe.stats.as_dict()["remove_stopwords"]["chars_in"]
+        20
+        >>> pipe.stats["remove_stopwords"].skip_rate
+        0.0
+    """
+
+    def __init__(self, names: Sequence[str]) -> None:
+        self.steps = [StepStats(x) for x in names]
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> StepStats:
+        for step in self.steps:
+            if step.name == name:
+                return step
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[StepStats]:
+        return iter(self.steps)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __repr__(self) -> str:
+        return f"PipelineStats({self.steps!r})"
+
+    def update(self, results: Sequence[Tuple[float, int, int, int, int]]) -> None:
+        """Menambahkan hasil satu kali pemanggilan pipeline, lihat `StepStats.update`.
+
+        Args:
+            results (Sequence[Tuple[float, int, int, int, int]]): Waktu eksekusi, jumlah karakter
+                input, jumlah karakter output, jumlah penggantian, dan `skipped` setiap step sesuai
+                dengan urutan step.
+        """
+        with self._lock:
+            for stats, result in zip(self.steps, results):
+                stats.update(*result)
+
+    def reset(self) -> None:
+        """Mengembalikan semua statistik ke nilai awal."""
+        with self._lock:
+            self.steps = [StepStats(x.name) for x in self.steps]
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Mendapatkan statistik dalam bentuk dictionary, misalnya untuk diekspor ke sistem
+        *metrics*.
+
+        Returns:
+            Dictionary nama step ke statistiknya.
+        """
+        with self._lock:
+            return {
+                x.name: {
+                    **{k: v for k, v in asdict(x).items() if k != "name"},
+                    "skip_rate": x.skip_rate,
+                }
+                for x in self.steps
+            }
+
+    def summary(self) -> str:
+        """Ringkasan statistik dalam bentuk tabel.
+
+        Returns:
+            Tabel statistik setiap step.
+        """
+        width = max([len("step")] + [len(x.name) for x in self.steps])
+        header = (
+            f"{'step':<{width}} {'calls':>10} {'time (s)':>10} {'chars in':>12}"
+            f" {'chars out':>12} {'matches':>10} {'skip %':>8}"
+        )
+        rows: List[str] = [header, "-" * len(header)]
+        for x in self.steps:
+            rows.append(
+                f"{x.name:<{width}} {x.calls:>10} {x.time:>10.4f} {x.chars_in:>12}"
+                f" {x.chars_out:>12} {x.matches:>10} {x.skip_rate:>8.1%}"
+            )
+        return "\n".join(rows)
@@ -0,0 +1,581 @@
+"""Struktur data *trie* yang digunakan sebagai mesin pencocokan kamus (*multi-pattern matcher*)
+pada modul `indoNLP.preprocessing`. Biaya pencocokan sebanding dengan panjang teks dan tidak
+bergantung pada banyaknya kata di dalam kamus."""
+
+import marshal
+import re
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Pattern, Tuple
+
+__all__ = ["WordTrie", "CharTrie", "split_segments", "fold"]
+
+_SEGMENT_PATTERN = re.compile(r"(\W+)")
+_ENTRY = ""  # node key for terminal entry, segments are never empty
+Fallback = Callable[[str], Optional[str]]
+
+# non-ASCII characters treated equal to an ASCII letter by `re` when using `(?i)`
+_FOLD_TABLE = {0x130: "i", 0x131: "i", 0x17F: "s"}
+
+
+def split_segments(text: str) -> List[str]:
+    r"""Memecah teks menjadi segmen kata (`\w+`) dan non-kata (`\W+`) secara bergantian.
+
+    Args:
+        text (str): Teks yang akan dipecah.
+
+    Returns:
+        List segmen dengan jumlah ganjil, segmen pada index genap adalah kata dan segmen pada
+            index ganjil adalah non-kata. Segmen pertama dan terakhir dapat berupa string kosong.
+
+    Examples:
+        >>> indoNLP.preprocessing.trie.split_segments("gw gk mw!!")
+        ['gw', ' ', 'gk', ' ', 'mw', '!!', '']
+    """
+    return _SEGMENT_PATTERN.split(text)
+
+
+def fold(text: str) -> str:
+    """Case folding yang setara dengan flag `(?i)` pada `re` untuk kamus berhuruf ASCII.
+
+    Args:
+        text (str): Teks yang akan di-*fold*.
+
+    Returns:
+        Teks dalam huruf kecil dengan panjang yang sama dengan teks awal.
+    """
+    if text.isascii():
+        return text.lower()
+    return text.translate(_FOLD_TABLE).lower()
+
+
+def _push(out: List[str], segment: str, word: bool) -> None:
+    """Menambahkan satu segmen ke `out` dengan tetap menjaga format `split_segments`"""
+    if segment == "":
+        return
+    if word:
+        out[-1] += segment
+    elif out[-1] == "" and len(out) > 1:
+        out[-2] += segment  # adjacent non-word segments are merged
+    else:
+        out.append(segment)
+        out.append("")
+
+
+def _extend(out: List[str], parts: List[str], start: int, end: int) -> None:
+    """Menambahkan `parts[start:end]` ke `out` dengan tetap menjaga format `split_segments`"""
+    if start >= end:
+        return
+    if start % 2 == 0:
+        out[-1] += parts[start]
+        if parts[start] == "" and out[-1] == "" and len(out) > 1 and start + 1 < end:
+            out[-2] += parts[start + 1]  # empty word between two non-word segments
+            start += 1
+        start += 1
+    elif out[-1] == "" and len(out) > 1:
+        out[-2] += parts[start]
+        start += 1
+    if start >= end:
+        return
+    if start % 2 == 0:
+        out[-1] = parts[start]  # current word slot is still empty
+        start += 1
+    out.extend(parts[start:end])
+    if end % 2 == 0:  # last segment is a non-word
+        out.append("")
+
+
+class WordTrie:
+    r"""*Trie* berbasis segmen kata untuk mencari dan mengganti kata atau frasa dengan batas kata
+    (`\b`) dan *case insensitive*. Setiap node merepresentasikan satu segmen kata / non-kata
+    sehingga setiap posisi di dalam teks cukup diperiksa dengan satu *lookup* dictionary.
+
+    Hasil pencocokan setara dengan pattern regex `(?i)\b(key_1|key_2|...)\b` dimana setiap key
+    diperlakukan sebagai literal. Jika beberapa key cocok pada posisi yang sama, key yang lebih
+    dahulu ditambahkan yang dipilih (sama seperti urutan alternasi regex) atau key terpanjang
+    jika `longest=True`.
+
+    Args:
+        data (Mapping[str, str], optional): Mapper key (kata / frasa) ke nilai penggantinya.
+        longest (bool, optional): Memilih key terpanjang ketika terdapat beberapa key yang cocok.
+        patterns (Mapping[str, str], optional): Mapper regex ke nilai penggantinya. Regex
+            dicocokkan (`fullmatch`) terhadap satu segmen kata ketika tidak ada key yang cocok.
+
+    Examples:
+        >>> trie = indoNLP.preprocessing.trie.WordTrie({"gw": "gue", "gk": "enggak"})
+        >>> trie.sub("Gw gk tau")
+        "gue enggak tau"
+    """
+
+    def __init__(
+        self,
+        data: Optional[Mapping[str, str]] = None,
+        longest: bool = False,
+        patterns: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.longest = longest
+        self._root: Dict[str, Any] = {}
+        self._patterns: List[Tuple[Pattern[str], str]] = []
+        self._counter = 0
+        self._size = 0
+        self._value_segments: Dict[str, List[str]] = {}
+        self._pattern_filter: Callable[[str], Any] = self._match_pattern
+        if data is not None:
+            for key, value in data.items():
+                self.add(key, value)
+        if patterns is not None:
+            for pattern, value in patterns.items():
+                self.add_pattern(pattern, value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # plain builtins only so the state can be stored with `marshal`
+        return {
+            "root": self._root,
+            "patterns": [(x.pattern, value) for x, value in self._patterns],
+            "longest": self.longest,
+            "counter": self._counter,
+            "size": self._size,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.longest = state["longest"]
+        self._root = state["root"]
+        self._patterns = [(re.compile(x, re.IGNORECASE), value) for x, value in state["patterns"]]
+        self._update_pattern_filter()
+        self._counter = state["counter"]
+        self._size = state["size"]
+        self._value_segments = {}
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        node = self._find(key)
+        return node is not None and _ENTRY in node
+
+    @staticmethod
+    def _key_segments(key: str) -> List[str]:
+        """Memecah key menjadi segmen tanpa segmen kosong di awal dan akhir"""
+        segments = [x for x in split_segments(fold(key)) if x != ""]
+        if not segments:
+            raise ValueError("Key tidak boleh berupa string kosong!")
+        return segments
+
+    def _find(self, key: str) -> Optional[Dict[str, Any]]:
+        """Mencari node dari sebuah key"""
+        node: Optional[Dict[str, Any]] = self._root
+        for segment in self._key_segments(key):
+            assert node is not None  # ensure type
+            node = node.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def add(self, key: str, value: str) -> None:
+        """Menambahkan key baru atau memperbarui nilai dari key yang sudah ada. Key yang
+        diperbarui tetap mempertahankan urutan prioritasnya.
+
+        Args:
+            key (str): Kata / frasa yang dicari.
+            value (str): Nilai pengganti.
+
+        Raises:
+            ValueError: Key tidak mengandung karakter kata.
+        """
+        if _SEGMENT_PATTERN.fullmatch(key):  # only word segments are matched
+            raise ValueError(f"Key {key!r} harus mengandung minimal satu karakter kata!")
+        node = self._root
+        for segment in self._key_segments(key):
+            node = node.setdefault(segment, {})
+        if _ENTRY in node:
+            node[_ENTRY] = (node[_ENTRY][0], value)
+            return
+        node[_ENTRY] = (self._counter, value)
+        self._counter += 1
+        self._size += 1
+
+    def add_pattern(self, pattern: str, value: str) -> None:
+        """Menambahkan regex yang dicocokkan terhadap satu segmen kata secara utuh.
+
+        Args:
+            pattern (str): Regex, dicocokkan secara *case insensitive*.
+            value (str): Nilai pengganti.
+        """
+        # the list is replaced instead of mutated so a concurrent `scan` sees either version
+        self._patterns = self._patterns + [(re.compile(pattern, re.IGNORECASE), value)]
+        self._update_pattern_filter()
+
+    def remove_pattern(self, pattern: str) -> None:
+        """Menghapus regex yang ditambahkan menggunakan `add_pattern`.
+
+        Args:
+            pattern (str): Regex yang akan dihapus.
+
+        Raises:
+            KeyError: Regex tidak ditemukan.
+        """
+        patterns = [x for x in self._patterns if x[0].pattern != pattern]
+        if len(patterns) == len(self._patterns):
+            raise KeyError(pattern)
+        self._patterns = patterns
+        self._update_pattern_filter()
+
+    def _update_pattern_filter(self) -> None:
+        """Menggabungkan pattern - pattern menjadi satu regex untuk menyaring segmen kata"""
+        try:
+            self._pattern_filter = re.compile(
+                "|".join(f"(?:{x.pattern})" for x, _ in self._patterns), re.IGNORECASE
+            ).fullmatch
+        except re.error:  # e.g. global inline flags, fall back to matching one by one
+            self._pattern_filter = self._match_pattern
+
+    def copy(self) -> "WordTrie":
+        """Membuat salinan *trie* yang dapat dimodifikasi tanpa mengubah *trie* awal.
+
+        Returns:
+            Salinan *trie*.
+        """
+        # a marshal round trip of the plain builtins state is much faster than `copy.deepcopy`
+        trie = self.__class__.__new__(self.__class__)
+        trie.__setstate__(marshal.loads(marshal.dumps(self.__getstate__())))
+        return trie
+
+    def remove(self, key: str) -> None:
+        """Menghapus key dari *trie*.
+
+        Args:
+            key (str): Kata / frasa yang akan dihapus.
+
+        Raises:
+            KeyError: Key tidak ditemukan.
+        """
+        path = [self._root]
+        segments = self._key_segments(key)
+        for segment in segments:
+            node = path[-1].get(segment)
+            if node is None:
+                raise KeyError(key)
+            path.append(node)
+        if _ENTRY not in path[-1]:
+            raise KeyError(key)
+        del path[-1][_ENTRY]
+        self._size -= 1
+        # prune empty branches
+        for depth in range(len(segments), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][segments[depth - 1]]
+
+    def scan(
+        self, parts: List[str], fallback: Optional[Fallback] = None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """Mencari key di dalam teks yang telah dipecah menggunakan `split_segments`.
+
+        Args:
+            parts (List[str]): Segmen - segmen teks.
+            fallback (Callable[[str], Optional[str]], optional): Fungsi yang dipanggil untuk
+                setiap segmen kata yang tidak cocok dengan key maupun pattern, mengembalikan
+                nilai pengganti segmen tersebut atau `None`.
+
+        Yields:
+            Tuple index segmen awal, index segmen akhir (eksklusif), dan nilai pengganti.
+        """
+        root = self._root
+        longest = self.longest
+        n = len(parts)
+        # fold every segment at once, `fold` keeps the length and word characters of every
+        # codepoint so the folded text can also be split exactly like `parts`
+        keys = fold("\0".join(parts)).split("\0")
+        if len(keys) != n:  # text contains the separator
+            keys = split_segments(fold("".join(parts)))
+
+        # only segments that start a key or fully match a pattern need to be visited
+        starts = [i for i, key in enumerate(keys) if key in root]
+        matched: Dict[int, str] = {}
+        if self._patterns:
+            for i in [i for i in range(0, n, 2) if self._pattern_filter(parts[i])]:
+                value = self._match_pattern(parts[i])
+                if value is not None:
+                    matched[i] = value
+            if matched:
+                starts = sorted(set(starts).union(matched))
+        if fallback is not None:
+            starts = sorted(set(starts).union(i for i in range(0, n, 2) if parts[i]))
+
+        cursor = 0
+        for i in starts:
+            # a match can't start on a non-word segment at the very beginning of the text
+            if i < cursor or (i == 1 and not parts[0]):
+                continue
+            node = root.get(keys[i])
+            best: Optional[Tuple[int, str]] = None
+            best_end = i
+
+            j = i
+            while node is not None:
+                entry = node.get(_ENTRY)
+                # a match can't end on a non-word segment at the very end of the text
+                if entry is not None and (j % 2 == 0 or parts[j + 1]):
+                    if best is None or longest or entry[0] < best[0]:
+                        best, best_end = entry, j
+                j += 1
+                if j >= n:
+                    break
+                node = node.get(keys[j]) if parts[j] else None
+
+            if best is None:
+                value = matched.get(i)
+                if value is None and fallback is not None and i % 2 == 0:
+                    value = fallback(parts[i])
+                if value is None:
+                    continue
+                best = (-1, value)
+            yield i, best_end + 1, best[1]
+            cursor = best_end + 1
+
+    def _match_pattern(self, segment: str) -> Optional[str]:
+        """Mencocokkan satu segmen kata dengan pattern - pattern secara berurutan"""
+        if segment:
+            for pattern, value in self._patterns:
+                if pattern.fullmatch(segment):
+                    return value
+        return None
+
+    def finditer(
+        self, text: str, fallback: Optional[Fallback] = None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """Mencari key di dalam teks.
+
+        Args:
+            text (str): Teks yang akan dicari.
+            fallback (Callable[[str], Optional[str]], optional): Lihat `scan`.
+
+        Yields:
+            Tuple posisi awal, posisi akhir (eksklusif), dan nilai pengganti.
+        """
+        parts = split_segments(text)
+        offset, cursor = 0, 0
+        for start, end, value in self.scan(parts, fallback):
+            offset += sum(len(x) for x in parts[cursor:start])
+            length = sum(len(x) for x in parts[start:end])
+            yield offset, offset + length, value
+            offset, cursor = offset + length, end
+
+    def sub(self, text: str) -> str:
+        """Mengganti setiap key yang terdapat di dalam teks dengan nilainya.
+
+        Args:
+            text (str): Teks yang akan dimodifikasi.
+
+        Returns:
+            Teks yang telah dimodifikasi.
+        """
+        return self.subn(text)[0]
+
+    def subn(self, text: str, fallback: Optional[Fallback] = None) -> Tuple[str, int]:
+        """Sama seperti `sub` namun juga mengembalikan jumlah penggantian.
+
+        Args:
+            text (str): Teks yang akan dimodifikasi.
+            fallback (Callable[[str], Optional[str]], optional): Lihat `scan`.
+
+        Returns:
+            Tuple teks yang telah dimodifikasi dan jumlah penggantian.
+        """
+        parts = split_segments(text)
+        result: List[str] = []
+        cursor = 0
+        count = 0
+        for start, end, value in self.scan(parts, fallback):
+            result.extend(parts[cursor:start])
+            result.append(value)
+            cursor = end
+            count += 1
+        if not result:
+            return text, 0
+        result.extend(parts[cursor:])
+        return "".join(result), count
+
+    def sub_segments(self, parts: List[str]) -> List[str]:
+        """Mengganti setiap key pada teks yang telah dipecah menggunakan `split_segments` tanpa
+        menggabungkan segmen menjadi teks. Hasilnya sama dengan `split_segments(sub(text))`
+        sehingga dapat langsung digunakan oleh *trie* lain.
+
+        Args:
+            parts (List[str]): Segmen - segmen teks.
+
+        Returns:
+            Segmen - segmen teks yang telah dimodifikasi.
+        """
+        return self.subn_segments(parts)[0]
+
+    def subn_segments(
+        self, parts: List[str], fallback: Optional[Fallback] = None
+    ) -> Tuple[List[str], int]:
+        """Sama seperti `sub_segments` namun juga mengembalikan jumlah penggantian.
+
+        Args:
+            parts (List[str]): Segmen - segmen teks.
+            fallback (Callable[[str], Optional[str]], optional): Lihat `scan`.
+
+        Returns:
+            Tuple segmen - segmen teks yang telah dimodifikasi dan jumlah penggantian.
+        """
+        out = [""]
+        cursor = 0
+        count = 0
+        cache = self._value_segments
+        for start, end, value in self.scan(parts, fallback):
+            _extend(out, parts, cursor, start)
+            segments = cache.get(value)
+            if segments is None:
+                segments = cache[value] = split_segments(value)
+            if len(segments) == 1:
+                out[-1] += value
+            else:
+                _extend(out, segments, 0, len(segments))
+            cursor = end
+            count += 1
+        if count == 0:
+            return parts, 0
+        _extend(out, parts, cursor, len(parts))
+        return out, count
+
+
+class CharTrie:
+    """*Trie* berbasis *codepoint* untuk mencari dan mengganti string dengan pencocokan terpanjang
+    (*greedy longest match*) dari kiri ke kanan. Digunakan untuk mencari emoji termasuk
+    ZWJ sequence, *skin tone modifier*, dan *variation selector*.
+
+    Hasil pencocokan setara dengan pattern regex `(key_1|key_2|...)` dimana key diurutkan dari
+    yang terpanjang. Posisi awal kandidat dicari menggunakan *character class* dari karakter
+    pertama setiap key sehingga bagian teks yang tidak mungkin cocok dilewati dengan cepat.
+
+    Args:
+        data (Mapping[str, Any], optional): Mapper key ke nilainya.
+
+    Examples:
+        >>> trie = indoNLP.preprocessing.trie.CharTrie({"👍": "jempol", "👍🏻": "jempol_cerah"})
+        >>> trie.sub("mantap 👍🏻")
+        "mantap jempol_cerah"
+    """
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None) -> None:
+        self._root: Dict[str, Any] = {}
+        self._starts: Optional[Pattern[str]] = None
+        self._size = 0
+        if data is not None:
+            for key, value in data.items():
+                self.add(key, value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"root": self._root, "size": self._size}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._root = state["root"]
+        self._size = state["size"]
+        self._starts = None
+
+    def add(self, key: str, value: Any) -> None:
+        """Menambahkan key baru atau memperbarui nilai dari key yang sudah ada.
+
+        Args:
+            key (str): String yang dicari.
+            value (Any): Nilai dari key.
+        """
+        if key == "":
+            raise ValueError("Key tidak boleh berupa string kosong!")
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        if _ENTRY not in node:
+            self._size += 1
+        node[_ENTRY] = value
+        self._starts = None
+
+    def _start_pattern(self) -> Pattern[str]:
+        """Regex character class dari karakter pertama setiap key"""
+        if self._starts is None:
+            # merge nearby codepoints into ranges to keep the class small, symbols above U+2000
+            # may be merged loosely since a false candidate only costs one failed dict lookup
+            ranges: List[List[int]] = []
+            for code in sorted(ord(x) for x in self._root):
+                if ranges and code - ranges[-1][1] <= (256 if code >= 0x2000 else 1):
+                    ranges[-1][1] = code
+                else:
+                    ranges.append([code, code])
+            chars = "".join(
+                re.escape(chr(a)) + ("-" + re.escape(chr(b)) if b > a else "") for a, b in ranges
+            )
+            self._starts = re.compile(f"[{chars}]" if chars else "(?!)")
+        return self._starts
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Mencari key di dalam teks.
+
+        Args:
+            text (str): Teks yang akan dicari.
+
+        Yields:
+            Tuple posisi awal, posisi akhir (eksklusif), dan nilai dari key.
+        """
+        root = self._root
+        search = self._start_pattern().search
+        n = len(text)
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            node = root
+            end, value = start, None
+            i = start
+            while i < n:
+                child = node.get(text[i])
+                if child is None:
+                    break
+                node = child
+                i += 1
+                if _ENTRY in node:
+                    end, value = i, node[_ENTRY]
+            if end > start:
+                yield start, end, value
+                match = search(text, end)
+            else:
+                match = search(text, start + 1)
+
+    def sub(self, text: str, repl: Optional[Callable[[Any], str]] = None) -> str:
+        """Mengganti setiap key yang terdapat di dalam teks.
+
+        Args:
+            text (str): Teks yang akan dimodifikasi.
+            repl (Callable[[Any], str], optional): Fungsi yang menerima nilai dari key dan
+                mengembalikan string pengganti. Jika tidak diberikan maka nilai dari key
+                digunakan secara langsung.
+
+        Returns:
+            Teks yang telah dimodifikasi.
+        """
+        return self.subn(text, repl)[0]
+
+    def subn(self, text: str, repl: Optional[Callable[[Any], str]] = None) -> Tuple[str, int]:
+        """Sama seperti `sub` namun juga mengembalikan jumlah penggantian.
+
+        Args:
+            text (str): Teks yang akan dimodifikasi.
+            repl (Callable[[Any], str], optional): Fungsi pengganti, lihat `sub`.
+
+        Returns:
+            Tuple teks yang telah dimodifikasi dan jumlah penggantian.
+        """
+        result: List[str] = []
+        cursor = 0
+        for start, end, value in self.finditer(text):
+            result.append(text[cursor:start])
+            result.append(repl(value) if repl is not None else value)
+            cursor = end
+        if not result:
+            return text, 0
+        result.append(text[cursor:])
+        return "".join(result), len(result) // 2
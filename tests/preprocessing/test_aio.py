@@ -0,0 +1,101 @@
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing.batch import PipelineExecutor
+
+
+def _fail(text: str) -> str:
+    if text == "fail":
+        raise RuntimeError(text)
+    return text
+
+
+async def _collect(iterator):
+    return [x async for x in iterator]
+
+
+async def _agen(texts, produced=None):
+    for text in texts:
+        if produced is not None:
+            produced.append(text)
+        await asyncio.sleep(0)
+        yield text
+
+
+def test_pipeline_arun():
+    pipe = pipeline([replace_slang, remove_stopwords])
+    text = "gw gk mw makan " * 20
+
+    async def main():
+        assert await pipe.arun("gw gk mw") == pipe("gw gk mw")
+        assert await pipe.arun(text) == pipe(text)
+        with ThreadPoolExecutor(2) as executor:
+            assert await pipe.arun(text, executor=executor, inline_threshold=0) == pipe(text)
+        with PipelineExecutor(pipe, workers=2) as executor:
+            results = await asyncio.gather(*[pipe.arun(text, executor) for _ in range(10)])
+            assert results == [pipe(text)] * 10
+        instrumented = pipeline([replace_slang], instrument=True)
+        with PipelineExecutor(instrumented, workers=2) as executor:
+            await instrumented.arun(text, executor, inline_threshold=0)
+            assert instrumented.stats["replace_slang"].calls == 1
+        with pytest.raises(RuntimeError):
+            await pipeline([_fail]).arun("fail", inline_threshold=0)
+
+    asyncio.run(main())
+
+
+def test_pipeline_amap():
+    pipe = pipeline([replace_word_elongation, replace_slang])
+    texts = [f"gw {i} mw makan kenapaaa yg {i}" * (i % 7) for i in range(300)]
+    expected = [pipe(x) for x in texts]
+
+    async def main():
+        assert await _collect(pipe.amap(texts)) == expected
+        assert await _collect(pipe.amap(_agen(texts), chunksize=5, buffer_size=2)) == expected
+        results = pipe.amap(_agen(texts), chunksize=3, inline_threshold=0)
+        assert await _collect(results) == expected
+        with PipelineExecutor(pipe, workers=2) as executor:
+            results = pipe.amap(iter(texts), executor, chunksize=16, inline_threshold=0)
+            assert await _collect(results) == expected
+        assert await _collect(pipe.amap([])) == []
+        with pytest.raises(ValueError):
+            await _collect(pipe.amap(texts, chunksize=0))
+
+    asyncio.run(main())
+
+
+def test_pipeline_amap_backpressure():
+    pipe = pipeline([replace_slang])
+    produced = []
+
+    async def main():
+        texts = _agen((f"gw {i}" for i in itertools.count()), produced)
+        results = pipe.amap(texts, chunksize=4, buffer_size=2, inline_threshold=0)
+        assert [await results.__anext__() for _ in range(10)] == [f"gue {i}" for i in range(10)]
+        await asyncio.sleep(0.05)
+        # pending chunks, the prefetch queue and the text waiting to enter it
+        assert len(produced) <= 10 + 4 * 2 + 4 + 4 + 1
+        await results.aclose()
+
+    asyncio.run(main())
+
+
+def test_pipeline_amap_error():
+    async def broken():
+        yield "a"
+        raise KeyError("input")
+
+    async def main():
+        results = []
+        with pytest.raises(KeyError):
+            async for text in pipeline([_fail]).amap(broken()):
+                results.append(text)
+        assert results == ["a"]
+        with pytest.raises(RuntimeError):
+            await _collect(pipeline([_fail]).amap(["a", "fail"], inline_threshold=0))
+
+    asyncio.run(main())
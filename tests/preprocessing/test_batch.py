@@ -0,0 +1,133 @@
+import itertools
+
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing import batch
+from indoNLP.preprocessing.stats import StepStats
+
+
+def _fail(text: str) -> str:
+    raise RuntimeError(text)
+
+
+def test_pipeline_map():
+    pipe = pipeline([replace_word_elongation, replace_slang, remove_stopwords], fuse=True)
+    texts = [f"gw {i} mw makan kenapaaa yg {i}" for i in range(500)]
+    expected = [pipe(x) for x in texts]
+    assert list(pipe.map(texts, workers=2, chunksize=7)) == expected
+    assert list(pipe.map(texts, workers=3, chunksize=10, use_threads=True)) == expected
+    assert list(pipe.map(iter(texts), workers=1)) == expected
+    assert list(pipe.map([], workers=2)) == []
+
+    with pytest.raises(ValueError):
+        pipe.map(texts, chunksize=0)
+
+
+def test_pipeline_map_endless():
+    pipe = pipeline([replace_slang])
+    texts = (f"gw {i}" for i in itertools.count())
+    results = pipe.map(texts, workers=2, chunksize=16, buffer_size=2)
+    assert list(itertools.islice(results, 100)) == [f"gue {i}" for i in range(100)]
+    results.close()
+
+
+def test_pipeline_map_error():
+    pipe = pipeline([_fail])
+    with pytest.raises(RuntimeError):
+        list(pipe.map(["a", "b"], workers=2, chunksize=1))
+
+
+def test_batch_functions():
+    texts = ["<b>gw</b> 😀", "emg yg nanyaaa? google.com", "!api! !wajah_gembira!"] * 10
+    for name in ["remove_html", "remove_url", "remove_stopwords", "replace_slang"]:
+        function = globals()[name]
+        assert list(getattr(batch, name)(texts, workers=2, chunksize=4)) == [
+            function(x) for x in texts
+        ]
+    assert list(batch.replace_word_elongation(texts, workers=2, use_threads=True)) == [
+        replace_word_elongation(x) for x in texts
+    ]
+    assert list(batch.emoji_to_words(texts, lang="en", workers=2)) == [
+        emoji_to_words(x, lang="en") for x in texts
+    ]
+    assert list(batch.words_to_emoji(texts, workers=2)) == [words_to_emoji(x) for x in texts]
+
+
+def test_pipeline_map_shared_memory():
+    pipe = pipeline([replace_slang, emoji_to_words, remove_stopwords])
+    texts = [f"gw {i} mw yg {'😀' * (i % 4)}" if i % 3 else f"gw gk {i}" for i in range(600)]
+    texts += ["", "\ud800 gw", "😀" * 50]  # lone surrogate, output larger than the arena
+    expected = [pipe(x) for x in texts]
+    results = pipe.map(iter(texts), workers=2, chunksize=7, buffer_size=3, shared_memory=True)
+    assert list(results) == expected
+    assert list(pipe.map(texts, workers=2, use_threads=True, shared_memory=True)) == expected
+    assert list(pipe.map([], workers=2, shared_memory=True)) == []
+
+    results = pipe.map(itertools.cycle(texts), workers=2, chunksize=16, shared_memory=True)
+    assert list(itertools.islice(results, 1000)) == list(
+        itertools.islice(itertools.cycle(expected), 1000)
+    )
+    results.close()
+
+    with pytest.raises(RuntimeError):
+        list(pipeline([_fail]).map(["a", "b"], workers=2, chunksize=1, shared_memory=True))
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"shared_memory": True}, {"use_threads": True}, {"scheduler": batch.ChunkScheduler()}],
+)
+def test_pipeline_map_instrument(options):
+    calls = []
+    pipe = pipeline([replace_slang, remove_stopwords], callback=calls.append)
+    assert list(pipe.map(["gw yg"] * 100, workers=2, chunksize=8, **options)) == ["gue"] * 100
+    assert pipe.stats["replace_slang"].calls == 100 and pipe.stats["replace_slang"].matches == 200
+    assert pipe.stats["remove_stopwords"].calls == 100
+    assert len(calls) == 200 and calls[:2] == [
+        StepStats("replace_slang", 1, calls[0].time, 5, 8, 2, 0),
+        StepStats("remove_stopwords", 1, calls[1].time, 8, 3, 1, 0),
+    ]
+
+
+def test_chunk_scheduler():
+    scheduler = batch.ChunkScheduler(chunk_chars=10, target_time=None, min_chars=1, text_overhead=0)
+    texts = ["aaa", "bbbb", "cc", "d" * 30, "ee", "f" * 10, "g"]
+    assert list(scheduler._chunks(texts)) == [texts[:3], ["d" * 30], ["ee"], ["f" * 10], ["g"]]
+    assert scheduler.oversized == 2
+
+    scheduler = batch.ChunkScheduler(chunk_chars=64, target_time=0.01, min_chars=32, max_chars=512)
+    scheduler._record("w", 10, 100_000, 0.01, 0.01)  # 10M chars per second
+    assert scheduler.chunk_chars == 512
+    scheduler = batch.ChunkScheduler(chunk_chars=64, target_time=0.01, min_chars=32, max_chars=512)
+    scheduler._record("w", 10, 100, 1.0, 0.5)
+    assert scheduler.chunk_chars == 32
+    assert scheduler.workers["w"].texts == 10 and scheduler.workers["w"].max_time == 1.0
+
+    with pytest.raises(ValueError):
+        batch.ChunkScheduler(min_chars=10, max_chars=5)
+
+
+def test_pipeline_map_scheduler():
+    pipe = pipeline([replace_slang, remove_stopwords])
+    texts = [f"gw {i} mw makan yg {i}" * (1 + (i % 50 == 0) * 200) for i in range(1000)]
+    expected = [pipe(x) for x in texts]
+    for shared_memory in [False, True]:
+        scheduler = batch.ChunkScheduler(chunk_chars=2048, min_chars=512)
+        results = pipe.map(texts, workers=2, scheduler=scheduler, shared_memory=shared_memory)
+        assert list(results) == expected
+        assert sum(x.texts for x in scheduler.workers.values()) == len(texts)
+        assert sum(x.chars for x in scheduler.workers.values()) == sum(map(len, texts))
+        assert scheduler.tasks == sum(x.tasks for x in scheduler.workers.values())
+        assert scheduler.oversized > 0 and scheduler.elapsed > 0
+        assert all(0 <= x <= 1 for x in scheduler.utilization().values())
+        report = scheduler.report()
+        assert set(report) == set(scheduler.workers)
+        assert {"tasks", "texts", "chars", "time", "cpu_time", "max_time", "utilization"} == set(
+            next(iter(report.values()))
+        )
+        assert "util" in scheduler.summary()
+
+    scheduler = batch.ChunkScheduler()
+    assert list(pipe.map(texts, workers=2, use_threads=True, scheduler=scheduler)) == expected
+    assert scheduler.tasks > 0
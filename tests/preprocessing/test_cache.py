@@ -0,0 +1,157 @@
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing.cache import *
+from indoNLP.preprocessing.lexicon import Lexicon
+
+
+def test_lru_cache():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", "a", "A")
+    cache.put("b", "b", "B")
+    assert cache.get("a") == "A"  # "b" becomes the least recently used entry
+    cache.put("c", "c", "C")
+    assert cache.get("b") is None and cache.get("c") == "C" and len(cache) == 2
+    assert cache.info() == CacheInfo(
+        hits=2, misses=1, skipped=0, evictions=1, entries=2, bytes=cache.info().bytes
+    )
+
+    size = sys.getsizeof("x" * 10) * 2
+    cache = LRUCache(max_bytes=size * 2, max_length=10)
+    for i in range(3):
+        cache.put(i, "x" * 10, "x" * 10)
+    assert len(cache) == 2 and cache.info().bytes == size * 2 and cache.evictions == 1
+    cache.put("big", "x" * 1000, "x")  # larger than the whole budget
+    assert cache.get("big") is None
+    assert cache.accepts("x" * 10) and not cache.accepts("x" * 11)
+    assert cache.info().skipped == 1
+
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        LRUCache(max_entries=0)
+
+
+def test_memoize():
+    calls = []
+
+    def _upper(text: str, suffix: str = "") -> str:
+        calls.append(text)
+        return text.upper() + suffix
+
+    cached = memoize(_upper, LRUCache(max_length=5))
+    assert cached("gw") == cached("gw") == "GW" and calls == ["gw"]
+    assert cached("gw", suffix="!") == "GW!" and cached("gw", "?") == "GW?"
+    assert cached("panjang") == cached("panjang") == "PANJANG"
+    assert cached.cache.info().hits == 1 and cached.cache.info().skipped == 2
+    assert cached.__name__ == "_upper"
+
+    cached = memoize(emoji_to_words)
+    assert cached("😀", lang="en") == emoji_to_words("😀", lang="en")
+
+
+def test_pipeline_cache():
+    pipe = pipeline([replace_slang, remove_stopwords], cache=LRUCache(100), instrument=True)
+    texts = ["gw gk mw makan", "yg", "gw gk mw makan"] * 3
+    assert [pipe(x) for x in texts] == [
+        pipeline([replace_slang, remove_stopwords])(x) for x in texts
+    ]
+    assert pipe.cache.info().hits == 7 and pipe.cache.info().misses == 2
+    assert pipe.stats["replace_slang"].calls == 2
+
+    restored = pickle.loads(pickle.dumps(pipe))
+    assert restored.cache is not None and len(restored.cache) == 0
+    assert restored.cache.max_entries == 100
+
+    with ThreadPoolExecutor(4) as executor:
+        texts = [f"gw {i % 50}" for i in range(2000)]
+        assert list(executor.map(pipe, texts)) == [replace_slang(x) for x in texts]
+    assert len(pipe.cache) == 52
+
+
+def test_shared_cache():
+    shared = LRUCache(1000)
+    assert pipeline([replace_slang], cache=shared)("gw yg") == "gue yang"
+    assert pipeline([remove_stopwords], cache=shared)("gw yg") == "gw yg"
+    assert memoize(replace_slang, cache=shared)("gw yg") == "gue yang"
+    assert memoize(remove_stopwords, cache=shared)("gw yg") == "gw yg"
+    assert len(shared) == 4
+
+
+def test_disk_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path)
+    pipe = pipeline([replace_slang, remove_stopwords])
+    fingerprint = pipe.fingerprint()
+    assert fingerprint == pipeline(["replace_slang", "remove_stopwords"], fuse=True).fingerprint()
+    assert fingerprint != pipeline([replace_slang]).fingerprint()
+    assert fingerprint != pipeline([("emoji_to_words", {"lang": "en"})]).fingerprint()
+
+    assert cache.get_many(fingerprint, ["gw", "yg"]) == [None, None]
+    cache.put_many(fingerprint, [("gw", "gue"), ("\udcff", "\udcff")])
+    assert cache.get_many(fingerprint, ["gw", "yg", "\udcff"]) == ["gue", None, "\udcff"]
+    assert cache.get("other", "gw") is None
+    assert len(cache) == 2 and cache.hits == 2 and cache.misses == 4
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.get(fingerprint, "gw") == "gue"
+    restored.close()
+    cache.clear()
+    assert len(cache) == 0 and cache.size() == 0
+
+    cache = DiskCache(path, max_bytes=1000)
+    for i in range(50):
+        cache.put(fingerprint, str(i), "x" * 10)
+    assert cache.size() <= 1000 and cache.evictions > 0
+    assert cache.get(fingerprint, "49") == "x" * 10 and cache.get(fingerprint, "0") is None
+
+
+def test_pipeline_map_disk_cache(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    pipe = pipeline([replace_slang, remove_stopwords])
+    texts = [f"gw {i % 30} mw makan" for i in range(200)]
+    expected = [pipe(x) for x in texts]
+    assert list(pipe.map(texts, workers=1, chunksize=16, disk_cache=cache)) == expected
+    assert len(cache) == 30 and cache.hits + cache.misses == 200
+    assert list(pipe.map(texts, workers=2, chunksize=16, disk_cache=cache)) == expected
+    assert list(pipe.map(texts, workers=2, use_threads=True, disk_cache=cache)) == expected
+    assert len(cache) == 30
+
+
+def _suffix(suffix):
+    return lambda text: text + suffix
+
+
+def test_disk_cache_custom_steps(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    upper, lower = pipeline([lambda x: x.upper()]), pipeline([lambda x: x.lower()])
+    assert upper.fingerprint() != lower.fingerprint()
+    assert list(upper.map(["Gw"], workers=1, disk_cache=cache)) == ["GW"]
+    assert list(lower.map(["Gw"], workers=1, disk_cache=cache)) == ["gw"]
+
+    assert pipeline([_suffix("!")]).fingerprint() != pipeline([_suffix("?")]).fingerprint()
+    assert pipeline([_suffix("!")]).fingerprint() == pipeline([_suffix("!")]).fingerprint()
+
+
+def test_memoize_lexicon():
+    lex = Lexicon.slang()
+    cached = memoize(replace_slang)
+    assert cached("zzqx gw", lexicon=lex) == "zzqx gue"
+    lex.add("zzqx", "foo")
+    assert cached("zzqx gw", lexicon=lex) == "foo gue"
+    assert cached.cache.info().misses == 2
+
+
+def test_pipeline_cache_lexicon():
+    lex, shared = Lexicon.slang(), LRUCache()
+    other = pipeline([remove_stopwords], cache=shared)
+    pipe = pipeline([("replace_slang", {"lexicon": lex})], cache=shared)
+    assert other("gw yang") == "gw" and pipe("zzqx gw") == "zzqx gue"
+    lex.add("zzqx", "foo")
+    assert pipe("zzqx gw") == "foo gue"
+    # entries of other pipelines are kept
+    assert other("gw yang") == "gw" and shared.info().hits == 1 and len(shared) == 3
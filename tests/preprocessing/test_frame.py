@@ -0,0 +1,46 @@
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing.frame import map_arrow, map_series
+
+
+def test_map_series():
+    pd = pytest.importorskip("pandas")
+    pipe = pipeline([replace_slang, remove_stopwords])
+    texts = ["gw gk mw", None, "emg yg nanya?", float("nan"), "gw gk mw", ""] * 50
+    series = pd.Series(texts, index=range(100, 400), name="text", dtype=object)
+    result = map_series(pipe, series, workers=2, chunksize=2)
+    assert result.index.equals(series.index)
+    assert result.name == "text" and result.dtype == object
+    assert result[series.isna()].isna().all()
+    assert result[100] == pipe("gw gk mw") and result[101] is None
+    assert result[series.notna()].tolist() == [pipe(x) for x in series.dropna()]
+
+    strings = series.astype("string")
+    result = map_series(pipe, strings, workers=1)
+    assert result.dtype == strings.dtype
+    assert result.isna().tolist() == strings.isna().tolist()
+    assert result.dropna().tolist() == [pipe(x) for x in strings.dropna()]
+
+    empty = pd.Series([], dtype=object)
+    assert map_series(pipe, empty, workers=1).tolist() == []
+    assert map_series(pipe, pd.Series([None, None]), workers=1).isna().all()
+
+
+def test_map_arrow():
+    pa = pytest.importorskip("pyarrow")
+    pipe = pipeline([replace_slang])
+    texts = ["gw gk mw", None, "emg yg nanya?", "gw gk mw"] * 25
+    array = pa.array(texts)
+    result = map_arrow(pipe, array, workers=2, chunksize=1, use_threads=True)
+    assert result.type == array.type
+    assert result.to_pylist() == [None if x is None else pipe(x) for x in texts]
+
+    chunked = pa.chunked_array([texts[:30], texts[30:]], type=pa.large_string())
+    result = map_arrow(pipe, chunked, workers=1)
+    assert isinstance(result, pa.ChunkedArray) and result.type == pa.large_string()
+    assert result.to_pylist() == [None if x is None else pipe(x) for x in texts]
+
+    assert map_arrow(pipe, pa.array([None, None], pa.string()), workers=1).null_count == 2
+    with pytest.raises(TypeError):
+        map_arrow(pipe, pa.array([1, 2]))
@@ -0,0 +1,58 @@
+import os
+import pickle
+
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing import spans
+from indoNLP.preprocessing.fuzzy import *
+
+
+def test_distance():
+    assert distance("bgt", "bgt") == 0
+    assert distance("bgt", "bgtt") == distance("bgt", "btg") == distance("bgt", "bgx") == 1
+    assert distance("abcd", "badc") == 2
+    assert distance("gatau", "x", max_distance=1) == 2
+
+
+def test_fuzzy_index(tmp_path):
+    index = FuzzyIndex({"bgt": "banget", "gatau": "enggak tahu", "gitu": "begitu"}, min_length=3)
+    assert index.lookup("bgtt") == ("bgt", 1) and index("BGTT") == "banget"
+    assert index("bgt") is None  # exact keys are left to the trie
+    assert index("gtau") == "enggak tahu" and index("xyz") is None
+    assert FuzzyIndex({"gatau": "x"}, min_length=7)("gatauu") is None
+    assert FuzzyIndex({"gitu": "begitu"}, exclude=["gita"])("gita") is None
+    assert FuzzyIndex({"bgtt": "1", "bgta": "2"}, min_length=3)("bgtx") == "1"  # first key wins
+    with pytest.raises(ValueError):
+        FuzzyIndex({}, max_distance=0)
+
+    path = str(tmp_path / "index.fuzzy")
+    index.save(path)
+    restored = FuzzyIndex.load(path)
+    assert restored is not None and restored("bgtt") == "banget"
+    assert restored.fingerprint() == index.fingerprint()
+    assert FuzzyIndex.load(path, {"version": -1}) is None
+    assert pickle.loads(pickle.dumps(index))("gtau") == "enggak tahu"
+
+
+def test_slang_index(tmp_path):
+    index = FuzzyIndex.slang(cache_dir=str(tmp_path))
+    assert index("emgg") == "memang" and index("bertanya") is None  # formal words are excluded
+    assert os.listdir(str(tmp_path)) == ["slang-1-4.fuzzy"]
+    assert FuzzyIndex.slang(cache_dir=str(tmp_path)).fingerprint() == index.fingerprint()
+    index = FuzzyIndex.slang(exclude=["gatauu"], cache_dir=str(tmp_path))
+    assert index("gatauu") is None
+
+
+def test_fuzzy_replace_slang():
+    text = "emgg siapa yg nanyaa?"
+    assert replace_slang(text) == "emgg siapa yang nanyaa?"
+    assert replace_slang(text, fuzzy=1) == "memang siapa yang bertanya?"
+    assert spans.replace_slang(text, fuzzy=1).apply() == replace_slang(text, fuzzy=1)
+
+    index = FuzzyIndex({"cuan": "untung"})
+    steps = [("replace_slang", {"fuzzy": index}), remove_stopwords]
+    assert pipeline(steps)("cuann gw") == pipeline(steps, fuse=True)("cuann gw") == "untung gue"
+    assert (
+        pipeline(steps).fingerprint() != pipeline([replace_slang, remove_stopwords]).fingerprint()
+    )
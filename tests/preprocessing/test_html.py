@@ -0,0 +1,61 @@
+import random
+import re
+
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing import spans
+from indoNLP.preprocessing.html import *
+
+
+def test_html_stripper():
+    stripper = HTMLStripper()
+    chunks = ["<p>Jakarta <b", ">macet</b> &am", "p; banjir</p", ">"]
+    assert [stripper.feed(x) for x in chunks] == ["Jakarta ", "macet ", " banjir", ""]
+    assert stripper.close() == "" and stripper.removed == 5
+
+    # unfinished markup is kept as text when the document ends
+    assert stripper.feed("a <b") == "a " and stripper.pending == 2
+    assert stripper.close() == "<b" and stripper.pending == 0
+    assert stripper.strip("&amp x &#x1f; <a\nb>") == ("&amp x  <a\nb>", 1)
+    assert HTMLStripper(multiline=True).strip("<a\nb>c") == ("c", 1)
+    with pytest.raises(ValueError):
+        HTMLStripper(max_tag_length=1)
+
+
+def test_html_stripper_chunks():
+    tokens = ["<", ">", "<b>", "</p>", "&", "&amp;", "&AMP;", "&#39;", "&#x1F;", "&#1234567;"]
+    tokens += ["a", " ", "\n", ";", "#", "x", "1", "é", "<a href='#'>"]
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 30)))
+        assert HTMLStripper().strip(text)[0] == re.sub(HTML_PATTERN, "", text)
+        for max_tag_length in (4, DEFAULT_MAX_TAG_LENGTH):
+            stripper = HTMLStripper(max_tag_length)
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 4)))
+            chunks = [text[x:y] for x, y in zip([0] + cuts, cuts + [len(text)])]
+            assert "".join(stripper.stream(chunks)) == stripper.strip(text)[0]
+
+
+def test_html_stripper_bounded():
+    # an unclosed tag never grows the buffer past `max_tag_length`
+    stripper = HTMLStripper(max_tag_length=64)
+    output = []
+    for _ in range(1000):
+        output.append(stripper.feed("<" + "x" * 50))
+        assert stripper.pending < 64
+    output.append(stripper.close())
+    assert "".join(output) == ("<" + "x" * 50) * 1000
+
+
+def test_strip_html():
+    text = " <p>berita <b>hari ini</b> &amp; <br"
+    assert strip_html(text) == remove_html(text) == "berita hari ini  <br"
+    assert strip_html('<a\nhref="#">link</a>', multiline=True) == "link"
+    assert strip_html("<" + "x" * 10 + ">", max_tag_length=5) == "<xxxxxxxxxx>"
+
+    pipe = pipeline([("strip_html", {"multiline": True}), replace_slang], instrument=True)
+    assert pipe("<b\n>gw</b>") == "gue" and pipe("gw") == "gue"
+    assert pipe.stats["strip_html"].matches == 2 and pipe.stats["strip_html"].skipped == 1
+    assert pipe.annotate("<b\n>gw</b>").apply() == "gue"
+    assert spans.strip_html(text).apply() == strip_html(text)
@@ -0,0 +1,140 @@
+import pickle
+import threading
+
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing import spans
+from indoNLP.preprocessing.cache import LRUCache
+from indoNLP.preprocessing.lexicon import *
+
+
+def test_slang_lexicon():
+    lexicon = Lexicon.slang(add={"cuan": "untung", "gg": "hebat"}, remove=["gw"])
+    assert replace_slang("gw dpt cuan, gg", lexicon=lexicon) == "gw dapat untung, hebat"
+    assert replace_slang("gw cuan") == "gue cuan"  # built-in data is unchanged
+    assert "Cuan" in lexicon and "gw" not in lexicon
+
+    lexicon.add("gw", "saya")
+    assert lexicon.sub("Gw") == "saya" and lexicon.version == 1
+    lexicon.remove("cuan")
+    assert lexicon.subn("cuan gw") == ("cuan saya", 1)
+    with pytest.raises(KeyError):
+        lexicon.remove("cuan")
+    with pytest.raises(KeyError):
+        Lexicon.slang(remove=["bukan_slang"])
+
+    # keys are matched literally
+    lexicon = Lexicon({"a.b": "x"})
+    assert lexicon.sub("a.b acb") == "x acb"
+
+
+def test_stopwords_lexicon():
+    lexicon = Lexicon.stopwords(add=["nih", "dong"], remove=["yang"])
+    assert remove_stopwords("cek nih dong yang", lexicon=lexicon) == "cek   yang"
+    assert remove_stopwords("cek nih") == "cek nih"
+
+    # built-in regex stopwords can be removed as well
+    assert remove_stopwords("wkwk mantap") == "mantap"
+    lexicon.remove("[wk]*(?:wk|kw)[wk]*")
+    assert remove_stopwords("wkwk mantap", lexicon=lexicon) == "wkwk mantap"
+    lexicon.add_pattern("ha(?:ha)+")
+    assert remove_stopwords("hahaha mantap", lexicon=lexicon) == "mantap"
+
+
+def test_update_lexicon():
+    lexicon = Lexicon({"a": "1", "b": "2"})
+    copy = lexicon.copy()
+    lexicon.update(add={"c": "3"}, remove=["a"])
+    assert lexicon.sub("a b c") == "a 2 3" and copy.sub("a b c") == "1 2 c"
+    with pytest.raises(KeyError):  # failed updates leave the lexicon unchanged
+        lexicon.update(add={"d": "4"}, remove=["a"])
+    assert lexicon.sub("a d") == "a d" and lexicon.version == 1
+
+    # keys without a word character never match
+    with pytest.raises(ValueError):
+        lexicon.add(":)", "senyum")
+    with pytest.raises(ValueError):
+        lexicon.update(add={"e": "5", " - ": "6"})
+    assert lexicon.sub("a e") == "a e" and lexicon.version == 1
+
+
+def test_lexicon_concurrent_update():
+    lexicon = Lexicon({"x": "A"})
+    texts = ["x y z " * 50] * 200
+    stop = threading.Event()
+    results = set()
+
+    def read() -> None:
+        while not stop.is_set():
+            results.update(lexicon.sub(x) for x in texts)
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    for i in range(50):
+        if i % 2:
+            lexicon.update(add={"x": "A"}, remove=["y"])
+        else:
+            lexicon.update(add={"x": "B", "y": "B"})
+    stop.set()
+    thread.join()
+    # every text is processed with a whole version of the lexicon
+    assert results <= {"A y z " * 50, "B B z " * 50, "x y z " * 50}
+
+
+def test_lexicon_pipeline():
+    slang = Lexicon.slang(add={"cuan": "untung"})
+    stopwords = Lexicon.stopwords(add=["nih"])
+    steps = [
+        replace_word_elongation,
+        ("replace_slang", {"lexicon": slang}),
+        ("remove_stopwords", {"lexicon": stopwords}),
+    ]
+    pipe = pipeline(steps)
+    fused = pipeline(steps, fuse=True)
+    text = "cuannn nih gw"
+    assert pipe(text) == fused(text) == "untung  gue"
+    assert pipe.annotate(text).apply() == pipe(text)
+    assert spans.replace_slang("cuan", lexicon=slang).apply() == "untung"
+
+    restored = pickle.loads(pickle.dumps(pipe))
+    assert restored(text) == pipe(text)
+    assert restored.fingerprint() == pipe.fingerprint() != pipeline(steps[:1]).fingerprint()
+
+    # modifying a lexicon changes the fingerprint and invalidates cached results
+    pipe = pipeline(steps, cache=LRUCache())
+    fingerprint = pipe.fingerprint()
+    assert pipe("cuan") == "untung"
+    slang.add("cuan", "laba")
+    assert pipe.fingerprint() != fingerprint
+    assert pipe("cuan") == "laba"
+
+
+def test_vocabulary():
+    vocabulary = Vocabulary(["maaf", "mantap", "full", "kenapa", "tinggi"])
+    text = "Maaaaf mantaaap fulll KENAPAAA tinggiii Allah saat gooood ballll"
+    expected = "Maaf mantap full KENAPA tinggi Allah saat gooood bal"
+    assert replace_word_elongation(text, vocabulary=vocabulary) == expected
+    assert (
+        replace_word_elongation(text) == "Maaaaf mantaaap ful KENAPA tinggi Allah saat gooood bal"
+    )
+    assert spans.replace_word_elongation(text, vocabulary=vocabulary).apply() == expected
+
+    vocabulary.add("Good")
+    assert vocabulary.normalize("gooood") == "good" and "GOOD" in vocabulary
+    vocabulary.remove("full")
+    assert vocabulary.normalize("fulll") == "ful" and len(vocabulary) == 5
+    with pytest.raises(KeyError):
+        vocabulary.remove("full")
+
+    restored = pickle.loads(pickle.dumps(vocabulary))
+    assert restored.normalize("gooood") == "good"
+    assert restored.fingerprint() == vocabulary.fingerprint()
+
+
+def test_default_vocabulary():
+    vocabulary = Vocabulary.default()
+    assert "kenapa" in vocabulary and "tidak" in vocabulary
+    steps = [("replace_word_elongation", {"vocabulary": vocabulary}), replace_slang]
+    text = "knp maaaaf gk mantaaap"
+    assert pipeline(steps)(text) == pipeline(steps, fuse=True)(text) == "kenapa maaf enggak mantap"
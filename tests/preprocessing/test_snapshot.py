@@ -0,0 +1,50 @@
+import marshal
+import os
+
+from indoNLP.preprocessing import SLANG_DATA, STOPWORDS, WORDS_EMOJI_DATA, replace_slang
+from indoNLP.preprocessing.snapshot import *
+from indoNLP.preprocessing.trie import WordTrie
+
+
+def test_snapshot(tmp_path):
+    path = os.path.join(tmp_path, "lexicon.snapshot")
+    assert load_snapshot(path) is None  # missing
+
+    write_snapshot(path)
+    snapshot = load_snapshot(path)
+    assert snapshot is not None
+    assert snapshot["SLANG_DATA"] == SLANG_DATA
+    assert snapshot["STOPWORDS"] == STOPWORDS
+    assert snapshot["WORDS_EMOJI_DATA"] == WORDS_EMOJI_DATA
+
+    trie = WordTrie.__new__(WordTrie)
+    trie.__setstate__(snapshot["_SLANG_TRIE"])
+    assert trie.sub("gw gk mw makan!!") == replace_slang("gw gk mw makan!!")
+
+
+def test_snapshot_invalid(tmp_path):
+    path = os.path.join(tmp_path, "lexicon.snapshot")
+    with open(path, "wb") as writer:
+        writer.write(b"not a snapshot")
+    assert load_snapshot(path) is None
+
+    # stale snapshot, data modules changed after the snapshot was built
+    header = marshal.dumps({"version": 1, "marshal": marshal.version, "fingerprint": "old"})
+    with open(path, "wb") as writer:
+        writer.write(b"IDNLPSNP" + len(header).to_bytes(4, "little") + header)
+        writer.write(marshal.dumps({"SLANG_DATA": {}}))
+    assert source_fingerprint() != "old"
+    assert load_snapshot(path) is None
+
+
+def test_snapshot_builders(tmp_path, monkeypatch):
+    builder = tmp_path / "trie.py"
+    builder.write_text("# v1", encoding="utf-8")
+    monkeypatch.setattr("indoNLP.preprocessing.snapshot._BUILDERS", (str(builder),))
+    path = os.path.join(tmp_path, "lexicon.snapshot")
+    write_snapshot(path)
+    assert load_snapshot(path) is not None
+
+    # stale snapshot, the tries or the builders changed after the snapshot was built
+    builder.write_text("# v2", encoding="utf-8")
+    assert load_snapshot(path) is None
@@ -0,0 +1,99 @@
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing import spans
+from indoNLP.preprocessing.spans import Annotation, Span
+
+
+def _shout(text: str) -> str:
+    return text.replace("nasi", "NASI!")
+
+
+def test_function_spans():
+    annotation = spans.remove_html(" <b>Jakarta</b> macet &amp; ")
+    assert annotation.spans == [
+        Span(0, 1, "strip", ""),
+        Span(1, 4, "remove_html", ""),
+        Span(11, 15, "remove_html", ""),
+        Span(21, 22, "strip", ""),
+        Span(22, 27, "remove_html", ""),
+        Span(27, 28, "strip", ""),
+    ]
+    assert annotation.apply() == remove_html(annotation.text) == "Jakarta macet"
+    assert spans.remove_html("  ").apply() == "" and len(spans.remove_html("abc")) == 0
+
+    assert list(spans.replace_slang("gw gk mw")) == [
+        Span(0, 2, "replace_slang", "gue"),
+        Span(3, 5, "replace_slang", "enggak"),
+        Span(6, 8, "replace_slang", "mau"),
+    ]
+    assert spans.replace_word_elongation("kenapaaa?").spans == [
+        Span(6, 8, "replace_word_elongation", "")
+    ]
+    assert spans.emoji_to_words("a😀", lang="en").spans == [
+        Span(1, 2, "emoji_to_words", "!grinning_face!")
+    ]
+    assert spans.words_to_emoji("!api! x").spans == [Span(0, 5, "words_to_emoji", "🔥")]
+
+    texts = ["<b>gw</b> yg https://google.com 😀 kenapaaa !api!", "  siapa yang suruh?  ", ""]
+    for name in [
+        "remove_html",
+        "remove_url",
+        "remove_stopwords",
+        "replace_slang",
+        "replace_word_elongation",
+        "emoji_to_words",
+        "words_to_emoji",
+    ]:
+        for text in texts:
+            assert getattr(spans, name)(text).apply() == globals()[name](text)
+
+    with pytest.raises(AssertionError):
+        spans.emoji_to_words("😀", lang="jp")
+
+
+def test_pipeline_annotate():
+    pipe = pipeline([replace_slang, remove_stopwords])
+    annotation = pipe.annotate("gw mw nasi goreng")
+    assert annotation.spans == [
+        Span(0, 2, "replace_slang", "gue"),
+        Span(3, 5, "replace_slang+remove_stopwords", ""),
+    ]
+
+    steps = [remove_html, replace_word_elongation, replace_slang, emoji_to_words, _shout]
+    text = "<i>gw</i> mkn nasiii 😀"
+    annotation = pipeline(steps, fuse=True).annotate(text)
+    assert annotation.apply() == pipeline(steps)(text) == "gue makin NASI! !wajah_gembira!"
+    assert [x.kind for x in annotation] == [
+        "remove_html",
+        "replace_slang",
+        "remove_html",
+        "replace_slang",
+        "_shout",
+        "replace_word_elongation",
+        "emoji_to_words",
+    ]
+
+    # map offsets of the cleaned text back to the raw text
+    cleaned = annotation.apply()
+    start = cleaned.index("makin")
+    assert (annotation.to_original(start), annotation.to_original(start + 5, end=True)) == (10, 13)
+    assert text[annotation.to_original(0) : annotation.to_original(3, end=True)] == "gw"
+    assert annotation.to_original(len(cleaned), end=True) == len(text)
+
+    annotation = pipeline([replace_word_elongation, replace_slang]).annotate("gw nanyaaa")
+    assert annotation.spans == [
+        Span(0, 2, "replace_slang", "gue"),
+        Span(3, 8, "replace_slang", "bertanya"),
+        Span(8, 10, "replace_word_elongation", ""),
+    ]
+
+
+def test_annotation():
+    annotation = Annotation(
+        "<b>x</b>", [Span(0, 3, "remove_html", ""), Span(4, 8, "remove_html", "")]
+    )
+    assert annotation.apply() == "x" and len(annotation) == 2
+    assert annotation.to_original(0) == 3 and annotation.to_original(0, end=True) == 0
+    assert annotation.to_original(1, end=True) == 4 and annotation.to_original(1) == 8
+    assert annotation == spans.remove_html("<b>x</b>")
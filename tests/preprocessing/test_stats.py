@@ -0,0 +1,100 @@
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from indoNLP.preprocessing import *
+from indoNLP.preprocessing.stats import *
+
+
+def _upper(text: str) -> str:
+    return text.upper()
+
+
+def test_pipeline_stats():
+    pipe = pipeline([replace_slang, remove_stopwords, _upper], instrument=True)
+    assert pipe("gw gk mw makan") == "GUE   MAKAN"
+    assert pipe("yg") == ""
+    stats = pipe.stats
+    assert [x.name for x in stats] == ["replace_slang", "remove_stopwords", "_upper"]
+    assert stats["replace_slang"].calls == 2 and stats["replace_slang"].matches == 4
+    assert stats["replace_slang"].chars_in == 16 and stats["replace_slang"].chars_out == 24
+    assert stats["remove_stopwords"].matches == 3
+    assert stats["_upper"].matches == 0 and stats["_upper"].chars_out == 11
+    assert all(x.time >= 0 for x in stats)
+    assert stats.as_dict()["remove_stopwords"]["chars_in"] == 24
+    assert "remove_stopwords" in stats.summary()
+    with pytest.raises(KeyError):
+        stats["unknown"]
+
+    stats.reset()
+    assert stats["replace_slang"] == StepStats("replace_slang")
+    assert pipeline([replace_slang]).stats is None
+
+
+def test_pipeline_stats_fuse():
+    steps = [remove_html, remove_url, replace_word_elongation, replace_slang, replace_slang]
+    pipe = pipeline(steps, fuse=True, instrument=True)
+    text = "<b>gw</b> gk mw kenapaaa google.com"
+    assert pipe(text) == pipeline(steps)(text)
+    assert list(pipe.stats.as_dict()) == [
+        "remove_html+remove_url",
+        "replace_word_elongation+replace_slang+replace_slang",
+    ]
+    assert pipe.stats["remove_html+remove_url"].matches == 3
+    assert pipe.stats["replace_word_elongation+replace_slang+replace_slang"].matches == 4
+
+    pipe = pipeline([replace_slang, emoji_to_words, replace_slang], instrument=True)
+    assert pipe("gw 😀") == "gue !wajah_gembira!"
+    assert [x.name for x in pipe.stats] == ["replace_slang", "emoji_to_words", "replace_slang#2"]
+    assert pipe.stats["emoji_to_words"].matches == 1
+
+
+def test_pipeline_stats_prefilter():
+    pipe = pipeline([remove_html, remove_url, emoji_to_words, replace_slang], instrument=True)
+    for text in ["gw <b>gk</b>", "gw gk", "gw 😀", " ...: "]:
+        assert pipe(text) == pipeline(pipe.describe(), prefilter=False)(text)
+    stats = pipe.stats
+    assert stats["remove_html"].skipped == 3 and stats["remove_html"].skip_rate == 0.75
+    assert stats["remove_url"].skipped == 3 and stats["emoji_to_words"].skipped == 3
+    assert stats["replace_slang"].skipped == 1 and stats["replace_slang"].matches == 5
+    assert stats.as_dict()["remove_url"]["skip_rate"] == 0.75
+    header, _, row = stats.summary().splitlines()[:3]
+    assert header.endswith("skip %") and row.startswith("remove_html") and row.endswith("75.0%")
+    assert "75.0%" in stats.summary()
+
+    calls = []
+    pipe = pipeline([remove_html, _upper], fuse=True, callback=calls.append)
+    assert pipe(" gw ") == "GW"
+    assert [x.skipped for x in calls] == [1, 0]
+    assert StepStats("x").skip_rate == 0.0
+
+
+def test_pipeline_callback():
+    calls = []
+    pipe = pipeline([replace_slang, _upper], callback=calls.append)
+    assert pipe.instrument and pipe("gw") == "GUE"
+    assert [(x.name, x.calls, x.chars_in, x.chars_out, x.matches) for x in calls] == [
+        ("replace_slang", 1, 2, 3, 1),
+        ("_upper", 1, 3, 3, 0),
+    ]
+
+    restored = pickle.loads(pickle.dumps(pipeline([replace_slang], instrument=True)))
+    assert restored.instrument and restored("gw") == "gue"
+    assert restored.stats["replace_slang"].calls == 1
+
+
+def test_pipeline_stats_threads():
+    pipe = pipeline([replace_slang, _upper], instrument=True)
+    texts = [f"gw {i}" for i in range(2000)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(pipe, texts))
+    finally:
+        sys.setswitchinterval(interval)
+    assert [x.calls for x in pipe.stats] == [2000, 2000]
+    assert pipe.stats["replace_slang"].matches == 2000
+    assert pipe.stats["_upper"].chars_out == sum(len(x) + 1 for x in texts)
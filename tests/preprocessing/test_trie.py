@@ -0,0 +1,82 @@
+import pytest
+
+from indoNLP.preprocessing.trie import *
+
+
+def test_split_segments():
+    assert split_segments("") == [""]
+    assert split_segments("gw gk mw!!") == ["gw", " ", "gk", " ", "mw", "!!", ""]
+    assert split_segments(" halo") == ["", " ", "halo"]
+
+
+def test_fold():
+    assert fold("GW") == "gw"
+    assert fold("İni") == "ini"
+    assert fold("Kſ") == "ks"
+
+
+def test_word_trie():
+    trie = WordTrie({"sama": "A", "sama-sama": "B", "yaaa ": "C"})
+    assert len(trie) == 3 and "SAMA" in trie and "sam" not in trie
+    assert trie.sub("Sama-sama, samaa") == "A-A, samaa"
+    assert trie.sub("yaaa x yaaa") == "Cx yaaa"
+    assert list(trie.finditer("x sama yaaa x")) == [(2, 6, "A"), (7, 12, "C")]
+
+    trie.add("sama", "D")
+    assert trie.sub("sama") == "D"
+    trie.remove("sama")
+    assert trie.sub("sama-sama sama") == "B sama"
+    with pytest.raises(KeyError):
+        trie.remove("sama")
+    with pytest.raises(ValueError):
+        trie.add("", "E")
+    with pytest.raises(ValueError):
+        trie.add(":)", "E")
+
+
+def test_word_trie_longest():
+    trie = WordTrie({"sama": "", "sama-sama": ""}, longest=True)
+    assert trie.sub("sama-sama sama") == " "
+
+
+def test_word_trie_patterns():
+    trie = WordTrie({"wk": "A"}, patterns={"[wk]*(?:wk|kw)[wk]*": "B"})
+    assert trie.sub("wk wkwk KWK kwx") == "A B B kwx"
+
+
+def test_word_trie_copy():
+    trie = WordTrie({"gw": "gue"}, patterns={"w+k+": ""})
+    copy = trie.copy()
+    copy.add("yg", "yang")
+    copy.remove_pattern("w+k+")
+    assert trie.sub("gw yg wk") == "gue yg " and copy.sub("gw yg wk") == "gue yang wk"
+    with pytest.raises(KeyError):
+        copy.remove_pattern("w+k+")
+
+
+def test_char_trie():
+    trie = CharTrie({"👍": "jempol", "👍🏻": "jempol_cerah", "#️⃣": "pagar"})
+    assert len(trie) == 3
+    assert trie.sub("mantap 👍🏻👍 #1") == "mantap jempol_cerahjempol #1"
+    assert trie.sub("#️⃣", lambda x: x.upper()) == "PAGAR"
+    assert list(trie.finditer("a 👍🏻")) == [(2, 4, "jempol_cerah")]
+    assert CharTrie().sub("teks") == "teks"
+
+
+def test_trie_state():
+    trie = WordTrie({"gw": "gue"}, patterns={"w+k+": ""})
+    restored = WordTrie.__new__(WordTrie)
+    restored.__setstate__(trie.__getstate__())
+    assert restored.sub("gw wwkk") == "gue "
+
+    trie = CharTrie({"👍": "jempol"})
+    restored = CharTrie.__new__(CharTrie)
+    restored.__setstate__(trie.__getstate__())
+    assert restored.sub("👍") == "jempol"
+
+
+def test_word_trie_sub_segments():
+    trie = WordTrie({"gw": "gue", "yg": "", "sih": "si-h", "sama": "!"})
+    for text in ["", "gw", " yg ", "yg", "gw yg  sih!", "a yg.yg b", "sama-sama", "x sama"]:
+        assert trie.sub_segments(split_segments(text)) == split_segments(trie.sub(text))
+    assert trie.sub("gw\0gw") == "gue\0gue"
@@ -0,0 +1,105 @@
+import gzip
+import os
+import subprocess
+import sys
+
+import pytest
+
+import indoNLP.cli
+from indoNLP.cli import main
+
+
+def test_preprocess(tmp_path, capsys):
+    source = tmp_path / "corpus.txt.gz"
+    with gzip.open(source, "wb") as writer:
+        writer.write("gw gk mw <b>makan</b>\r\nemg yg nanyaaa? 😀\n\nakhir".encode("utf-8"))
+
+    output = tmp_path / "clean.txt.gz"
+    steps = ["remove_html", "replace_word_elongation", "replace_slang", "emoji_to_words:lang=en"]
+    assert main(["preprocess", *steps, "-i", str(source), "-o", str(output), "-w", "2"]) == 0
+    with gzip.open(output, "rb") as reader:
+        assert reader.read().decode("utf-8").split("\n") == [
+            "gue enggak mau makan",
+            "memang yang bertanya? !grinning_face!",
+            "",
+            "akhir",
+            "",
+        ]
+    assert "4 lines" in capsys.readouterr().err
+
+    shared = tmp_path / "shared.txt.gz"
+    args = ["preprocess", *steps, "-i", str(source), "-o", str(shared), "-w", "2", "-q"]
+    assert main([*args, "--shared-memory"]) == 0
+    with gzip.open(output, "rb") as expected, gzip.open(shared, "rb") as reader:
+        assert reader.read() == expected.read()
+
+    assert main([*args[:-1], "--adaptive"]) == 0
+    with gzip.open(output, "rb") as expected, gzip.open(shared, "rb") as reader:
+        assert reader.read() == expected.read()
+    assert "util" in capsys.readouterr().err
+
+    output = tmp_path / "clean.txt"
+    args = ["preprocess", 'words_to_emoji:delimiter=["<",">"]', "-i", str(output), "-q"]
+    output.write_text("api <api>\n", encoding="utf-8")
+    assert main([*args, "-o", str(tmp_path / "emoji.txt")]) == 0
+    assert (tmp_path / "emoji.txt").read_text(encoding="utf-8") == "api 🔥\n"
+    assert capsys.readouterr().err == ""
+
+    assert main(["preprocess", "unknown_step", "-i", str(output)]) == 2
+
+
+def test_strip_html(tmp_path, capsys):
+    source = tmp_path / "page.html.gz"
+    page = "<html>\n<p>Berita <b>hari ini</b> &amp; 😀</p>\n<a\nhref='#'>link</a></html>" * 500
+    with gzip.open(source, "wb") as writer:
+        writer.write(page.encode("utf-8"))
+
+    output = tmp_path / "page.txt"
+    args = ["strip-html", "-i", str(source), "-o", str(output), "--multiline", "--chunk-size", "7"]
+    assert main(args) == 0
+    assert output.read_text(encoding="utf-8") == "\nBerita hari ini  😀\nlink" * 500
+    assert "1500 lines" in capsys.readouterr().err
+
+    assert main(["strip-html", "-i", str(source), "--max-tag-length", "1"]) == 2
+
+
+def test_preprocess_cache(tmp_path):
+    source = tmp_path / "corpus.txt"
+    source.write_text("gw gk mw\nyg\ngw gk mw\n", encoding="utf-8")
+    cache = str(tmp_path / "cache.sqlite")
+    for _ in range(2):
+        output = tmp_path / "clean.txt"
+        args = ["preprocess", "replace_slang", "-i", str(source), "-o", str(output), "-q"]
+        assert main([*args, "--cache", cache]) == 0
+        assert output.read_text(encoding="utf-8") == "gue enggak mau\nyang\ngue enggak mau\n"
+    assert os.path.getsize(cache) > 0
+
+
+def test_close_files(tmp_path, monkeypatch):
+    opened = []
+
+    def _open(*args, **kwargs):
+        opened.append(open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(indoNLP.cli, "open", _open, raising=False)
+    source = tmp_path / "corpus.txt.gz"
+    with gzip.open(source, "wb") as writer:
+        writer.write(b"gw <b>gk</b> mw\n")
+
+    for command in ["preprocess", "strip-html"]:
+        args = [command, "-i", str(source), "-q"] + (["replace_slang"] if command[0] == "p" else [])
+        assert main([*args, "-o", str(tmp_path / "clean.txt")]) == 0
+        with pytest.raises(OSError):
+            main([*args, "-o", str(tmp_path / "missing" / "clean.txt")])
+    assert len(opened) == 6 and all(x.closed for x in opened)
+
+
+def test_preprocess_stdin():
+    result = subprocess.run(
+        [sys.executable, "-m", "indoNLP", "preprocess", "replace_slang", "-q"],
+        input="gw gk mw\nyg\n".encode("utf-8"),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    assert result.stdout.decode("utf-8") == "gue enggak mau\nyang\n"
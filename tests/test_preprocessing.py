@@ -1,4 +1,16 @@
+import functools
+import pickle
+import random
+import re
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+
 from indoNLP.preprocessing import *
+from indoNLP.preprocessing.trie import fold
 
 
 def test_remove_html():
@@ -24,6 +36,20 @@ def test_remove_stopwords():
         remove_stopwords("widi ngapain sih wkwk lagian kgk jelas wkwkwkkwk")
         == "widi ngapain sih   kgk"
     )
+    assert remove_stopwords("Sama-sama, WKWKWK makan") == ",  makan"
+    assert remove_stopwords("") == ""
+
+
+def test_remove_stopwords_regex_equivalence():
+    stopwords = sorted(STOPWORDS, key=len, reverse=True)  # prefer the longest match
+    pattern = re.compile(rf"(?i)\b({'|'.join(stopwords)})\b")
+    words = sorted(STOPWORDS) + ["wkwk", "kwkw", "makan", "sama"]
+    rng = random.Random(0)
+    for _ in range(500):
+        tokens = [rng.choice(words) for _ in range(rng.randint(0, 10))]
+        tokens = [x.upper() if rng.random() < 0.2 else x for x in tokens]
+        text = "".join(x + rng.choice([" ", "  ", "-", ".", "!", ""]) for x in tokens)
+        assert remove_stopwords(text) == pattern.sub("", text).strip()
 
 
 def test_replace_slang():
@@ -32,6 +58,21 @@ def test_replace_slang():
     assert replace_slang("gw gk mw makan!!") == "gue enggak mau makan!!"
     assert replace_slang("emg siapa yg nanya?") == "memang siapa yang bertanya?"
     assert replace_slang("lg sma siapa?") == "lagi sama siapa?"
+    assert replace_slang('GW ngaku"in dong') == 'gue mengaku"ini dong'
+    assert replace_slang("gossip2.an trus") == "gosip-gosipan terus"
+
+
+def test_replace_slang_regex_equivalence():
+    literal = {re.sub(r"\\(.)", r"\1", k): v for k, v in SLANG_DATA.items()}
+    pattern = re.compile(SLANG_PATTERN)
+    keys = list(literal.keys())
+    rng = random.Random(0)
+    for _ in range(500):
+        words = [rng.choice(keys + ["makan", "siapa", "yaaa"]) for _ in range(rng.randint(0, 10))]
+        words = [x.upper() if rng.random() < 0.2 else x for x in words]
+        text = "".join(x + rng.choice([" ", "  ", "-", '"', ".", "!", ""]) for x in words)
+        expected = pattern.sub(lambda mo: literal[fold(mo.group(0))], text)
+        assert replace_slang(text) == expected
 
 
 def test_replace_word_elongation():
@@ -76,11 +117,29 @@ def test_duplicate_emoji():
 
 def test_emoji_to_words():
     assert emoji_to_words("emoji 😀") == "emoji !wajah_gembira!"
-    assert emoji_to_words("emoji 😀😁") == "emoji !wajah_gembira!!wajah_gembira_dengan_mata_bahagia!"
+    assert (
+        emoji_to_words("emoji 😀😁") == "emoji !wajah_gembira!!wajah_gembira_dengan_mata_bahagia!"
+    )
     assert emoji_to_words("emoji 😀", use_alias=True) == "emoji !wajah_gembira_bahagia_muka_senang!"
     assert emoji_to_words("emoji 😀", lang="en") == "emoji !grinning_face!"
     assert emoji_to_words("emoji 😀", delimiter=("<", "!")) == "emoji <wajah_gembira!"
     assert emoji_to_words("emoji ⛹🏼‍♂️") == "emoji !pria_memantulkan_bola_warna_kulit_cerah-sedang!"
+    assert emoji_to_words("👍🏻👍", lang="en") == "!thumbs_up_light_skin_tone!!thumbs_up!"
+    assert emoji_to_words("#️⃣ 1", use_alias=True) == "!keycap_#! 1"
+
+
+def test_emoji_to_words_regex_equivalence():
+    pattern = re.compile(EMOJI_PATTERN)
+    emojis = list(EMOJI_DATA.keys())
+    codepoints = sorted(set("".join(emojis)))  # ZWJ, skin tone modifiers, variation selectors
+    rng = random.Random(0)
+    for _ in range(500):
+        text = "".join(
+            rng.choice([rng.choice(emojis), rng.choice(codepoints), "a", " "])
+            for _ in range(rng.randint(0, 10))
+        )
+        expected = pattern.sub(lambda mo: "!" + EMOJI_DATA[mo.group(0)]["en"] + "!", text)
+        assert emoji_to_words(text, lang="en") == expected
 
 
 def test_words_to_emoji():
@@ -93,3 +152,129 @@ def test_words_to_emoji():
         words_to_emoji("sedang on!api! banget nih kayaknya!lengan_berotot!!lengan_berotot!")
         == "sedang on🔥 banget nih kayaknya💪💪"
     )
+    assert words_to_emoji("emoji ^wajah_gembira$", delimiter=("^", "$")) == "emoji 😀"
+    assert words_to_emoji("|api||api| |bukan_emoji|", delimiter=("|", "|")) == "🔥🔥 |bukan_emoji|"
+    assert words_to_emoji("!bukan!api!") == "!bukan🔥"
+
+
+def test_words_to_emoji_regex_equivalence():
+    names = WORDS_EMOJI_DATA["en"]
+    pattern = re.compile(r"\^(" + "|".join(re.escape(x) for x in names) + r")\$")
+    keys = list(names.keys())
+    rng = random.Random(0)
+    for _ in range(200):
+        text = "".join(
+            rng.choice(["^" + rng.choice(keys) + "$", "^", "$", rng.choice(keys), " "])
+            for _ in range(rng.randint(0, 8))
+        )
+        expected = pattern.sub(lambda mo: names[mo.group(1)], text)
+        assert words_to_emoji(text, lang="en", delimiter=("^", "$")) == expected
+
+
+def test_lazy_loading():
+    code = (
+        "import sys, indoNLP.preprocessing as p; p.remove_url('google.com');"
+        "print(any(x.endswith('_data') for x in sys.modules))"
+    )
+    assert subprocess.check_output([sys.executable, "-c", code]).strip() == b"False"
+
+    import indoNLP.preprocessing as preprocessing
+
+    assert "SLANG_DATA" in dir(preprocessing)
+    assert preprocessing.SLANG_DATA is SLANG_DATA
+    with pytest.raises(AttributeError):
+        preprocessing.UNKNOWN_DATA
+
+
+def test_pipeline_fuse():
+    steps = [
+        remove_html,
+        remove_url,
+        remove_stopwords,
+        replace_slang,
+        replace_word_elongation,
+        emoji_to_words,
+        str.upper,
+    ]
+    words = ["yg", "gw", "sama-sama", "wkwk", "kenapaaa", "GKK", "<b>", "</b>", "google.com", "😀"]
+    words += list(SLANG_DATA.keys())[:50] + sorted(STOPWORDS)[:50]
+    rng = random.Random(0)
+    for _ in range(300):
+        pipe = [rng.choice(steps) for _ in range(rng.randint(1, 6))]
+        text = "".join(
+            rng.choice(words) + rng.choice([" ", "  ", "-", ".", "!", ""])
+            for _ in range(rng.randint(0, 12))
+        )
+        text = rng.choice(["", " ", "! "]) + text
+        assert pipeline(pipe, fuse=True)(text) == pipeline(pipe)(text)
+
+
+def test_pipeline_prefilter():
+    steps = [
+        remove_html,
+        remove_url,
+        remove_stopwords,
+        replace_slang,
+        replace_word_elongation,
+        emoji_to_words,
+        words_to_emoji,
+        functools.partial(words_to_emoji, delimiter=("<", ">")),
+        str.upper,
+    ]
+    words = ["yg", "gw", "kenapaaa", "aA", "<b>", "&amp;", "google.com", "http:x", "😀", "#"]
+    words += ["!api!", "<api>", "-", "...", "a.B", "x:", "  ", "\t", "1", "!"]
+    rng = random.Random(0)
+    for _ in range(500):
+        pipe = [rng.choice(steps) for _ in range(rng.randint(1, 6))]
+        text = "".join(
+            rng.choice(words) + rng.choice([" ", "", "."]) for _ in range(rng.randint(0, 6))
+        )
+        expected = pipeline(pipe, prefilter=False)(text)
+        assert pipeline(pipe)(text) == pipeline(pipe, fuse=True)(text) == expected
+
+    # the emoji prefilter relies on every emoji containing a non-ASCII character
+    assert not any(x.isascii() for x in EMOJI_DATA)
+    # invalid parameters still raise on texts that would be skipped
+    with pytest.raises(AssertionError):
+        pipeline([("emoji_to_words", {"lang": "fr"})])("abc")
+
+
+@dataclass
+class _Suffix:
+    suffix: str
+
+    def __call__(self, text: str) -> str:
+        return text + self.suffix
+
+
+def test_pipeline_class():
+    pipe = Pipeline(["replace_slang", ("emoji_to_words", {"lang": "en"})])
+    assert pipe("gw 😀") == "gue !grinning_face!"
+    assert pipe.describe() == ["replace_slang", ("emoji_to_words", {"lang": "en"})]
+    assert Pipeline(pipe.describe()) == pipe
+    assert Pipeline([replace_slang, functools.partial(emoji_to_words, lang="en")]) == pipe
+    assert Pipeline([("words_to_emoji", {"delimiter": ["^", "$"]})])("^api$") == "🔥"
+    assert hash(Pipeline(pipe.describe())) == hash(pipe)
+    assert len({pipe, Pipeline(pipe.describe())}) == 1
+    assert len({pipe, Pipeline(pipe.describe(), fuse=True), Pipeline(["replace_slang"])}) == 3
+    # dataclasses are unhashable, the fingerprint is hashed instead
+    assert hash(Pipeline([_Suffix("!")])) == hash(Pipeline([_Suffix("!")]))
+    assert Pipeline([_Suffix("!")]) != Pipeline([_Suffix("?")])
+
+    with pytest.raises(ValueError):
+        Pipeline(["unknown_step"])
+    with pytest.raises(TypeError):
+        Pipeline([("emoji_to_words", {"unknown": True})])
+    with pytest.raises(TypeError):
+        Pipeline([1])
+
+
+def test_pipeline_pickle():
+    pipe = pipeline([remove_html, replace_slang, str.upper, ("emoji_to_words", {"lang": "en"})])
+    restored = pickle.loads(pickle.dumps(pipe))
+    assert restored == pipe
+    assert restored("<b>gw</b> 😀") == pipe("<b>gw</b> 😀") == "GUE !grinning_face!"
+
+    fused = pipeline([replace_word_elongation, replace_slang], fuse=True)
+    with ProcessPoolExecutor(2) as executor:
+        assert list(executor.map(fused, ["gw", "kenapaaa"])) == ["gue", "kenapa"]
@@ -0,0 +1,25 @@
+import argparse
+import logging
+import os
+
+from indoNLP.preprocessing.snapshot import SNAPSHOT_PATH, load_snapshot, write_snapshot
+
+# Setup logging
+logging.basicConfig(
+    format="[%(levelname)s] %(asctime)s %(filename)s -- %(message)s",
+    level=logging.INFO,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build indoNLP lexicon binary snapshot")
+    parser.add_argument("-o", "--output", default=SNAPSHOT_PATH, help="snapshot output path")
+    args = parser.parse_args()
+
+    write_snapshot(args.output)
+    assert load_snapshot(args.output) is not None, "snapshot can't be loaded"
+    logging.info(f"snapshot saved to {args.output} [{os.path.getsize(args.output)} bytes]")
+
+
+if __name__ == "__main__":
+    main()